@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,7 +15,7 @@ DISCORD_CHANNEL_ID: Optional[str] = os.getenv('DISCORD_CHANNEL_ID')
 GOOGLE_SHEETS_ID: Optional[str] = os.getenv('GOOGLE_SHEETS_ID')
 GOOGLE_SERVICE_ACCOUNT_FILE: Optional[str] = os.getenv('GOOGLE_SERVICE_ACCOUNT_FILE', 'credentials.json')
 GOOGLE_SHEET_NAME: str = os.getenv('GOOGLE_SHEET_NAME', 'Sheet1')
-SHEETS_BATCH_SIZE: int = int(os.getenv('SHEETS_BATCH_SIZE', '100'))
+SHEETS_BATCH_SIZE: int = int(os.getenv('SHEETS_BATCH_SIZE', '100'))  # AI analysis rows written per batch
 
 # Schedule Configuration
 SCHEDULE_TIME: str = os.getenv('SCHEDULE_TIME', '20:00')
@@ -27,6 +27,14 @@ DISCORD_LOOKBACK_HOURS: int = int(os.getenv('DISCORD_LOOKBACK_HOURS', '24'))
 DISCORD_LOOKBACK_DAYS: int = int(os.getenv('DISCORD_LOOKBACK_DAYS', '1'))
 DISCORD_FETCH_LIMIT: int = int(os.getenv('DISCORD_FETCH_LIMIT', '200'))
 DISCORD_SKIP_DUPLICATES: str = os.getenv('DISCORD_SKIP_DUPLICATES', 'true')
+DISCORD_PERSISTENT_CONNECTION: str = os.getenv('DISCORD_PERSISTENT_CONNECTION', 'false')  # Keep the gateway connection open between runs
+DUPLICATE_WINDOW_ROWS: int = int(os.getenv('DUPLICATE_WINDOW_ROWS', '0'))  # Only check the last N sheet rows for duplicates (0 = all)
+DUP_CACHE_TTL_SEC: int = int(os.getenv('DUP_CACHE_TTL_SEC', '0'))  # Reload cached post links after N seconds (0 = never)
+SEEN_LINKS_DB: str = os.getenv('SEEN_LINKS_DB', '')  # SQLite file recording uploaded post links ('' = disabled)
+WRITE_CSV_AUDIT: str = os.getenv('WRITE_CSV_AUDIT', 'false')  # Keep a CSV copy of each collection in data/
+
+# Pipeline Configuration
+PARALLEL_PHASES: str = os.getenv('PARALLEL_PHASES', 'false')  # Prepare archiving while publishing
 
 # Logging Configuration
 LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
@@ -64,7 +72,7 @@ def validate_config() -> bool:
 
 def validate_x_api_config() -> bool:
     """Validate X API configuration if using Twitter publisher."""
-    if PUBLISHER_TYPE.lower() != 'twitter':
+    if 'twitter' not in PUBLISHER_TYPES:
         return True  # Not using Twitter, no validation needed
     
     required_x_vars = {
@@ -88,7 +96,7 @@ def validate_x_api_config() -> bool:
 
 def validate_typefully_config() -> bool:
     """Validate Typefully API configuration if using Typefully publisher."""
-    if PUBLISHER_TYPE.lower() != 'typefully':
+    if 'typefully' not in PUBLISHER_TYPES:
         return True  # Not using Typefully, no validation needed
     
     if not TYPEFULLY_API_KEY or TYPEFULLY_API_KEY.startswith('your_'):
@@ -141,7 +149,9 @@ X_ACCESS_TOKEN: Optional[str] = os.getenv('X_ACCESS_TOKEN')
 X_ACCESS_TOKEN_SECRET: Optional[str] = os.getenv('X_ACCESS_TOKEN_SECRET')
 
 # Publishing Configuration
-PUBLISHER_TYPE: str = os.getenv('PUBLISHER_TYPE', 'twitter')  # 'twitter' or 'typefully'
+PUBLISHER_TYPE: str = os.getenv('PUBLISHER_TYPE', 'twitter')  # 'twitter', 'typefully', or both comma-separated
+PUBLISHER_TYPES: List[str] = [t.strip().lower() for t in PUBLISHER_TYPE.split(',') if t.strip()]
+PUBLISH_RATE_LIMIT_REDIS_URL: str = os.getenv('PUBLISH_RATE_LIMIT_REDIS_URL', '')  # Share publishing rate limits via Redis ('' = in memory)
 
 # Typefully Configuration (alternative to X API)
 TYPEFULLY_API_KEY: Optional[str] = os.getenv('TYPEFULLY_API_KEY')
@@ -39,20 +39,21 @@ def validate_configuration() -> bool:
     else:
         logger.info("○ Gemini AI analysis disabled (no API key)")
     
-    # Check publisher configuration
-    publisher_type = config.PUBLISHER_TYPE.lower() if config.PUBLISHER_TYPE else ''
-    
-    if publisher_type == 'twitter' or publisher_type == 'x':
-        if config.validate_x_api_config():
-            logger.info("✓ X/Twitter publishing enabled")
-        else:
-            logger.info("○ X/Twitter publishing disabled (missing credentials)")
-    elif publisher_type == 'typefully':
-        if config.validate_typefully_config():
-            logger.info("✓ Typefully publishing enabled")
+    # Check publisher configuration (several publishers can be comma-separated)
+    for publisher_type in config.PUBLISHER_TYPES:
+        if publisher_type == 'twitter' or publisher_type == 'x':
+            if config.validate_x_api_config():
+                logger.info("✓ X/Twitter publishing enabled")
+            else:
+                logger.info("○ X/Twitter publishing disabled (missing credentials)")
+        elif publisher_type == 'typefully':
+            if config.validate_typefully_config():
+                logger.info("✓ Typefully publishing enabled")
+            else:
+                logger.info("○ Typefully publishing disabled (missing credentials)")
         else:
-            logger.info("○ Typefully publishing disabled (missing credentials)")
-    else:
+            logger.info(f"○ Unknown publisher type: {publisher_type}")
+    if not config.PUBLISHER_TYPES:
         logger.info("○ Publishing disabled (no publisher configured)")
     
     return True
@@ -86,6 +87,12 @@ def build_config_dict() -> dict:
         'DISCORD_LOOKBACK_DAYS': getattr(config, 'DISCORD_LOOKBACK_DAYS', 1),
         'DISCORD_FETCH_LIMIT': getattr(config, 'DISCORD_FETCH_LIMIT', 200),
         'DISCORD_SKIP_DUPLICATES': getattr(config, 'DISCORD_SKIP_DUPLICATES', 'true'),
+        'DISCORD_PERSISTENT_CONNECTION': getattr(config, 'DISCORD_PERSISTENT_CONNECTION', 'false'),
+        'DUPLICATE_WINDOW_ROWS': getattr(config, 'DUPLICATE_WINDOW_ROWS', 0),
+        'DUP_CACHE_TTL_SEC': getattr(config, 'DUP_CACHE_TTL_SEC', 0),
+        'SEEN_LINKS_DB': getattr(config, 'SEEN_LINKS_DB', ''),
+        'WRITE_CSV_AUDIT': getattr(config, 'WRITE_CSV_AUDIT', 'false'),
+        'PARALLEL_PHASES': getattr(config, 'PARALLEL_PHASES', 'false'),
         
         # Gemini AI
         'GEMINI_API_KEY': config.GEMINI_API_KEY,
@@ -95,6 +102,7 @@ def build_config_dict() -> dict:
         
         # Publishing
         'PUBLISHER_TYPE': config.PUBLISHER_TYPE,
+        'PUBLISH_RATE_LIMIT_REDIS_URL': getattr(config, 'PUBLISH_RATE_LIMIT_REDIS_URL', ''),
         'X_API_KEY': config.X_API_KEY,
         'X_API_SECRET': config.X_API_SECRET,
         'X_ACCESS_TOKEN': config.X_ACCESS_TOKEN,
@@ -26,6 +26,7 @@ class ArchiveHandler:
         self.sheets = sheets_handler
         self.archive_sheet_name = "Archives"
         self.source_sheet_name = "Sheet1"
+        self._archive_sheet_ready = False
     
     def ensure_archive_sheet_exists(self) -> bool:
         """
@@ -34,6 +35,10 @@ class ArchiveHandler:
         Returns:
             True if sheet exists or was created successfully
         """
+        # Already checked by this handler (e.g. prepared ahead of the archive run)
+        if self._archive_sheet_ready:
+            return True
+        
         try:
             # Get all sheet names
             spreadsheet = self.sheets.service.spreadsheets().get(
@@ -101,6 +106,7 @@ class ArchiveHandler:
                 ).execute()
                 logger.info(f"Added headers to Archives sheet")
             
+            self._archive_sheet_ready = True
             return True
             
         except Exception as e:
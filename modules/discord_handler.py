@@ -3,16 +3,51 @@
 import re
 import asyncio
 import logging
+import random
 import time
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import discord
 from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+# Share-tracking query parameters that don't change which post a link points to
+TRACKING_PARAMS = frozenset({'s', 't', 'ref_src', 'ref_url'})
+
+
+def canonicalize_link(url: str) -> str:
+    """Normalize a Twitter/X link so variants of the same post compare equal.
+    
+    Lowercases the host, maps twitter.com/www/mobile hosts to x.com, drops
+    tracking query parameters and fragments, and strips trailing slashes.
+    
+    Args:
+        url: Post link as posted in Discord or stored in the sheet
+        
+    Returns:
+        Canonical form of the link ('' for an empty link)
+    """
+    if not url:
+        return ''
+    
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in ('www.', 'mobile.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if host == 'twitter.com':
+        host = 'x.com'
+    
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith('utm_')
+    ])
+    return urlunsplit(('https', host, parts.path.rstrip('/'), query, ''))
+
 
 @dataclass
 class TwitterPost:
@@ -23,6 +58,10 @@ class TwitterPost:
     post_link: str
     author: str
     author_link: str
+    canonical_link: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.canonical_link = canonicalize_link(self.post_link)
 
 
 class DiscordHandler:
@@ -45,6 +84,33 @@ class DiscordHandler:
         self.bot = None
         self._ready = False
         self._bot_task = None
+        self._rate_limit_reset_at = 0.0
+        
+    @property
+    def rate_limit_reset_after(self) -> float:
+        """Seconds until the last reported Discord rate limit resets (0 if none)."""
+        return max(0.0, self._rate_limit_reset_at - time.monotonic())
+        
+    def _record_rate_limit(self, error: discord.HTTPException) -> Optional[float]:
+        """Remember when a 429 response says the rate limit resets.
+        
+        Args:
+            error: HTTP error raised by discord.py
+            
+        Returns:
+            Seconds to wait, or None if the error is not a rate limit
+        """
+        if getattr(error, 'status', None) != 429:
+            return None
+        
+        headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+        try:
+            retry_after = float(headers.get('Retry-After') or headers.get('X-RateLimit-Reset-After') or 1)
+        except (TypeError, ValueError):
+            retry_after = 1.0
+        
+        self._rate_limit_reset_at = time.monotonic() + retry_after
+        return retry_after
         
     async def initialize_bot(self) -> None:
         """Initialize and start the Discord bot."""
@@ -58,10 +124,26 @@ class DiscordHandler:
         async def on_ready():
             self._ready = True
             logger.info(f"Discord bot connected as {self.bot.user}")
+        
+        @self.bot.event
+        async def on_resumed():
+            self._ready = True
+            logger.info("Discord session resumed")
+        
+        @self.bot.event
+        async def on_disconnect():
+            # Stays False until discord.py resumes the session or reconnects
+            self._ready = False
+            logger.warning("Discord gateway disconnected")
             
     async def connect(self) -> None:
         """Connect to Discord and wait for bot to be ready."""
         logger.debug("Starting Discord connection...")
+        if self.bot and not self._ready:
+            # A client whose session dropped can't be started again; replace it
+            logger.debug("Closing stale Discord client...")
+            await self.disconnect()
+        
         if not self.bot:
             logger.debug("Initializing bot...")
             await self.initialize_bot()
@@ -84,11 +166,21 @@ class DiscordHandler:
         
         logger.debug("Discord connection successful")
             
+    def is_connected(self) -> bool:
+        """Check whether the bot is connected and ready.
+        
+        Returns:
+            True if the bot is ready and has not been closed
+        """
+        return self._ready and self.bot is not None and not self.bot.is_closed()
+    
     async def disconnect(self) -> None:
         """Disconnect from Discord."""
         if self.bot:
             await self.bot.close()
             self._ready = False
+            # A closed client cannot be restarted, so the next connect() builds a new one
+            self.bot = None
             
     async def fetch_channel_messages(
         self, 
@@ -273,12 +365,18 @@ class DiscordHandler:
                     logger.error(f"Max retries exceeded. Final error: {e}")
                     raise
                     
+                # Wait out a reported rate limit, otherwise back off with jitter
+                # so concurrent clients don't retry in lockstep
+                retry_after = self._record_rate_limit(e)
+                delay = retry_after if retry_after is not None else backoff_seconds
+                delay *= random.uniform(1.0, 1.5) if retry_after is not None else random.uniform(0.5, 1.5)
+                
                 logger.warning(
                     f"Discord API error (attempt {retry_count}/{max_retries}): {e}. "
-                    f"Retrying in {backoff_seconds} seconds..."
+                    f"Retrying in {delay:.1f} seconds..."
                 )
                 
-                await asyncio.sleep(backoff_seconds)
+                await asyncio.sleep(delay)
                 backoff_seconds *= 2  # Exponential backoff
                 
             except Exception as e:
@@ -5,17 +5,91 @@ Analyzes Google Sheets content to identify new crypto/Web3 projects
 and generates structured daily summaries using Google's Gemini AI.
 """
 
+import json
+import re
 import time
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Dict, Tuple
 import google.generativeai as genai
 
-from modules.sheets_handler import GoogleSheetsHandler
+from modules.sheets_handler import GoogleSheetsHandler, column_letter
 
 logger = logging.getLogger(__name__)
 
+# Pre-pass patterns used to shrink post text before it is sent to Gemini
+_TCO_LINK_RE = re.compile(r'https?://t\.co/\S+')
+_TRACKING_QUERY_RE = re.compile(r'(https?://(?:www\.)?(?:x|twitter)\.com/[^\s?]+)\?\S*')
+_REPEATED_MENTION_RE = re.compile(r'(@\w+)(?:\s+\1\b)+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Static task instructions, sent once per model as the system instruction so
+# per-call prompts only carry the post payload
+PROJECT_DETECTION_INSTRUCTION = """Analyze posts containing a Twitter/X link. Determine if the post is announcing or discussing a NEW crypto/Web3 project.
+
+Respond with only "YES" or "NO".
+
+Criteria for YES:
+- Mentions new token launch, IDO, or TGE
+- Mentions new project 
+- Announces new protocol or dApp
+- Introduces new NFT collection
+- New DeFi platform or tool
+- New blockchain or L2
+- Mentions Bio or Description 
+
+Criteria for NO:
+- General market discussion
+- Price talk about existing tokens
+- News about established projects
+- Personal opinions without new project info"""
+
+PROJECT_INFO_INSTRUCTION = """Extract Twitter/X project information from Discord posts that contain an embedded Twitter/X post.
+
+Look for:
+1. The Twitter/X username of the PROJECT being discussed (starts with @)
+2. The Twitter/X link to the project's post or profile
+3. The project's description or bio from the embedded content
+
+Return a JSON object with these fields:
+username: the project's username (e.g. @username)
+link: https://twitter.com/username or https://x.com/username
+description: Brief project description
+
+If any information is not found, use "unknown" for username, "no link" for link, and "No description provided" for description."""
+
+# Server-side enforced output schema for project info extraction
+PROJECT_INFO_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'username': {'type': 'STRING'},
+        'link': {'type': 'STRING'},
+        'description': {'type': 'STRING'},
+    },
+    'required': ['username', 'link', 'description'],
+}
+
+SUMMARY_INSTRUCTION = """Create a 1-2 sentence summary of the crypto project described by the given post and bio.
+
+Focus on:
+- What the project does
+- Key innovation or utility
+- Target market or use case
+
+Keep under 20 words. Be specific and informative. If you cannot provide a summary, respond with "No info yet"."""
+
+KEYWORDS_INSTRUCTION = """Extract 3-5 keywords that best describe the crypto project described by the given post and bio.
+
+Requirements:
+- Generate EXACTLY 3-5 keywords
+- Focus on: project type, sector, technology, use case, and key features
+- Be specific and relevant to crypto/Web3 space
+- Return ONLY the keywords separated by commas
+- No explanations, just keywords
+
+Example format: DeFi, yield farming, automated, cross-chain, liquidity"""
+
 
 @dataclass
 class ProjectInfo:
@@ -95,7 +169,8 @@ class RateLimitManager:
 class GeminiAnalyzer:
     """Handles Gemini AI operations for content analysis"""
     
-    def __init__(self, api_key: str, model: str = 'gemini-1.5-flash', daily_limit: int = 1400, generation_mode: str = 'summary'):
+    def __init__(self, api_key: str, model: str = 'gemini-1.5-flash', daily_limit: int = 1400, generation_mode: str = 'summary',
+                 request_bucket=None):
         """
         Initialize Gemini analyzer
         
@@ -104,24 +179,48 @@ class GeminiAnalyzer:
             model: Gemini model to use (default: gemini-1.5-flash for free tier)
             daily_limit: Daily request limit for rate limiting
             generation_mode: Generation mode ('summary' or 'keywords', default: 'summary')
+            request_bucket: Optional token bucket (anything with consume()) that
+                each API request takes a token from
         """
         genai.configure(api_key=api_key)
+        self.model_name = model
         self.model = genai.GenerativeModel(model)
+        self._instructed_models: Dict[str, genai.GenerativeModel] = {}
         self.rate_limiter = RateLimitManager(daily_limit)
+        self.request_bucket = request_bucket
         self.generation_mode = generation_mode
         logger.info(f"Initialized GeminiAnalyzer with model: {model}, mode: {generation_mode}")
     
-    def _make_request(self, prompt: str, temperature: float = 0.3) -> str:
-        """Make a rate-limited request to Gemini API"""
+    def _get_model(self, system_instruction: Optional[str] = None) -> genai.GenerativeModel:
+        """Get the model for a system instruction, creating it on first use"""
+        if not system_instruction:
+            return self.model
+        
+        model = self._instructed_models.get(system_instruction)
+        if model is None:
+            model = genai.GenerativeModel(self.model_name, system_instruction=system_instruction)
+            self._instructed_models[system_instruction] = model
+        return model
+    
+    def _make_request(self, prompt: str, temperature: float = 0.3, system_instruction: Optional[str] = None,
+                      response_schema: Optional[Dict] = None) -> str:
+        """Make a rate-limited request to Gemini API (JSON output when a response schema is given)"""
         self.rate_limiter.wait_if_needed()
+        if self.request_bucket is not None:
+            self.request_bucket.consume()
+        
+        generation_config = {
+            "temperature": temperature,
+            "max_output_tokens": 512,
+        }
+        if response_schema:
+            generation_config["response_mime_type"] = "application/json"
+            generation_config["response_schema"] = response_schema
         
         try:
-            response = self.model.generate_content(
+            response = self._get_model(system_instruction).generate_content(
                 prompt,
-                generation_config={
-                    "temperature": temperature,
-                    "max_output_tokens": 512,
-                }
+                generation_config=generation_config
             )
             self.rate_limiter.record_request()
             return response.text
@@ -137,6 +236,25 @@ class GeminiAnalyzer:
                 logger.error(f"Gemini API error: {e}")
                 raise
     
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Strip token-wasting noise from post text before prompting
+        
+        Removes t.co short links and tracking query strings on X/Twitter links,
+        collapses repeated @mentions and squeezes whitespace.
+        
+        Args:
+            text: Raw post content
+            
+        Returns:
+            Normalized post content
+        """
+        text = _TCO_LINK_RE.sub('', text)
+        text = _TRACKING_QUERY_RE.sub(r'\1', text)
+        text = _REPEATED_MENTION_RE.sub(r'\1', text)
+        return _WHITESPACE_RE.sub(' ', text).strip()
+    
     def is_new_project(self, content: str) -> bool:
         """
         Determine if post is about a new crypto/Web3 project
@@ -153,31 +271,12 @@ class GeminiAnalyzer:
         # Truncate very long content to save tokens
         content = content[:1000] if len(content) > 1000 else content
         
-        prompt = f"""Analyze this post containing a Twitter/X link. Determine if this is announcing or discussing a NEW crypto/Web3 project. 
-
-Post content: {content}
-
-Respond with only "YES" or "NO".
-
-Criteria for YES:
-- Mentions new token launch, IDO, or TGE
-- Mentions new project 
-- Announces new protocol or dApp
-- Introduces new NFT collection
-- New DeFi platform or tool
-- New blockchain or L2
-- Mentions Bio or Description 
-
-Criteria for NO:
-- General market discussion
-- Price talk about existing tokens
-- News about established projects
-- Personal opinions without new project info"""
+        prompt = f"Post content: {content}"
 
         logger.debug(f"Project detection prompt: {prompt}")
         
         try:
-            response = self._make_request(prompt, temperature=0.1)
+            response = self._make_request(prompt, temperature=0.1, system_instruction=PROJECT_DETECTION_INSTRUCTION)
             result = response.strip().upper() == "YES"
             logger.debug(f"Project detection for content '{content[:50]}...': {result}")
             return result
@@ -198,39 +297,24 @@ Criteria for NO:
         # Truncate content for token efficiency
         content = content[:1500] if len(content) > 1500 else content
         
-        prompt = f"""Extract Twitter/X project information from this Discord post that contains an embedded Twitter/X post.
-
-Post content: {content}
-
-Look for:
-1. The Twitter/X username of the PROJECT being discussed (starts with @)
-2. The Twitter/X link to the project's post or profile
-3. The project's description or bio from the embedded content
-
-Return in this exact format:
-USERNAME: @username
-LINK: https://twitter.com/username or https://x.com/username
-DESCRIPTION: Brief project description
-
-If any information is not found, use "unknown" for username, "no link" for link, and "No description provided" for description."""
+        prompt = f"Post content: {content}"
         
         try:
-            response = self._make_request(prompt, temperature=0.2)
-            
-            # Parse the response
-            username = "unknown"
-            twitter_link = ""
-            bio = "No description provided"
-            
-            for line in response.split('\n'):
-                line = line.strip()
-                if line.startswith('USERNAME:'):
-                    username = line.replace('USERNAME:', '').strip()
-                    username = username.replace('@', '')  # Remove @ if present
-                elif line.startswith('LINK:'):
-                    twitter_link = line.replace('LINK:', '').strip()
-                elif line.startswith('DESCRIPTION:'):
-                    bio = line.replace('DESCRIPTION:', '').strip()
+            response = self._make_request(prompt, temperature=0.2, system_instruction=PROJECT_INFO_INSTRUCTION,
+                                          response_schema=PROJECT_INFO_SCHEMA)
+            
+            # Parse the JSON response
+            try:
+                data = json.loads(response)
+            except ValueError:
+                logger.warning(f"Project info response is not valid JSON: {response[:100]}")
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+            
+            username = (data.get('username') or "unknown").strip().replace('@', '')  # Remove @ if present
+            twitter_link = (data.get('link') or "").strip()
+            bio = (data.get('description') or "").strip()
             
             # If no link was extracted, try to construct from username
             if (not twitter_link or twitter_link == "no link") and username != "unknown":
@@ -260,20 +344,11 @@ If any information is not found, use "unknown" for username, "no link" for link,
         content = content[:500] if len(content) > 500 else content
         bio = bio[:300] if len(bio) > 300 else bio
         
-        prompt = f"""Create a 1-2 sentence summary of this crypto project.
-
-Post: {content}
-Bio/Description: {bio}
-
-Focus on:
-- What the project does
-- Key innovation or utility
-- Target market or use case
-
-Keep under 20 words. Be specific and informative. If you cannot provide a summary, respond with "No info yet"."""
+        prompt = f"""Post: {content}
+Bio/Description: {bio}"""
         
         try:
-            summary = self._make_request(prompt, temperature=0.3)
+            summary = self._make_request(prompt, temperature=0.3, system_instruction=SUMMARY_INSTRUCTION)
             summary = summary.strip()
             # Ensure summary is not too long
             words = summary.split()
@@ -299,22 +374,11 @@ Keep under 20 words. Be specific and informative. If you cannot provide a summar
         content = content[:500] if len(content) > 500 else content
         bio = bio[:300] if len(bio) > 300 else bio
         
-        prompt = f"""Extract 3-5 keywords that best describe this crypto project.
-
-Post: {content}
-Bio/Description: {bio}
-
-Requirements:
-- Generate EXACTLY 3-5 keywords
-- Focus on: project type, sector, technology, use case, and key features
-- Be specific and relevant to crypto/Web3 space
-- Return ONLY the keywords separated by commas
-- No explanations, just keywords
-
-Example format: DeFi, yield farming, automated, cross-chain, liquidity"""
+        prompt = f"""Post: {content}
+Bio/Description: {bio}"""
         
         try:
-            keywords = self._make_request(prompt, temperature=0.2)
+            keywords = self._make_request(prompt, temperature=0.2, system_instruction=KEYWORDS_INSTRUCTION)
             keywords = keywords.strip()
             # Clean up and validate keywords
             keyword_list = [k.strip() for k in keywords.split(',')]
@@ -339,7 +403,7 @@ Example format: DeFi, yield farming, automated, cross-chain, liquidity"""
         Returns:
             Tuple of (ProjectSummary if new project, AI analysis string)
         """
-        content = post_data.get('content', '')
+        content = self._normalize(post_data.get('content', ''))
         date = post_data.get('date', '')
         
         if not content:
@@ -417,14 +481,12 @@ Example format: DeFi, yield farming, automated, cross-chain, liquidity"""
             return "No new projects found today."
         
         # Group by date
-        grouped = {}
+        grouped: Dict[str, List[ProjectSummary]] = {}
         for summary in summaries:
-            date = summary.date
-            if date not in grouped:
-                grouped[date] = []
-            grouped[date].append(summary)
+            grouped.setdefault(summary.date, []).append(summary)
         
         # Format output
+        use_keywords = self.generation_mode == 'keywords'
         draft_lines = []
         for date, projects in sorted(grouped.items()):
             draft_lines.append(f"🚀 New/Trending Projects on {date}:")
@@ -435,7 +497,7 @@ Example format: DeFi, yield farming, automated, cross-chain, liquidity"""
                 #link = project.project_info.twitter_link
                 
                 # Use keywords if available and in keywords mode, otherwise use summary
-                if self.generation_mode == 'keywords' and project.keywords:
+                if use_keywords and project.keywords:
                     content = f"[{project.keywords}]"
                 else:
                     content = project.ai_summary
@@ -463,6 +525,9 @@ class SheetAnalyzer:
         """
         self.sheets = sheets_handler
         self.gemini = gemini_analyzer
+        self.sheet_name = 'Sheet1'
+        self._col_letters: Dict[int, str] = {}
+        self._col_cache: Dict[tuple, Tuple[int, int, int, int]] = {}
         self.generation_mode = gemini_analyzer.generation_mode
         logger.info(f"Initialized SheetAnalyzer with generation mode: {self.generation_mode}")
     
@@ -475,10 +540,13 @@ class SheetAnalyzer:
         """
         try:
             # Get current headers
-            sheet_data = self.sheets.get_sheet_data()
-            result = {'values': sheet_data[:1] if sheet_data else [[]]}
+            headers = self.sheets.get_row(1)
             
-            headers = result.get('values', [[]])[0] if result.get('values') else []
+            # Reuse the resolved columns until the header row changes
+            fingerprint = tuple(headers)
+            columns = self._col_cache.get(fingerprint)
+            if columns is not None:
+                return columns
             
             ai_summary_col = -1
             ai_keywords_col = -1
@@ -547,24 +615,22 @@ class SheetAnalyzer:
                 daily_draft_col = new_col_index
                 needs_update = True
             
-            # Update headers if needed
+            # Update headers if needed (only the header row is rewritten)
             if needs_update:
-                # Use append_data to add headers
-                # First, get all current data
-                all_rows = self.sheets.get_sheet_data()
-                
-                # Update the header row
-                if all_rows:
-                    all_rows[0] = headers
-                else:
-                    all_rows = [headers]
-                
-                # Clear and rewrite the sheet
-                self.sheets.clear_sheet(preserve_headers=False)
-                self.sheets.append_data(all_rows)
+                self.sheets.update_row(1, headers)
                 logger.info("Added missing columns to sheet")
             
-            return ai_summary_col, ai_processed_col, daily_draft_col, ai_keywords_col
+            # Precompute A1 column letters so write paths don't convert per row
+            self._col_letters = {
+                col: column_letter(col)
+                for col in (ai_summary_col, ai_processed_col, daily_draft_col, ai_keywords_col)
+                if col >= 0
+            }
+            
+            # Headers changed (or first lookup): drop stale entries
+            columns = (ai_summary_col, ai_processed_col, daily_draft_col, ai_keywords_col)
+            self._col_cache = {tuple(headers): columns}
+            return columns
             
         except Exception as e:
             logger.error(f"Error ensuring columns exist: {e}")
@@ -580,13 +646,33 @@ class SheetAnalyzer:
         summaries = []
         all_processed_rows = []
         
+        for processed_batch, project_batch in self.iter_analysis_batches():
+            all_processed_rows.extend(processed_batch)
+            summaries.extend(project_batch)
+        
+        return summaries, all_processed_rows
+    
+    def iter_analysis_batches(self, batch_size: int = 100) -> Iterator[Tuple[List[Tuple[int, str]], List[ProjectSummary]]]:
+        """
+        Process all rows individually, yielding results in batches so they can be written as they complete
+        
+        Args:
+            batch_size: Number of processed rows per yielded batch
+            
+        Yields:
+            Tuple of (processed rows with AI summaries, project summaries found in those rows)
+        """
+        summaries = []
+        all_processed_rows = []
+        projects_found = 0
+        
         try:
             # Read all data
             rows = self.sheets.get_sheet_data()
             
             if len(rows) <= 1:  # No data or only headers
                 logger.info("No data rows to analyze")
-                return summaries, all_processed_rows
+                return
             
             headers = rows[0]
             data_rows = rows[1:]
@@ -651,12 +737,13 @@ class SheetAnalyzer:
                         
                         if project_summary:
                             summaries.append(project_summary)
+                            projects_found += 1
                         
                         processed_count += 1
                         
                         # Log progress every 5 rows
                         if processed_count % 5 == 0:
-                            logger.info(f"Progress: {processed_count} rows analyzed, {len(summaries)} new projects found")
+                            logger.info(f"Progress: {processed_count} rows analyzed, {projects_found} new projects found")
                         
                     except Exception as e:
                         if "RATE_LIMITED" in str(e):
@@ -667,20 +754,132 @@ class SheetAnalyzer:
                             logger.error(f"Error processing row {row_idx}: {e}")
                             # Mark as failed but continue
                             all_processed_rows.append((row_idx, "Analysis failed"))
+                
+                # Hand over a full batch to be written
+                if len(all_processed_rows) >= batch_size:
+                    yield all_processed_rows, summaries
+                    all_processed_rows, summaries = [], []
             
             if skipped_count > 0:
                 logger.info(f"Skipped {skipped_count} already processed rows")
             
-            logger.info(f"Completed: Analyzed {processed_count} new rows, found {len(summaries)} new projects")
-            return summaries, all_processed_rows
+            logger.info(f"Completed: Analyzed {processed_count} new rows, found {projects_found} new projects")
             
         except Exception as e:
             logger.error(f"Error analyzing rows: {e}")
-            return summaries, all_processed_rows
+        
+        # Hand over whatever is left (including results gathered before an error)
+        if all_processed_rows:
+            yield all_processed_rows, summaries
     
     # Removed _process_batch method as we're no longer doing batch processing
     
-    def write_summaries(self, all_processed: List[Tuple[int, str]], ai_summary_col: int, ai_processed_col: int, ai_keywords_col: int = -1):
+    def _letter(self, col_index: int) -> str:
+        """
+        Get the A1 column letter for a column index, cached after first use
+        
+        Args:
+            col_index: 0-based column index
+            
+        Returns:
+            Column letter(s) in A1 notation
+        """
+        letter = self._col_letters.get(col_index)
+        if letter is None:
+            letter = self._col_letters[col_index] = column_letter(col_index)
+        return letter
+    
+    def build_summary_updates(self, all_processed: List[Tuple[int, str]], ai_summary_col: int,
+                              ai_processed_col: int, ai_keywords_col: int = -1) -> List[Dict]:
+        """
+        Build the cell updates for AI summaries/keywords and AI processed status
+        
+        Args:
+            all_processed: List of (row_index, ai_analysis) tuples for all processed rows
+            ai_summary_col: Column index for AI Summary
+            ai_processed_col: Column index for AI processed
+            ai_keywords_col: Column index for AI Keywords (optional, -1 if not present)
+            
+        Returns:
+            List of {'range', 'values'} dicts for GoogleSheetsHandler.batch_update
+        """
+        updates = []
+        sheet = self.sheet_name
+        summary_letter = self._letter(ai_summary_col)
+        processed_letter = self._letter(ai_processed_col)
+        keywords_letter = None
+        if self.generation_mode == 'keywords' and ai_keywords_col != -1:
+            keywords_letter = self._letter(ai_keywords_col)
+        
+        for row_index, ai_analysis in all_processed:
+            if keywords_letter:
+                # Extract just the keywords (remove "Keywords: " prefix if present)
+                keywords_only = ai_analysis.replace("Keywords: ", "") if ai_analysis.startswith("Keywords: ") else ai_analysis
+                updates.append({'range': f"{sheet}!{keywords_letter}{row_index}", 'values': [[keywords_only]]})
+            
+            # Summary column is always written (also for backward compatibility in keywords mode)
+            updates.append({'range': f"{sheet}!{summary_letter}{row_index}", 'values': [[ai_analysis]]})
+            updates.append({'range': f"{sheet}!{processed_letter}{row_index}", 'values': [["TRUE"]]})
+        
+        return updates
+    
+    def build_daily_draft_update(self, summaries: List[ProjectSummary], daily_draft_col: int) -> Dict:
+        """
+        Generate the daily draft and build its cell update (row 2)
+        
+        Args:
+            summaries: List of project summaries
+            daily_draft_col: Column index for Daily Post Draft
+            
+        Returns:
+            Dict with 'range' and 'values' keys
+        """
+        daily_draft = self.gemini.create_daily_draft(summaries)
+        return {'range': f"{self.sheet_name}!{self._letter(daily_draft_col)}2", 'values': [[daily_draft]]}
+    
+    def write_analysis_results(self, all_processed: List[Tuple[int, str]], summaries: List[ProjectSummary],
+                               ai_summary_col: int, ai_processed_col: int, daily_draft_col: int,
+                               ai_keywords_col: int = -1) -> bool:
+        """
+        Write AI summaries/keywords, AI processed status and the daily draft in one batchUpdate
+        
+        If the daily draft cannot be generated, the summaries are still written.
+        
+        Args:
+            all_processed: List of (row_index, ai_analysis) tuples for all processed rows
+            summaries: List of project summaries (daily draft is skipped if empty)
+            ai_summary_col: Column index for AI Summary
+            ai_processed_col: Column index for AI processed
+            daily_draft_col: Column index for Daily Post Draft
+            ai_keywords_col: Column index for AI Keywords (optional, -1 if not present)
+            
+        Returns:
+            True if the rows were written
+        """
+        try:
+            updates = self.build_summary_updates(all_processed, ai_summary_col, ai_processed_col, ai_keywords_col)
+            draft_text = ""
+            if summaries:
+                try:
+                    updates.append(self.build_daily_draft_update(summaries, daily_draft_col))
+                    draft_text = " and daily draft"
+                except Exception as e:
+                    logger.error(f"Error generating daily draft: {e}")
+            
+            if not updates:
+                return True
+            
+            self.sheets.batch_update(data=updates, value_input_option='RAW')
+            
+            mode_text = "keywords" if self.generation_mode == 'keywords' else "summaries"
+            logger.info(f"Written {len(all_processed)} AI {mode_text}{draft_text} to sheet")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error writing analysis results: {e}")
+            return False
+    
+    def write_summaries(self, all_processed: List[Tuple[int, str]], ai_summary_col: int, ai_processed_col: int, ai_keywords_col: int = -1) -> bool:
         """
         Write AI summaries/keywords and AI processed status to the sheet
         
@@ -689,47 +888,26 @@ class SheetAnalyzer:
             ai_summary_col: Column index for AI Summary
             ai_processed_col: Column index for AI processed
             ai_keywords_col: Column index for AI Keywords (optional, -1 if not present)
+            
+        Returns:
+            True if the rows were written
         """
         if not all_processed:
-            return
+            return True
         
         try:
-            # Read current sheet data
-            all_rows = self.sheets.get_sheet_data()
-            
-            # Ensure we have enough columns in each row
-            max_col = max(ai_summary_col, ai_processed_col, ai_keywords_col if ai_keywords_col != -1 else 0)
-            for row_idx in range(len(all_rows)):
-                while len(all_rows[row_idx]) <= max_col:
-                    all_rows[row_idx].append('')
-            
-            # Update the appropriate columns for each processed row
-            for row_index, ai_analysis in all_processed:
-                if row_index - 1 < len(all_rows):  # row_index is 1-based
-                    # Write the analysis to the appropriate column
-                    if self.generation_mode == 'keywords' and ai_keywords_col != -1:
-                        # Extract just the keywords (remove "Keywords: " prefix if present)
-                        if ai_analysis.startswith("Keywords: "):
-                            keywords_only = ai_analysis.replace("Keywords: ", "")
-                            all_rows[row_index - 1][ai_keywords_col] = keywords_only
-                        else:
-                            all_rows[row_index - 1][ai_keywords_col] = ai_analysis
-                        # Also write to summary column for backward compatibility
-                        all_rows[row_index - 1][ai_summary_col] = ai_analysis
-                    else:
-                        all_rows[row_index - 1][ai_summary_col] = ai_analysis
-                    
-                    all_rows[row_index - 1][ai_processed_col] = "TRUE"
-            
-            # Clear and rewrite the entire sheet
-            self.sheets.clear_sheet(preserve_headers=False)
-            self.sheets.append_data(all_rows)
+            self.sheets.batch_update(
+                data=self.build_summary_updates(all_processed, ai_summary_col, ai_processed_col, ai_keywords_col),
+                value_input_option='RAW'
+            )
             
             mode_text = "keywords" if self.generation_mode == 'keywords' else "summaries"
             logger.info(f"Written {len(all_processed)} AI {mode_text} to sheet")
+            return True
                 
         except Exception as e:
             logger.error(f"Error writing {self.generation_mode}: {e}")
+            return False
     
     def generate_and_write_daily_draft(self, summaries: List[ProjectSummary], daily_draft_col: int):
         """
@@ -740,26 +918,10 @@ class SheetAnalyzer:
             daily_draft_col: Column index for Daily Post Draft
         """
         try:
-            # Generate daily draft
-            daily_draft = self.gemini.create_daily_draft(summaries)
-            
-            # Read current sheet data
-            all_rows = self.sheets.get_sheet_data()
-            
-            # Ensure we have at least 2 rows (header + first data row)
-            while len(all_rows) < 2:
-                all_rows.append([])
-            
-            # Ensure the second row has enough columns
-            while len(all_rows[1]) <= daily_draft_col:
-                all_rows[1].append('')
-            
-            # Set the daily draft in the second row (first data row)
-            all_rows[1][daily_draft_col] = daily_draft
-            
-            # Clear and rewrite the entire sheet
-            self.sheets.clear_sheet(preserve_headers=False)
-            self.sheets.append_data(all_rows)
+            self.sheets.batch_update(
+                data=[self.build_daily_draft_update(summaries, daily_draft_col)],
+                value_input_option='RAW'
+            )
             
             logger.info("Written daily draft to sheet")
             
@@ -780,12 +942,12 @@ class SheetAnalyzer:
             summaries, all_processed_rows = self.analyze_all_rows()
             
             if all_processed_rows:
-                # Write all AI summaries/keywords (including "Not new project related")
-                self.write_summaries(all_processed_rows, ai_summary_col, ai_processed_col, ai_keywords_col)
+                # Write all AI summaries/keywords (including "Not new project related") and,
+                # only if there are actual projects, the daily draft in a single batchUpdate
+                self.write_analysis_results(all_processed_rows, summaries, ai_summary_col,
+                                            ai_processed_col, daily_draft_col, ai_keywords_col)
                 
-                # Generate and write daily draft only if there are actual projects
                 if summaries:
-                    self.generate_and_write_daily_draft(summaries, daily_draft_col)
                     mode_text = "keywords" if self.generation_mode == 'keywords' else "summaries"
                     logger.info(f"Daily analysis complete ({mode_text} mode): {len(all_processed_rows)} rows processed, {len(summaries)} new projects found")
                 else:
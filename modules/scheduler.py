@@ -2,29 +2,90 @@
 Scheduler Module for Discord to Google Sheets Pipeline
 
 This module orchestrates the complete data pipeline with clean async/sync separation:
-1. Async Discord data collection → CSV
-2. Sync processing: CSV → Sheets → AI → Publishing → Archive
+1. Async Discord data collection → in-memory rows (optional audit CSV)
+2. Sync processing: rows → Sheets → AI → Publishing → Archive
 """
 
 import asyncio
 import csv
+import os
+import random
+import re
 import signal
+import threading
 import time
+import traceback
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 import schedule
 
-from modules.discord_handler import DiscordHandler, TwitterPost
+from modules.discord_handler import DiscordHandler, canonicalize_link
 from modules.sheets_handler import GoogleSheetsHandler
 from modules.gemini_analyzer import GeminiAnalyzer, SheetAnalyzer
-from modules.x_publisher import create_publisher, SheetPublisher
+from modules.x_publisher import create_publishers_async, SheetPublisher
 from modules.archive_handler import ArchiveHandler
+from utils.bloom_filter import BloomFilter
+from utils.event_loop import EventLoopRunner
 from utils.logger import setup_logger
+from utils.seen_links import SeenLinkStore
 from utils.timezone_utils import get_time_column_header
 
 logger = setup_logger(__name__)
 
+# Sheet column order for a TwitterPost
+POST_ROW_FIELDS = attrgetter('date', 'time', 'content', 'post_link', 'author', 'author_link')
+
+# Exact links kept alongside the Bloom filter to confirm likely duplicates
+RECENT_LINKS_CACHE_SIZE = 5000
+
+# PUBLISHER_TYPE values that select the X/Twitter publisher
+TWITTER_PUBLISHER_TYPES = frozenset({'twitter', 'x'})
+
+# Matches retry hints in API errors, e.g. "Retry-After: 30", "retry_delay { seconds: 40 }", "retry in 12.5s"
+RETRY_AFTER_PATTERN = re.compile(r'retry(?:[-_ ]after|_delay| in)\D{0,20}?(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace API call bursts"""
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens held at once
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def consume(self, tokens: int = 1):
+        """
+        Take tokens from the bucket, sleeping until enough have accumulated
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/consume meanwhile
+            time.sleep(wait)
+
 
 class AsyncDiscordCollector:
     """Handles async Discord data collection in isolation"""
@@ -41,63 +102,100 @@ class AsyncDiscordCollector:
         self.discord_token = discord_token
         self.channel_id = channel_id
         self.config = config
+        
+        # Output directory for audit CSVs, created once
+        self._data_dir = 'data'
+        os.makedirs(self._data_dir, exist_ok=True)
+        
+        # Keeping the connection between runs needs the event loop to run on
+        # its own thread (see ScheduledTaskRunner.initialize_components)
+        self.persistent_connection = config.get('DISCORD_PERSISTENT_CONNECTION', 'false').lower() == 'true'
+        self.handler = DiscordHandler(discord_token, channel_id)
+        
+        # Settings are fixed for the process lifetime, so parse them once
+        self.collection_mode = config.get('DISCORD_COLLECTION_MODE', 'daily')
+        self.lookback_days = int(config.get('DISCORD_LOOKBACK_DAYS', 1))
+        self.lookback_hours = int(config.get('DISCORD_LOOKBACK_HOURS', 24))
+        self.fetch_limit = int(config.get('DISCORD_FETCH_LIMIT', 200))
     
-    async def collect_to_csv(self) -> Optional[str]:
+    async def collect_to_memory(self) -> Optional[List[List[str]]]:
         """
-        Main entry point - collects Discord data to CSV
+        Main entry point - collects Discord data as sheet rows
         
         Returns:
-            Path to CSV file if successful, None otherwise
+            List of post rows (without headers) if posts were found, None otherwise
         """
-        handler = None
         try:
             logger.info("Starting async Discord collection...")
             
-            # Connect to Discord
-            handler = DiscordHandler(self.discord_token, self.channel_id)
-            logger.info("Connecting to Discord...")
-            await handler.connect()
-            logger.info("Discord connected successfully")
+            # Connect to Discord only if there is no live connection to reuse
+            if not self.handler.is_connected():
+                logger.info("Connecting to Discord...")
+                await self.handler.connect()
+                logger.info("Discord connected successfully")
+            else:
+                logger.info("Reusing existing Discord connection")
             
             # Determine time window
             after = self._get_time_window()
             
+            # Don't start a fetch that would run straight into a known rate limit
+            wait = self.handler.rate_limit_reset_after
+            if wait > 0:
+                logger.info("Waiting %.1fs for Discord rate limit to reset", wait)
+                await asyncio.sleep(wait)
+            
             # Fetch posts
-            limit = int(self.config.get('DISCORD_FETCH_LIMIT', 200))
-            logger.info(f"Fetching up to {limit} messages after {after}")
+            logger.info("Fetching up to %s messages after %s", self.fetch_limit, after)
             
-            posts = await handler.fetch_twitter_posts_with_retry(
-                limit=limit,
+            posts = await self.handler.fetch_twitter_posts_with_retry(
+                limit=self.fetch_limit,
                 after=after
             )
             
-            logger.info(f"Collected {len(posts)} Twitter/X posts from Discord")
+            logger.info("Collected %s Twitter/X posts from Discord", len(posts))
             
             if not posts:
-                logger.info("No posts found, skipping CSV creation")
+                logger.info("No posts found")
                 return None
             
-            # Save to CSV
-            csv_path = self._save_to_csv(posts)
-            logger.info(f"Saved {len(posts)} posts to {csv_path}")
-            
-            return csv_path
+            return [list(POST_ROW_FIELDS(post)) for post in posts]
             
         except Exception as e:
-            logger.error(f"Discord collection failed: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Discord collection failed: %s", e)
+            logger.error("Traceback: %s", traceback.format_exc())
             return None
-            
+        
         finally:
-            # Always disconnect
-            if handler:
-                try:
-                    logger.info("Disconnecting from Discord...")
-                    await handler.disconnect()
-                    logger.info("Discord disconnected")
-                except Exception as e:
-                    logger.warning(f"Error disconnecting from Discord: {e}")
+            # Without a background event loop the gateway heartbeat would stall
+            # between runs, so reconnect every time instead
+            if not self.persistent_connection:
+                await self.close()
+    
+    async def close(self):
+        """Disconnect from Discord"""
+        try:
+            logger.info("Disconnecting from Discord...")
+            await self.handler.disconnect()
+            logger.info("Discord disconnected")
+        except Exception as e:
+            logger.warning("Error disconnecting from Discord: %s", e)
+    
+    async def collect_to_csv(self) -> Optional[str]:
+        """
+        Collects Discord data to CSV
+        
+        Returns:
+            Path to CSV file if successful, None otherwise
+        """
+        rows = await self.collect_to_memory()
+        if not rows:
+            logger.info("No posts found, skipping CSV creation")
+            return None
+        
+        csv_path = self.save_to_csv(rows)
+        logger.info("Saved %s posts to %s", len(rows), csv_path)
+        return csv_path
     
     def _get_time_window(self) -> Optional[datetime]:
         """
@@ -106,17 +204,15 @@ class AsyncDiscordCollector:
         Returns:
             Datetime for after parameter, or None for all messages
         """
-        collection_mode = self.config.get('DISCORD_COLLECTION_MODE', 'daily')
+        collection_mode = self.collection_mode
         
         if collection_mode == 'daily':
-            lookback_days = int(self.config.get('DISCORD_LOOKBACK_DAYS', 1))
-            after = datetime.now() - timedelta(days=lookback_days)
-            logger.info(f"Collection mode: daily (last {lookback_days} days)")
+            after = datetime.now() - timedelta(days=self.lookback_days)
+            logger.info("Collection mode: daily (last %s days)", self.lookback_days)
             
         elif collection_mode == 'hours':
-            lookback_hours = int(self.config.get('DISCORD_LOOKBACK_HOURS', 24))
-            after = datetime.now() - timedelta(hours=lookback_hours)
-            logger.info(f"Collection mode: hours (last {lookback_hours} hours)")
+            after = datetime.now() - timedelta(hours=self.lookback_hours)
+            logger.info("Collection mode: hours (last %s hours)", self.lookback_hours)
             
         elif collection_mode == 'since_last':
             # This will need to be passed from the processor
@@ -129,26 +225,21 @@ class AsyncDiscordCollector:
         
         return after
     
-    def _save_to_csv(self, posts: List[TwitterPost]) -> str:
+    def save_to_csv(self, rows: List[List[str]]) -> str:
         """
-        Save posts to timestamped CSV file
+        Save post rows to timestamped CSV file
         
         Args:
-            posts: List of TwitterPost objects
+            rows: List of post rows as returned by collect_to_memory
             
         Returns:
             Path to created CSV file
         """
-        # Create data directory if it doesn't exist
-        data_dir = Path('data')
-        data_dir.mkdir(exist_ok=True)
-        
-        # Generate timestamp for filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        csv_path = data_dir / f'discord_posts_{timestamp}.csv'
+        # Generate timestamped filename
+        csv_path = os.path.join(self._data_dir, f"discord_posts_{time.strftime('%Y%m%d_%H%M%S')}.csv")
         
-        # Write CSV
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        # Write CSV through a large buffer so rows are flushed in few write() calls
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
             writer = csv.writer(f)
             
             # Write headers (matching Google Sheets format with dynamic timezone)
@@ -156,17 +247,9 @@ class AsyncDiscordCollector:
             writer.writerow(['Date', time_header, 'Content', 'Post Link', 'Author', 'Author Link'])
             
             # Write data
-            for post in posts:
-                writer.writerow([
-                    post.date,
-                    post.time,
-                    post.content,
-                    post.post_link,
-                    post.author,
-                    post.author_link
-                ])
+            writer.writerows(rows)
         
-        return str(csv_path)
+        return csv_path
 
 
 class SequentialProcessor:
@@ -183,53 +266,132 @@ class SequentialProcessor:
         self.sheets = sheets_handler
         self.config = config
         self.gemini_analyzer = None
+        self.sheet_analyzer = None
+        self.archiver = None
         self.publisher = None
+        self.publishers: List = []
+        self._gemini_initialized = False
+        self._publisher_initialized = False
+        
+        # Resolved column indices keyed by header fingerprint
+        self._col_cache: Dict[tuple, Dict[str, int]] = {}
+        
+        # Duplicate check settings, parsed once
+        self.skip_duplicates = config.get('DISCORD_SKIP_DUPLICATES', 'true').lower() == 'true'
+        self.duplicate_window = int(config.get('DUPLICATE_WINDOW_ROWS', 0))
+        self.dup_cache_ttl = int(config.get('DUP_CACHE_TTL_SEC', 0))
         
-        # Initialize Gemini if configured
-        gemini_key = config.get('GEMINI_API_KEY')
+        # Existing post links, kept across scheduled runs and updated after each upload
+        self._existing_links: Optional[BloomFilter] = None
+        self._recent_links: OrderedDict = OrderedDict()
+        self._links_loaded_at = 0.0
+        
+        # Optional local record of uploaded links, so reposts are still caught
+        # after their rows are archived or fall outside DUPLICATE_WINDOW_ROWS
+        seen_db = config.get('SEEN_LINKS_DB')
+        self.seen_links = SeenLinkStore(seen_db) if seen_db else None
+        
+        # Directory processed CSVs are moved to
+        self.processed_dir = Path('data/processed')
+        self.processed_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Paces Gemini requests to the configured daily budget over any 24 hours,
+        # across scheduled runs; the analyzer takes one token per API request
+        daily_limit = int(config.get('GEMINI_DAILY_LIMIT', 1400))
+        self.gemini_bucket = TokenBucket(rate=daily_limit / 86400, burst=daily_limit)
+        
+        # Gemini and the publisher are created on first use so runs that
+        # have nothing to analyze or publish don't pay their setup/auth cost
+    
+    def _ensure_gemini(self) -> Optional[GeminiAnalyzer]:
+        """
+        Initialize Gemini on first use if configured
+        
+        Returns:
+            GeminiAnalyzer instance, or None if not configured or initialization failed
+        """
+        if self._gemini_initialized:
+            return self.gemini_analyzer
+        self._gemini_initialized = True
+        
+        gemini_key = self.config.get('GEMINI_API_KEY')
         if gemini_key:
             try:
                 self.gemini_analyzer = GeminiAnalyzer(
                     api_key=gemini_key,
-                    model=config.get('GEMINI_MODEL', 'gemini-1.5-flash'),
-                    daily_limit=int(config.get('GEMINI_DAILY_LIMIT', 1400)),
-                    generation_mode=config.get('GEMINI_GENERATION_MODE', 'summary')
+                    model=self.config.get('GEMINI_MODEL', 'gemini-1.5-flash'),
+                    daily_limit=int(self.config.get('GEMINI_DAILY_LIMIT', 1400)),
+                    generation_mode=self.config.get('GEMINI_GENERATION_MODE', 'summary'),
+                    request_bucket=self.gemini_bucket
                 )
                 logger.info("Gemini analyzer initialized")
             except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
+                logger.error("Failed to initialize Gemini: %s", e)
+        
+        return self.gemini_analyzer
+    
+    def _ensure_publisher(self):
+        """
+        Initialize the publishers on first use if configured
+        
+        Returns:
+            First publisher, or None if not configured or initialization failed
+        """
+        if not self._publisher_initialized:
+            self._publisher_initialized = True
+            if self.config.get('PUBLISHER_TYPE'):
+                self._init_publisher()
+        return self.publisher
+    
+    def _publisher_config(self, pub_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the create_publishers_async config for one publisher type
         
-        # Initialize publisher if configured
-        if config.get('PUBLISHER_TYPE'):
-            self._init_publisher()
+        Args:
+            pub_type: Publisher type from PUBLISHER_TYPE
+            
+        Returns:
+            Config dictionary, or None if the type is unknown
+        """
+        redis_url = self.config.get('PUBLISH_RATE_LIMIT_REDIS_URL')
+        if pub_type in TWITTER_PUBLISHER_TYPES:
+            return {
+                'type': 'twitter',
+                'api_key': self.config.get('X_API_KEY'),
+                'api_secret': self.config.get('X_API_SECRET'),
+                'access_token': self.config.get('X_ACCESS_TOKEN'),
+                'access_token_secret': self.config.get('X_ACCESS_TOKEN_SECRET'),
+                'rate_limit_redis_url': redis_url
+            }
+        if pub_type == 'typefully':
+            return {
+                'type': 'typefully',
+                'api_key': self.config.get('TYPEFULLY_API_KEY'),
+                'hours_delay': int(self.config.get('TYPEFULLY_HOURS_DELAY', 0)),
+                'rate_limit_redis_url': redis_url
+            }
+        logger.warning("Unknown publisher type: %s", pub_type)
+        return None
     
     def _init_publisher(self):
-        """Initialize publisher based on configuration"""
-        pub_type = self.config.get('PUBLISHER_TYPE', '').lower()
+        """Initialize publishers based on configuration, authenticating them concurrently"""
+        pub_types = [t.strip().lower() for t in self.config.get('PUBLISHER_TYPE', '').split(',') if t.strip()]
+        configs = [config for config in map(self._publisher_config, pub_types) if config]
+        if not configs:
+            return
         
         try:
-            if pub_type in ['twitter', 'x']:
-                self.publisher = create_publisher(
-                    'twitter',
-                    api_key=self.config.get('X_API_KEY'),
-                    api_secret=self.config.get('X_API_SECRET'),
-                    access_token=self.config.get('X_ACCESS_TOKEN'),
-                    access_token_secret=self.config.get('X_ACCESS_TOKEN_SECRET')
-                )
-                logger.info("Twitter/X publisher initialized")
-                
-            elif pub_type == 'typefully':
-                self.publisher = create_publisher(
-                    'typefully',
-                    api_key=self.config.get('TYPEFULLY_API_KEY'),
-                    hours_delay=int(self.config.get('TYPEFULLY_HOURS_DELAY', 0))
-                )
-                logger.info("Typefully publisher initialized")
-            else:
-                logger.warning(f"Unknown publisher type: {pub_type}")
-                
+            self.publishers = asyncio.run(create_publishers_async(configs))
         except Exception as e:
-            logger.error(f"Failed to initialize publisher: {e}")
+            logger.error("Failed to initialize publisher: %s", e)
+            return
+        
+        if self.publishers:
+            self.publisher = self.publishers[0]
+            logger.info("Publishers initialized: %s",
+                        ', '.join(type(p).__name__ for p in self.publishers))
+        else:
+            logger.error("No publisher authenticated")
     
     def process_csv_to_sheets(self, csv_path: str) -> Dict:
         """
@@ -249,125 +411,254 @@ class SequentialProcessor:
         }
         
         try:
-            logger.info(f"Processing CSV: {csv_path}")
-            
-            # Read CSV
-            posts = []
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Find the time column (it will have dynamic timezone like "Time (PST)")
-                    time_value = None
-                    for key in row.keys():
-                        if key.startswith('Time'):
-                            time_value = row[key]
-                            break
-                    
-                    posts.append([
-                        row['Date'],
-                        time_value if time_value else '',
-                        row['Content'],
-                        row['Post Link'],
-                        row['Author'],
-                        row['Author Link']
-                    ])
+            logger.info("Processing CSV: %s", csv_path)
             
-            logger.info(f"Read {len(posts)} posts from CSV")
+            # Read CSV rows positionally (layout written by save_to_csv)
+            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                headers = next(reader, [])
+                
+                # Validate column order once; the time column has a dynamic timezone like "Time (PST)"
+                if (len(headers) != 6 or not headers[1].startswith('Time')
+                        or [headers[0]] + headers[2:] != ['Date', 'Content', 'Post Link', 'Author', 'Author Link']):
+                    raise ValueError(f"Unexpected CSV columns: {headers}")
+                
+                posts = list(reader)
+            
+            logger.info("Read %s posts from CSV", len(posts))
             
+        except Exception as e:
+            logger.error("CSV processing failed: %s", e)
+            results['errors'].append(str(e))
+            return results
+        
+        return self.process_posts_to_sheets(posts)
+    
+    def process_posts_to_sheets(self, posts: List[List[str]],
+                                existing_links: Optional[BloomFilter] = None) -> Dict:
+        """
+        Upload collected post rows to Google Sheets
+        
+        Args:
+            posts: List of post rows (without headers)
+            existing_links: Preloaded filter of links already in the sheet
+                (loaded here if not provided)
+            
+        Returns:
+            Dictionary with upload results
+        """
+        results = {
+            'success': False,
+            'uploaded': 0,
+            'duplicates': 0,
+            'errors': []
+        }
+        
+        try:
             if not posts:
                 logger.info("No posts to upload")
                 results['success'] = True
                 return results
             
             # Check for duplicates if configured
-            if self.config.get('DISCORD_SKIP_DUPLICATES', 'true').lower() == 'true':
-                new_posts = self._filter_duplicates(posts)
+            if self.skip_duplicates:
+                if existing_links is None:
+                    existing_links = self.load_existing_links()
+                new_posts = self._filter_duplicates(posts, existing_links)
                 results['duplicates'] = len(posts) - len(new_posts)
             else:
                 new_posts = posts
             
             # Upload to sheets
             if new_posts:
-                # Ensure headers exist
-                existing_data = self.sheets.get_sheet_data()
-                if not existing_data:
+                # Check for headers by reading row 1 only (cached once known)
+                if not self.sheets.has_headers():
+                    # Sheet is empty, write headers and rows together in one request
                     time_header = get_time_column_header()
                     headers = ["Date", time_header, "Content", "Post Link", "Author", "Author Link"]
-                    self.sheets.append_data([headers])
-                    logger.info("Added headers to empty sheet")
-                
-                # Batch upload
-                batch_size = int(self.config.get('SHEETS_BATCH_SIZE', 100))
-                self.sheets.batch_append_data(new_posts, batch_size=batch_size)
+                    logger.info("Adding headers to empty sheet")
+                    self.sheets.write_with_headers(headers, new_posts)
+                else:
+                    self.sheets.batch_append_data(new_posts)
                 
                 results['uploaded'] = len(new_posts)
-                logger.info(f"Uploaded {len(new_posts)} posts to Google Sheets")
+                logger.info("Uploaded %s posts to Google Sheets", len(new_posts))
+                
+                # Keep the cached link set in step with the sheet
+                new_links = [canonicalize_link(post[3]) for post in new_posts if len(post) > 3 and post[3]]
+                if self._existing_links is not None:
+                    self._remember_links(new_links)
+                if self.seen_links is not None:
+                    self.seen_links.add_many(new_links)
             else:
                 logger.info("No new posts to upload after filtering duplicates")
             
             results['success'] = True
             
         except Exception as e:
-            logger.error(f"CSV processing failed: {e}")
+            logger.error("Sheets upload failed: %s", e)
             results['errors'].append(str(e))
         
         return results
     
-    def _filter_duplicates(self, posts: List[List[str]]) -> List[List[str]]:
+    def _read_sheet_links(self) -> List[str]:
+        """
+        Download the sheet's Post Link column as canonical links
+        
+        When DUPLICATE_WINDOW_ROWS is set, only the last N rows are kept.
+        
+        Returns:
+            Canonical post links (empty if the column is missing)
+        """
+        column = self.sheets.get_column_values('Post Link')
+        if column is None:
+            logger.warning("Post Link column not found, skipping sheet duplicate check")
+            return []
+        if self.duplicate_window > 0:
+            column = column[-self.duplicate_window:]
+        return [canonicalize_link(link) for link in column if link]
+    
+    def _remember_links(self, links: Iterable[str]):
+        """
+        Record links in the Bloom filter and the recent-links LRU
+        
+        Args:
+            links: Canonical post links known to be in the sheet
+        """
+        for link in links:
+            self._existing_links.add(link)
+            self._recent_links[link] = None
+            self._recent_links.move_to_end(link)
+        
+        while len(self._recent_links) > RECENT_LINKS_CACHE_SIZE:
+            self._recent_links.popitem(last=False)
+    
+    def load_existing_links(self) -> BloomFilter:
+        """
+        Get the Bloom filter of post links already in the sheet
+        
+        The filter is built on first use and reused by later runs, with each
+        upload added to it. It is rebuilt when DUP_CACHE_TTL_SEC (if > 0)
+        expires, to pick up manual sheet edits, and when more links were
+        added than it was sized for.
+        
+        Sheets is only read when the local link store (SEEN_LINKS_DB) is not
+        configured, is empty, or the TTL expired; otherwise the filter is
+        rebuilt from the store, which also covers links since archived.
+        
+        Returns:
+            Bloom filter of canonical post links
+        """
+        ttl_expired = False
+        if self._existing_links is not None:
+            ttl_expired = (self.dup_cache_ttl > 0
+                           and time.monotonic() - self._links_loaded_at > self.dup_cache_ttl)
+            if not ttl_expired and len(self._existing_links) <= self._existing_links.capacity:
+                return self._existing_links
+        
+        source = 'local link store'
+        if self.seen_links is None or ttl_expired or not len(self.seen_links):
+            links = self._read_sheet_links()
+            source = 'Google Sheets'
+            if self.seen_links is not None:
+                self.seen_links.add_many(links)
+        if self.seen_links is not None:
+            links = list(self.seen_links.iter_links())
+        
+        # Size for twice the current links so new uploads keep the error rate low
+        self._existing_links = BloomFilter(capacity=max(2 * len(links), 10000), error_rate=0.001)
+        self._recent_links.clear()
+        self._remember_links(links)
+        self._links_loaded_at = time.monotonic()
+        logger.info("Loaded %s existing post links from %s", len(links), source)
+        return self._existing_links
+    
+    def _resolve_columns(self, headers: List[str]) -> Dict[str, int]:
+        """
+        Resolve column indices for a header row, cached until the headers change
+        
+        Args:
+            headers: Sheet header row
+            
+        Returns:
+            Dictionary of column indices (-1 if a column is missing)
+        """
+        fingerprint = tuple(headers)
+        columns = self._col_cache.get(fingerprint)
+        if columns is not None:
+            return columns
+        
+        columns = {'draft_idx': -1}
+        for idx, header in enumerate(headers):
+            header_lower = header.lower()
+            if 'daily post draft' in header_lower or 'ai draft' in header_lower:
+                columns['draft_idx'] = idx
+                break
+        
+        # Headers changed (or first lookup): drop stale entries
+        self._col_cache = {fingerprint: columns}
+        return columns
+    
+    def _filter_duplicates(self, posts: List[List[str]], existing_links: BloomFilter) -> List[List[str]]:
         """
         Filter out posts that already exist in Google Sheets
         
+        When DUPLICATE_WINDOW_ROWS is set, only the last N sheet rows are
+        checked, so reposts of links older than the window are not caught
+        unless SEEN_LINKS_DB records every link seen in earlier runs
+        
         Args:
             posts: List of post rows
+            existing_links: Bloom filter of links already in the sheet
             
         Returns:
             List of posts that don't exist in sheets
         """
         try:
-            # Get existing data
-            existing_data = self.sheets.get_sheet_data()
-            
-            if len(existing_data) <= 1:  # Only headers or empty
-                logger.info("No existing data in sheets")
-                return posts
-            
-            # Find Post Link column index (case-insensitive)
-            headers = existing_data[0] if existing_data else []
-            link_col_idx = -1
-            for idx, header in enumerate(headers):
-                if 'post link' in header.lower():
-                    link_col_idx = idx
-                    break
+            if not existing_links:
+                logger.info("No existing links in sheets")
             
-            if link_col_idx < 0:
-                logger.warning("Post Link column not found, skipping duplicate check")
-                return posts
-            
-            # Build set of existing links
-            existing_links = set()
-            for row in existing_data[1:]:  # Skip headers
-                if len(row) > link_col_idx and row[link_col_idx]:
-                    existing_links.add(row[link_col_idx])
-            
-            # Filter posts
-            filtered_posts = []
-            for post in posts:
-                if len(post) > 3 and post[3]:  # post[3] is post_link
-                    if post[3] not in existing_links:
-                        filtered_posts.append(post)
-                else:
-                    filtered_posts.append(post)  # Keep posts without links
+            # Canonical link of each post (post[3] is post_link); posts without links are kept
+            post_links = [
+                canonicalize_link(post[3]) if len(post) > 3 and post[3] else None
+                for post in posts
+            ]
+            
+            # Bloom hits outside the recent-links cache may be false positives,
+            # so confirm them exactly: locally if a link store is configured,
+            # otherwise against the sheet in one column read
+            suspects = {
+                link for link in post_links
+                if link and link in existing_links and link not in self._recent_links
+            }
+            confirmed = set()
+            if suspects and self.seen_links is not None:
+                confirmed = self.seen_links.contains(suspects)
+            elif suspects:
+                confirmed = suspects.intersection(self._read_sheet_links())
+            
+            filtered_posts = [
+                post for post, link in zip(posts, post_links)
+                if link is None or link not in existing_links
+                or not (link in self._recent_links or link in confirmed)
+            ]
             
             duplicates_count = len(posts) - len(filtered_posts)
             if duplicates_count > 0:
-                logger.info(f"Filtered out {duplicates_count} duplicate posts")
+                logger.info("Filtered out %s duplicate posts", duplicates_count)
             
             return filtered_posts
             
         except Exception as e:
-            logger.error(f"Error checking for duplicates: {e}")
+            logger.error("Error checking for duplicates: %s", e)
             return posts  # Return all posts if duplicate check fails
     
+    def close(self):
+        """Close the local link store, if one is open"""
+        if self.seen_links is not None:
+            self.seen_links.close()
+            self.seen_links = None
+    
     def run_gemini_analysis(self) -> Dict:
         """
         Direct call to Gemini AI analysis with rate limiting and retry logic
@@ -382,44 +673,57 @@ class SequentialProcessor:
             'errors': []
         }
         
-        if not self.gemini_analyzer:
+        if not self._ensure_gemini():
             logger.info("Gemini not configured, skipping analysis")
             results['success'] = True
             return results
         
         max_retries = 3
         retry_count = 0
+        batch_size = int(self.config.get('SHEETS_BATCH_SIZE', 100))
+        project_summaries = []  # Accumulated across attempts for the daily draft
         
         while retry_count < max_retries:
             try:
-                logger.info(f"Starting Gemini AI analysis... (attempt {retry_count + 1}/{max_retries})")
+                logger.info("Starting Gemini AI analysis... (attempt %s/%s)", retry_count + 1, max_retries)
                 
-                # Create SheetAnalyzer
-                analyzer = SheetAnalyzer(self.sheets, self.gemini_analyzer)
+                # Reuse one SheetAnalyzer so its column lookup is cached across runs
+                if not self.sheet_analyzer:
+                    self.sheet_analyzer = SheetAnalyzer(self.sheets, self.gemini_analyzer)
+                analyzer = self.sheet_analyzer
                 
                 # Ensure columns exist (now returns 4 values)
                 ai_summary_col, ai_processed_col, daily_draft_col, ai_keywords_col = analyzer.ensure_columns_exist()
-                logger.info(f"AI columns: summary={ai_summary_col}, processed={ai_processed_col}, draft={daily_draft_col}, keywords={ai_keywords_col}")
-                
-                # Analyze all unprocessed rows
-                project_summaries, all_processed = analyzer.analyze_all_rows()
+                logger.info("AI columns: summary=%s, processed=%s, draft=%s, keywords=%s", ai_summary_col, ai_processed_col, daily_draft_col, ai_keywords_col)
                 
-                results['projects_found'] = len(project_summaries)
-                results['posts_analyzed'] = len(all_processed)
-                
-                # Write summaries and mark processed
-                if all_processed:
-                    analyzer.write_summaries(all_processed, ai_summary_col, ai_processed_col, ai_keywords_col)
-                    logger.info(f"Wrote {len(all_processed)} AI analyses/statuses")
+                # Analyze unprocessed rows, writing each batch once the next one
+                # completes; the last batch is held back so it goes out with the
+                # daily draft in a single batchUpdate
+                held_batch = []
+                for processed_batch, project_batch in analyzer.iter_analysis_batches(batch_size):
+                    if held_batch:
+                        if not analyzer.write_summaries(held_batch, ai_summary_col, ai_processed_col, ai_keywords_col):
+                            raise RuntimeError(f"Failed to write {len(held_batch)} AI analyses to sheet")
+                        results['posts_analyzed'] += len(held_batch)
+                        logger.info("Wrote %s AI analyses/statuses (%s so far)",
+                                   len(held_batch), results['posts_analyzed'])
+                    
+                    held_batch = processed_batch
+                    project_summaries.extend(project_batch)
+                    results['projects_found'] += len(project_batch)
                 
-                # Generate and write daily draft
-                if project_summaries:
-                    analyzer.generate_and_write_daily_draft(project_summaries, daily_draft_col)
-                    logger.info("Generated daily draft")
+                # Write the last batch and the daily draft from all projects found
+                if held_batch or project_summaries:
+                    if not analyzer.write_analysis_results(held_batch, project_summaries, ai_summary_col,
+                                                           ai_processed_col, daily_draft_col, ai_keywords_col):
+                        raise RuntimeError(f"Failed to write {len(held_batch)} AI analyses to sheet")
+                    results['posts_analyzed'] += len(held_batch)
+                    if project_summaries:
+                        logger.info("Generated daily draft")
                 
                 results['success'] = True
-                logger.info(f"Analysis complete: {results['projects_found']} projects, "
-                           f"{results['posts_analyzed']} posts analyzed")
+                logger.info("Analysis complete: %s projects, %s posts analyzed",
+                           results['projects_found'], results['posts_analyzed'])
                 break  # Success, exit retry loop
                 
             except Exception as e:
@@ -429,9 +733,8 @@ class SequentialProcessor:
                 if "RATE_LIMITED" in error_msg or "429" in error_msg or "quota" in error_msg.lower():
                     retry_count += 1
                     if retry_count < max_retries:
-                        # Exponential backoff: 30s, 60s, 120s
-                        wait_time = 30 * (2 ** (retry_count - 1))
-                        logger.warning(f"Rate limited, waiting {wait_time} seconds before retry...")
+                        wait_time = self._retry_delay(error_msg, retry_count)
+                        logger.warning("Rate limited, waiting %.1f seconds before retry...", wait_time)
                         time.sleep(wait_time)
                         continue
                     else:
@@ -439,18 +742,39 @@ class SequentialProcessor:
                         results['errors'].append("Rate limited after multiple retries")
                 else:
                     # Non-rate-limit error, don't retry
-                    logger.error(f"Gemini analysis failed: {e}")
+                    logger.error("Gemini analysis failed: %s", e)
                     results['errors'].append(str(e))
                     break
         
         # If we still don't have success after retries, mark as partial success
-        # if some posts were analyzed
+        # if some analyzed posts were already written to the sheet
         if not results['success'] and results['posts_analyzed'] > 0:
-            logger.info(f"Partial success: analyzed {results['posts_analyzed']} posts before rate limit")
+            logger.info("Partial success: analyzed %s posts before rate limit", results['posts_analyzed'])
             results['success'] = True  # Consider partial analysis as success
         
         return results
     
+    @staticmethod
+    def _retry_delay(error_msg: str, attempt: int, base: float = 30.0, cap: float = 300.0) -> float:
+        """
+        Compute how long to wait before retrying a rate-limited call
+        
+        Args:
+            error_msg: Error message, checked for a server-provided retry hint
+            attempt: Retry attempt number (1-based)
+            base: Base backoff in seconds
+            cap: Maximum backoff in seconds (before jitter), also applied to a retry hint
+            
+        Returns:
+            Seconds to wait
+        """
+        match = RETRY_AFTER_PATTERN.search(error_msg)
+        if match:
+            return min(cap, float(match.group(1)))
+        
+        # Jittered exponential backoff: ~30s, ~60s, ~120s ... capped
+        return min(cap, base * (2 ** (attempt - 1))) + random.uniform(0, base)
+    
     def run_publisher(self) -> Dict:
         """
         Direct call to publisher
@@ -465,7 +789,7 @@ class SequentialProcessor:
             'errors': []
         }
         
-        if not self.publisher:
+        if not self.config.get('PUBLISHER_TYPE'):
             logger.info("Publisher not configured, skipping")
             results['success'] = True
             return results
@@ -473,9 +797,6 @@ class SequentialProcessor:
         try:
             logger.info("Starting publishing...")
             
-            # Create SheetPublisher wrapper
-            sheet_publisher = SheetPublisher(self.publisher, self.sheets)
-            
             # Get sheet data
             sheet_data = self.sheets.get_sheet_data()
             if len(sheet_data) < 2:
@@ -484,13 +805,7 @@ class SequentialProcessor:
                 return results
             
             # Find Daily Post Draft column (case-insensitive)
-            headers = sheet_data[0]
-            draft_col = -1
-            for idx, header in enumerate(headers):
-                header_lower = header.lower()
-                if 'daily post draft' in header_lower or 'ai draft' in header_lower:
-                    draft_col = idx
-                    break
+            draft_col = self._resolve_columns(sheet_data[0])['draft_idx']
             
             if draft_col < 0:
                 logger.info("Draft column not found")
@@ -500,18 +815,30 @@ class SequentialProcessor:
             # Find first non-empty draft
             for idx, row in enumerate(sheet_data[1:], start=2):
                 if len(row) > draft_col and row[draft_col] and row[draft_col].strip():
-                    logger.info(f"Found draft at row {idx}")
+                    logger.info("Found draft at row %s", idx)
                     
-                    # Publish
+                    # Only authenticate the publisher once there is something to publish
+                    publisher = self._ensure_publisher()
+                    if not publisher:
+                        logger.info("Publisher not configured, skipping")
+                        results['success'] = True
+                        break
+                    
+                    # Publish, with every configured publisher at once
+                    sheet_publisher = SheetPublisher(self.publishers, self.sheets)
                     publish_result = sheet_publisher.publish_from_sheet(idx)
                     
                     if publish_result.success:
                         results['success'] = True
                         results['published'] = True
                         results['url'] = publish_result.url
-                        logger.info(f"Published successfully: {publish_result.url or publish_result.post_id}")
+                        logger.info("Published successfully: %s", publish_result.url or publish_result.post_id)
+                        if publish_result.error_msg:
+                            # Some publishers failed while another succeeded
+                            logger.error("Publishing partly failed: %s", publish_result.error_msg)
+                            results['errors'].append(publish_result.error_msg)
                     else:
-                        logger.error(f"Publishing failed: {publish_result.error_msg}")
+                        logger.error("Publishing failed: %s", publish_result.error_msg)
                         results['errors'].append(publish_result.error_msg)
                     
                     break
@@ -520,11 +847,29 @@ class SequentialProcessor:
                 results['success'] = True
             
         except Exception as e:
-            logger.error(f"Publishing failed: {e}")
+            logger.error("Publishing failed: %s", e)
             results['errors'].append(str(e))
         
         return results
     
+    def prepare_archiver(self) -> bool:
+        """
+        Make sure the Archives sheet is ready before the archive run
+        
+        Uses its own Sheets client so it can run in a worker thread while publishing.
+        
+        Returns:
+            True if the Archives sheet is ready
+        """
+        try:
+            archive_sheets = GoogleSheetsHandler(str(self.sheets.credentials_path), self.sheets.sheet_id)
+            self.archiver = ArchiveHandler(archive_sheets)
+            return self.archiver.ensure_archive_sheet_exists()
+        except Exception as e:
+            logger.error("Failed to prepare archiver: %s", e)
+            self.archiver = None
+            return False
+    
     def run_archiver(self) -> Dict:
         """
         Direct call to archive handler
@@ -541,8 +886,9 @@ class SequentialProcessor:
         try:
             logger.info("Starting archive process...")
             
-            # Create ArchiveHandler
-            archiver = ArchiveHandler(self.sheets)
+            # Use the handler prepared alongside publishing, if any (valid for this run only)
+            archiver = self.archiver or ArchiveHandler(self.sheets)
+            self.archiver = None
             
             # Run archive workflow
             archive_results = archiver.run_archive_workflow()
@@ -553,44 +899,47 @@ class SequentialProcessor:
             if not results['success']:
                 results['errors'] = archive_results.get('errors', [])
             
-            logger.info(f"Archived {results['posts_archived']} posts")
+            logger.info("Archived %s posts", results['posts_archived'])
             
         except Exception as e:
-            logger.error(f"Archive failed: {e}")
+            logger.error("Archive failed: %s", e)
             results['errors'].append(str(e))
         
         return results
     
-    def cleanup_csv(self, csv_path: str):
+    def cleanup_csv(self, csv_path: Optional[str]):
         """
-        Move processed CSV to archive
+        Move processed CSV to archive (no-op when no audit CSV was written)
         
         Args:
             csv_path: Path to CSV file to archive
         """
+        if not csv_path:
+            return
+        
         try:
             csv_file = Path(csv_path)
-            if not csv_file.exists():
-                logger.warning(f"CSV file not found: {csv_path}")
-                return
-            
-            # Create processed directory
-            processed_dir = Path('data/processed')
-            processed_dir.mkdir(parents=True, exist_ok=True)
+            dest_path = self.processed_dir / csv_file.name
             
-            # Move file
-            dest_path = processed_dir / csv_file.name
-            csv_file.rename(dest_path)
+            # Move file (overwrites an existing file of the same name)
+            csv_file.replace(dest_path)
             
-            logger.info(f"Moved CSV to: {dest_path}")
+            logger.info("Moved CSV to: %s", dest_path)
             
+        except FileNotFoundError:
+            logger.warning("CSV file not found: %s", csv_path)
         except Exception as e:
-            logger.error(f"Failed to archive CSV: {e}")
+            logger.error("Failed to archive CSV: %s", e)
 
 
 class ScheduledTaskRunner:
     """Main orchestrator coordinating all phases"""
     
+    # Signal handlers are process-wide, so they are installed once and
+    # routed to the most recently created runner
+    _signals_installed = False
+    _current = None
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize scheduled task runner
@@ -601,11 +950,24 @@ class ScheduledTaskRunner:
         self.config = config
         self.async_collector = None
         self.processor = None
+        self._loop = None
+        self.timezone = self._setup_timezone()
         self._shutdown = False
+        self._shutdown_event = threading.Event()
         
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        ScheduledTaskRunner._current = weakref.ref(self)
+        if not ScheduledTaskRunner._signals_installed:
+            signal.signal(signal.SIGINT, ScheduledTaskRunner._dispatch_signal)
+            signal.signal(signal.SIGTERM, ScheduledTaskRunner._dispatch_signal)
+            ScheduledTaskRunner._signals_installed = True
+    
+    @staticmethod
+    def _dispatch_signal(signum, frame):
+        """Route a shutdown signal to the current runner instance"""
+        runner = ScheduledTaskRunner._current() if ScheduledTaskRunner._current else None
+        if runner is not None:
+            runner._signal_handler(signum, frame)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
@@ -613,6 +975,28 @@ class ScheduledTaskRunner:
         _ = frame   # Unused but required by signal handler signature
         logger.info("Received shutdown signal, finishing current task...")
         self._shutdown = True
+        self._shutdown_event.set()
+    
+    def _setup_timezone(self) -> Optional[Any]:
+        """
+        Set up the timezone for scheduling
+        
+        Returns:
+            Timezone object or None for the system timezone
+        """
+        tz_name = self.config.get('SCHEDULE_TIMEZONE')
+        if tz_name:
+            try:
+                import pytz
+                tz = pytz.timezone(tz_name)
+                logger.info("Using configured timezone: %s", tz_name)
+                return tz
+            except ImportError:
+                logger.warning("pytz not installed, using system timezone")
+            except Exception as e:
+                logger.warning("Invalid timezone '%s': %s, using system timezone", tz_name, e)
+        
+        return None
     
     def initialize_components(self) -> bool:
         """
@@ -653,13 +1037,17 @@ class ScheduledTaskRunner:
             # Initialize processor
             self.processor = SequentialProcessor(sheets_handler, self.config)
             
+            # One event loop reused by every pipeline run; a persistent Discord
+            # connection needs it running between runs to keep heartbeating
+            if self._loop is None or self._loop.is_closed():
+                self._loop = EventLoopRunner(background=self.async_collector.persistent_connection)
+            
             logger.info("All components initialized successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize components: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Failed to initialize components: %s", e)
+            logger.error("Traceback: %s", traceback.format_exc())
             return False
     
     def run_complete_pipeline(self) -> Dict:
@@ -681,39 +1069,59 @@ class ScheduledTaskRunner:
             'summary': []
         }
         
+        summary: List[str] = []
         start_time = time.time()
         
-        logger.info("="*80)
-        logger.info(f"Starting Complete Pipeline - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info("="*80)
+        logger.info("%s\nStarting Complete Pipeline - %s\n%s",
+                    "="*80, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), "="*80)
         
         # Phase 1: Async Discord collection (isolated)
         logger.info("\nPhase 1: Discord Data Collection (Async)")
         logger.info("-"*40)
         
         try:
-            # Run Discord collection in isolated event loop
-            csv_file = asyncio.run(self.async_collector.collect_to_csv())
+            # Load existing post links in the background while Discord is collected
+            existing_links = None
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                prefetch = None
+                if self.processor.skip_duplicates:
+                    prefetch = executor.submit(self.processor.load_existing_links)
+                
+                # Run Discord collection on the runner's event loop
+                posts = self._loop.run(self.async_collector.collect_to_memory())
+                
+                if prefetch is not None:
+                    try:
+                        existing_links = prefetch.result()
+                    except Exception as e:
+                        logger.warning("Link prefetch failed, will load during upload: %s", e)
             
-            if csv_file:
-                results['csv_file'] = csv_file
-                results['discord_collection'] = {'success': True, 'csv_file': csv_file}
-                results['summary'].append(f"✅ Discord data collected to: {csv_file}")
+            if posts:
+                # Optionally keep an audit copy of the collected posts
+                csv_file = None
+                if self.config.get('WRITE_CSV_AUDIT', 'false').lower() == 'true':
+                    csv_file = self.async_collector.save_to_csv(posts)
+                    results['csv_file'] = csv_file
                 
-                # Phase 2: CSV to Google Sheets (Sync)
-                logger.info("\nPhase 2: CSV to Google Sheets (Sync)")
+                results['discord_collection'] = {'success': True, 'posts': len(posts), 'csv_file': csv_file}
+                summary.append(f"✅ Collected {len(posts)} posts from Discord")
+                if csv_file:
+                    summary.append(f"✅ Audit CSV written to: {csv_file}")
+                
+                # Phase 2: Posts to Google Sheets (Sync)
+                logger.info("\nPhase 2: Posts to Google Sheets (Sync)")
                 logger.info("-"*40)
                 
-                sheets_results = self.processor.process_csv_to_sheets(csv_file)
+                sheets_results = self.processor.process_posts_to_sheets(posts, existing_links)
                 results['sheets_upload'] = sheets_results
                 
                 if sheets_results['success']:
-                    results['summary'].append(
+                    summary.append(
                         f"✅ Uploaded {sheets_results['uploaded']} posts "
                         f"({sheets_results['duplicates']} duplicates skipped)"
                     )
                 else:
-                    results['summary'].append(f"❌ Sheets upload failed: {sheets_results['errors']}")
+                    summary.append(f"❌ Sheets upload failed: {sheets_results['errors']}")
                 
                 # Phase 3: Gemini AI Analysis (Sync)
                 logger.info("\nPhase 3: Gemini AI Analysis (Sync)")
@@ -727,34 +1135,42 @@ class ScheduledTaskRunner:
                 
                 if ai_results['success']:
                     if ai_results['posts_analyzed'] > 0:
-                        results['summary'].append(
+                        summary.append(
                             f"✅ Analyzed {ai_results['posts_analyzed']} posts, "
                             f"found {ai_results['projects_found']} projects"
                         )
                     else:
-                        results['summary'].append("ℹ️  No new posts to analyze (all previously processed)")
+                        summary.append("ℹ️  No new posts to analyze (all previously processed)")
                 else:
                     if skip_ai and any("rate" in err.lower() or "quota" in err.lower() for err in ai_results.get('errors', [])):
-                        results['summary'].append("⚠️  AI analysis skipped due to rate limiting")
+                        summary.append("⚠️  AI analysis skipped due to rate limiting")
                         # Don't fail the pipeline for rate limits if configured to skip
                         ai_results['success'] = True
                     else:
-                        results['summary'].append(f"❌ AI analysis failed: {ai_results['errors']}")
+                        summary.append(f"❌ AI analysis failed: {ai_results['errors']}")
                 
                 # Phase 4: Publishing (Sync)
                 logger.info("\nPhase 4: Publishing (Sync)")
                 logger.info("-"*40)
                 
-                pub_results = self.processor.run_publisher()
+                if self.config.get('PARALLEL_PHASES', 'false').lower() == 'true':
+                    # Archive sheet setup is independent of publishing, so overlap it; the
+                    # archive itself still runs after publishing since it moves the draft row
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        archive_prep = executor.submit(self.processor.prepare_archiver)
+                        pub_results = self.processor.run_publisher()
+                        archive_prep.result()
+                else:
+                    pub_results = self.processor.run_publisher()
                 results['publishing'] = pub_results
                 
                 if pub_results['success']:
                     if pub_results['published']:
-                        results['summary'].append(f"✅ Published successfully: {pub_results['url']}")
+                        summary.append(f"✅ Published successfully: {pub_results['url']}")
                     else:
-                        results['summary'].append("ℹ️  No draft available to publish")
+                        summary.append("ℹ️  No draft available to publish")
                 else:
-                    results['summary'].append(f"❌ Publishing failed: {pub_results['errors']}")
+                    summary.append(f"❌ Publishing failed: {pub_results['errors']}")
                 
                 # Phase 5: Archive & Cleanup (Sync)
                 logger.info("\nPhase 5: Archive & Cleanup (Sync)")
@@ -764,13 +1180,14 @@ class ScheduledTaskRunner:
                 results['archive'] = archive_results
                 
                 if archive_results['success']:
-                    results['summary'].append(f"✅ Archived {archive_results['posts_archived']} posts")
+                    summary.append(f"✅ Archived {archive_results['posts_archived']} posts")
                 else:
-                    results['summary'].append(f"❌ Archive failed: {archive_results['errors']}")
+                    summary.append(f"❌ Archive failed: {archive_results['errors']}")
                 
-                # Cleanup CSV
-                self.processor.cleanup_csv(csv_file)
-                results['summary'].append(f"✅ CSV moved to processed directory")
+                # Cleanup audit CSV
+                if csv_file:
+                    self.processor.cleanup_csv(csv_file)
+                    summary.append(f"✅ CSV moved to processed directory")
                 
                 # Overall success if key phases succeeded
                 results['overall_success'] = all([
@@ -781,30 +1198,36 @@ class ScheduledTaskRunner:
                 
             else:
                 results['discord_collection'] = {'success': False, 'error': 'No data collected'}
-                results['summary'].append("ℹ️  No Discord data to process")
+                summary.append("ℹ️  No Discord data to process")
                 results['overall_success'] = True  # Not a failure, just no data
                 
         except Exception as e:
-            logger.error(f"Pipeline error: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            results['summary'].append(f"❌ Pipeline error: {e}")
+            logger.error("Pipeline error: %s", e)
+            logger.error("Traceback: %s", traceback.format_exc())
+            summary.append(f"❌ Pipeline error: {e}")
+        
+        results['summary'] = summary
         
         # Calculate runtime
         runtime = time.time() - start_time
         
-        # Log summary
-        logger.info("="*80)
-        logger.info("Pipeline Complete")
-        logger.info("-"*80)
-        for line in results['summary']:
-            logger.info(line)
-        logger.info(f"\nOverall Status: {'✅ SUCCESS' if results['overall_success'] else '❌ FAILED'}")
-        logger.info(f"Runtime: {runtime:.1f} seconds")
-        logger.info("="*80)
+        # Log summary as a single multi-line record
+        logger.info("%s\nPipeline Complete\n%s\n%s\n\nOverall Status: %s\nRuntime: %.1f seconds\n%s",
+                    "="*80, "-"*80, "\n".join(summary),
+                    '✅ SUCCESS' if results['overall_success'] else '❌ FAILED', runtime, "="*80)
         
         return results
     
+    def _close_loop(self):
+        """Disconnect from Discord, close the shared event loop and the link store on shutdown"""
+        if self._loop and not self._loop.is_closed():
+            if self.async_collector:
+                self._loop.run(self.async_collector.close())
+            self._loop.close()
+        self._loop = None
+        if self.processor:
+            self.processor.close()
+    
     def run_manual(self) -> Dict:
         """
         Run the pipeline once manually
@@ -820,22 +1243,30 @@ class ScheduledTaskRunner:
                 'error': 'Failed to initialize components'
             }
         
-        return self.run_complete_pipeline()
+        try:
+            return self.run_complete_pipeline()
+        finally:
+            self._close_loop()
     
     def schedule_daily(self):
         """Set up daily scheduling"""
         schedule_time = self.config.get('SCHEDULE_TIME', '20:00')
         
-        # Schedule the task
-        schedule.every().day.at(schedule_time).do(self.run_complete_pipeline)
+        # Schedule the task in the configured timezone so DST shifts don't move the run
+        job = schedule.every().day
+        if self.timezone:
+            job.at(schedule_time, self.timezone).do(self.run_complete_pipeline)
+        else:
+            job.at(schedule_time).do(self.run_complete_pipeline)
         
         # Log scheduling info
-        logger.info(f"Scheduled daily pipeline run at {schedule_time}")
+        logger.info("Scheduled daily pipeline run at %s (%s)", schedule_time,
+                    self.timezone.zone if self.timezone else "system timezone")
         
         # Log next run time
         next_run = schedule.next_run()
         if next_run:
-            logger.info(f"Next scheduled run: {next_run}")
+            logger.info("Next scheduled run: %s", next_run)
     
     def start(self):
         """Start the scheduler daemon"""
@@ -853,13 +1284,21 @@ class ScheduledTaskRunner:
         
         while not self._shutdown:
             try:
+                # Sleep until the next job is due (or a shutdown signal arrives)
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    idle = 3600
+                if idle > 0:
+                    self._shutdown_event.wait(idle)
+                if self._shutdown:
+                    break
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
             except KeyboardInterrupt:
                 logger.info("Received interrupt signal")
                 break
             except Exception as e:
-                logger.error(f"Error in scheduler loop: {e}")
+                logger.error("Error in scheduler loop: %s", e)
                 # Continue running despite errors
         
+        self._close_loop()
         logger.info("Scheduler stopped")
\ No newline at end of file
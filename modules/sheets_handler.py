@@ -3,19 +3,98 @@ Google Sheets handler for uploading Discord post data.
 Handles authentication, CSV reading, and batch uploads to Google Sheets.
 """
 
+import codecs
 import csv
+import json
 import logging
+import mmap
+import os
+import random
+import re
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from itertools import chain, islice
+from typing import List, Optional, Dict, Any, Iterable, Iterator
 
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional: faster CSV parsing when installed
+    pa = pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+# A1 range that begins on row 1 (e.g. 'A1:F20' or 'A1')
+FIRST_ROW_RANGE = re.compile(r'^[A-Z]+1(?::|$)')
+# Row number that ends an A1 range (e.g. 20 in 'Sheet1!A1:F20')
+LAST_ROW = re.compile(r'(\d+)$')
+# Decode error handler for CSVs, registered below
+CSV_DECODE_ERRORS = 'csv_cp1252_fallback'
+
+
+def _cp1252_fallback(error: UnicodeDecodeError) -> tuple:
+    """
+    Decode bytes the detected encoding rejects as cp1252 instead of failing.
+    
+    The encoding is picked from a probe of the start of the file, so a
+    Windows-exported character further in would otherwise stop an upload
+    partway through.
+    
+    Args:
+        error: The decode error
+        
+    Returns:
+        Replacement text and the position to resume decoding from
+    """
+    bad = error.object[error.start:error.end]
+    return bad.decode('cp1252', errors='replace'), error.end
+
+
+codecs.register_error(CSV_DECODE_ERRORS, _cp1252_fallback)
+
+
+def column_letter(col_index: int) -> str:
+    """
+    Convert a 0-based column index to its A1 column letter.
+    
+    Args:
+        col_index: 0-based column index (0 -> A, 25 -> Z, 26 -> AA)
+        
+    Returns:
+        Column letter(s) in A1 notation
+    """
+    letters = ''
+    col_index += 1
+    while col_index > 0:
+        col_index, remainder = divmod(col_index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+@lru_cache(maxsize=8)
+def _load_credentials(credentials_path: str, mtime_ns: int, scopes: tuple) -> Credentials:
+    """
+    Load service account credentials, reusing them across handlers.
+    
+    The file's modification time is part of the cache key, so a replaced
+    key file is read again.
+    
+    Args:
+        credentials_path: Path to service account JSON credentials
+        mtime_ns: Modification time of the credentials file
+        scopes: OAuth scopes to request
+        
+    Returns:
+        Service account credentials
+    """
+    return Credentials.from_service_account_file(credentials_path, scopes=list(scopes))
+
 
 class GoogleSheetsHandler:
     """Handler for Google Sheets operations."""
@@ -23,6 +102,13 @@ class GoogleSheetsHandler:
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # Initial delay in seconds
+    MAX_RETRY_DELAY = 32  # Cap on a single backoff delay in seconds
+    RETRY_BUDGET = 60  # Total seconds one request may spend waiting on retries
+    RETRYABLE_STATUS = (429, 503)
+    MAX_REQUEST_BYTES = 9 * 1024 * 1024  # Headroom under the ~10 MB request limit
+    ENCODING_PROBE_BYTES = 64 * 1024
+    ARROW_BLOCK_SIZE = 8 << 20  # Bytes parsed per Arrow record batch
+    TAIL_ROWS = 200  # Rows read on each side of the last known data row to find the last entry
     
     def __init__(self, credentials_path: str, sheet_id: str):
         """
@@ -35,6 +121,13 @@ class GoogleSheetsHandler:
         self.credentials_path = Path(credentials_path)
         self.sheet_id = sheet_id
         self.service = None
+        self._spreadsheets = None  # Cached service.spreadsheets() resource
+        self._values = None  # Cached spreadsheets().values() resource
+        self._column_letters: Dict[tuple, str] = {}
+        self._header_cache: Dict[str, List[str]] = {}  # sheet name -> known header row
+        self._sheet_ids: Dict[str, int] = {}  # sheet name -> numeric sheetId
+        self._ranges: Dict[str, Dict[str, str]] = {}  # sheet name -> fixed A1 ranges
+        self._last_rows: Dict[str, int] = {}  # sheet name -> last data row this handler saw
         
         if not self.credentials_path.exists():
             raise FileNotFoundError(
@@ -47,51 +140,190 @@ class GoogleSheetsHandler:
     def _authenticate(self) -> None:
         """Authenticate with Google Sheets API using service account."""
         try:
-            credentials = Credentials.from_service_account_file(
-                str(self.credentials_path),
-                scopes=self.SCOPES
+            credentials = _load_credentials(
+                str(self.credentials_path.resolve()),
+                self.credentials_path.stat().st_mtime_ns,
+                tuple(self.SCOPES)
             )
-            self.service = build('sheets', 'v4', credentials=credentials)
+            # Use the discovery document bundled with the client library
+            # instead of fetching it over HTTP
+            self.service = build('sheets', 'v4', credentials=credentials,
+                                 static_discovery=True, cache_discovery=False)
+            # Resource objects are rebuilt on every attribute walk, so keep the ones used per call
+            self._spreadsheets = self.service.spreadsheets()
+            self._values = self._spreadsheets.values()
             logger.info("Successfully authenticated with Google Sheets API")
         except Exception as e:
             logger.error(f"Failed to authenticate with Google Sheets: {e}")
             raise
     
-    def read_csv(self, file_path: Path) -> List[List[str]]:
+    def _detect_encoding(self, file_path: Path) -> str:
         """
-        Read CSV file and return as list of lists.
+        Pick the CSV encoding from a probe of the start of the file.
         
         Args:
             file_path: Path to CSV file
             
         Returns:
-            List of rows from CSV file
+            Encoding named by a byte order mark, else 'utf-8' if the probe
+            decodes as UTF-8, otherwise 'cp1252'
+        """
+        with open(file_path, 'rb') as file:
+            probe = file.read(self.ENCODING_PROBE_BYTES)
+        
+        if probe.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if probe.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        
+        try:
+            # Incremental decode so a character split at the probe boundary is not an error
+            codecs.getincrementaldecoder('utf-8')().decode(probe, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            # Non-UTF-8 CSVs are almost always Windows exports
+            return 'cp1252'
+    
+    def iter_csv(self, file_path: Path, encoding: Optional[str] = None) -> Iterator[List[str]]:
+        """
+        Stream rows from a CSV file without loading it into memory.
+        
+        Args:
+            file_path: Path to CSV file
+            encoding: Text encoding (detected from the file if not given)
+            
+        Returns:
+            Iterator over rows from CSV file
         """
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
         
-        rows = []
-        encodings = ['utf-8', 'latin-1', 'cp1252']
+        encoding = encoding or self._detect_encoding(file_path)
         
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as file:
-                    reader = csv.reader(file)
-                    rows = list(reader)
-                    logger.info(f"Successfully read {len(rows)} rows from {file_path}")
-                    return rows
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                logger.error(f"Error reading CSV with {encoding}: {e}")
-                continue
+        def rows() -> Iterator[List[str]]:
+            yielded = 0
+            if pa_csv is not None:
+                try:
+                    for row in self._iter_csv_arrow(file_path, encoding):
+                        yield row
+                        yielded += 1
+                    return
+                except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+                    # Arrow decodes strictly; the csv module recovers bad bytes
+                    logger.warning(f"Arrow could not parse {file_path}, using csv module: {e}")
+            
+            # Resume after any rows Arrow already produced. Arrow skips blank
+            # lines where csv yields [], so drop those before counting
+            reader = csv.reader(self._iter_lines(file_path, encoding))
+            yield from islice(filter(None, reader), yielded, None)
+        
+        return rows()
+    
+    def _iter_lines(self, file_path: Path, encoding: str) -> Iterator[str]:
+        """
+        Decode lines directly from a memory map of the file.
         
-        raise ValueError(f"Unable to read CSV file {file_path} with any encoding")
+        Pages are read through the OS page cache instead of being copied
+        into a file object's buffer first.
+        
+        Args:
+            file_path: Path to CSV file
+            encoding: Text encoding
+            
+        Returns:
+            Iterator over decoded lines, line endings included
+        """
+        if encoding == 'utf-16':
+            # Splitting on b'\n' would cut two-byte code units apart
+            with open(file_path, 'r', encoding=encoding, errors=CSV_DECODE_ERRORS, newline='') as file:
+                yield from file
+            return
+        
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return  # mmap cannot map an empty file
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from codecs.iterdecode(iter(mapped.readline, b''), encoding, CSV_DECODE_ERRORS)
+    
+    def _iter_csv_arrow(self, file_path: Path, encoding: str) -> Iterator[List[str]]:
+        """
+        Stream CSV rows through pyarrow's parser, one record batch at a time.
+        
+        Every column is read as a string so values round-trip exactly as the
+        csv module would return them.
+        
+        Args:
+            file_path: Path to CSV file
+            encoding: Text encoding
+            
+        Returns:
+            Iterator over rows from CSV file
+        """
+        # Arrow needs the column count up front to disable type inference
+        with open(file_path, 'r', encoding=encoding, errors=CSV_DECODE_ERRORS, newline='') as file:
+            first_row = next(csv.reader(file), None)
+        if not first_row:
+            return
+        
+        names = [f'c{i}' for i in range(len(first_row))]
+        reader = pa_csv.open_csv(
+            str(file_path),
+            read_options=pa_csv.ReadOptions(
+                encoding=encoding, block_size=self.ARROW_BLOCK_SIZE, column_names=names
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in names})
+        )
+        for batch in reader:
+            yield from map(list, zip(*(column.to_pylist() for column in batch.columns)))
+    
+    def read_csv_header(self, file_path: Path) -> Optional[List[str]]:
+        """
+        Read only the header row of a CSV file.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Header row, or None if the file is empty
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        
+        # Plain csv over the mapped file; Arrow would parse a whole block for one row
+        lines = self._iter_lines(file_path, self._detect_encoding(file_path))
+        try:
+            return next(csv.reader(lines), None)
+        finally:
+            lines.close()
+    
+    def read_csv(self, file_path: Path) -> List[List[str]]:
+        """
+        Read CSV file and return as list of lists.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            List of rows from CSV file
+        """
+        try:
+            rows = list(self.iter_csv(file_path))
+        except UnicodeDecodeError:
+            # Bytes past the probed prefix the detected encoding cannot decode
+            rows = list(self.iter_csv(file_path, encoding='latin-1'))
+        
+        logger.info(f"Successfully read {len(rows)} rows from {file_path}")
+        return rows
     
     def _execute_with_retry(self, request: Any) -> Any:
         """
         Execute API request with exponential backoff retry.
         
+        Waits for the server's Retry-After hint when one is sent, otherwise
+        backs off exponentially with jitter. Retries stop once RETRY_BUDGET
+        seconds of waiting would be exceeded.
+        
         Args:
             request: Google API request object
             
@@ -99,17 +331,24 @@ class GoogleSheetsHandler:
             API response
         """
         delay = self.RETRY_DELAY
+        deadline = time.monotonic() + self.RETRY_BUDGET
         
         for attempt in range(self.MAX_RETRIES):
             try:
                 return request.execute()
             except HttpError as e:
-                if e.resp.status == 429:  # Rate limit
-                    if attempt < self.MAX_RETRIES - 1:
-                        logger.warning(f"Rate limited, retrying in {delay} seconds...")
-                        time.sleep(delay)
+                if e.resp.status in self.RETRYABLE_STATUS and attempt < self.MAX_RETRIES - 1:
+                    try:
+                        wait = float(e.resp.get('retry-after'))
+                    except (TypeError, ValueError):  # Missing, or given as an HTTP date
+                        wait = min(max(delay, 0.5), self.MAX_RETRY_DELAY) * random.uniform(0.5, 1.5)
                         delay *= 2  # Exponential backoff
+                    
+                    if time.monotonic() + wait <= deadline:
+                        logger.warning(f"Rate limited, retrying in {wait:g} seconds...")
+                        time.sleep(wait)
                         continue
+                    logger.error(f"Retry budget of {self.RETRY_BUDGET}s exhausted")
                 logger.error(f"HTTP error occurred: {e}")
                 raise
             except Exception as e:
@@ -118,6 +357,52 @@ class GoogleSheetsHandler:
         
         raise Exception(f"Failed after {self.MAX_RETRIES} retries")
     
+    def _sheet_ranges(self, sheet_name: str) -> Dict[str, str]:
+        """
+        Get the fixed A1 ranges for a sheet, formatted once per sheet name.
+        
+        Args:
+            sheet_name: Name of the sheet tab
+            
+        Returns:
+            Mapping of 'all', 'header', 'col_a' and 'a1' to A1 ranges
+        """
+        ranges = self._ranges.get(sheet_name)
+        if ranges is None:
+            ranges = self._ranges[sheet_name] = {
+                'all': f"{sheet_name}!A:Z",
+                'header': f"{sheet_name}!1:1",
+                'col_a': f"{sheet_name}!A:A",
+                'a1': f"{sheet_name}!A1"
+            }
+        return ranges
+    
+    def _get_sheet_id(self, sheet_name: str) -> int:
+        """
+        Get the numeric sheetId of a tab, looking it up once per handler.
+        
+        Args:
+            sheet_name: Name of the sheet tab
+            
+        Returns:
+            The tab's sheetId
+        """
+        if sheet_name not in self._sheet_ids:
+            result = self._execute_with_retry(
+                self._spreadsheets.get(
+                    spreadsheetId=self.sheet_id,
+                    fields='sheets(properties(sheetId,title))'
+                )
+            )
+            for sheet in result.get('sheets', []):
+                properties = sheet['properties']
+                self._sheet_ids[properties['title']] = properties['sheetId']
+            
+            if sheet_name not in self._sheet_ids:
+                raise ValueError(f"Sheet not found: {sheet_name}")
+        
+        return self._sheet_ids[sheet_name]
+    
     def clear_sheet(self, sheet_name: str = 'Sheet1', preserve_headers: bool = True) -> None:
         """
         Clear all data from sheet.
@@ -128,67 +413,134 @@ class GoogleSheetsHandler:
         """
         try:
             if preserve_headers:
-                # Get the header row first
-                range_name = f"{sheet_name}!1:1"
-                result = self._execute_with_retry(
-                    self.service.spreadsheets().values().get(
-                        spreadsheetId=self.sheet_id,
-                        range=range_name
-                    )
-                )
-                headers = result.get('values', [[]])[0] if result.get('values') else []
-                
-                # Clear everything
+                # Clear values below row 1 in one request; the header row is never touched
+                requests = [{
+                    'updateCells': {
+                        'range': {'sheetId': self._get_sheet_id(sheet_name), 'startRowIndex': 1},
+                        'fields': 'userEnteredValue'
+                    }
+                }]
                 self._execute_with_retry(
-                    self.service.spreadsheets().values().clear(
+                    self._spreadsheets.batchUpdate(
                         spreadsheetId=self.sheet_id,
-                        range=sheet_name
+                        body={'requests': requests}
                     )
                 )
-                
-                # Restore headers if they existed
-                if headers:
-                    self._execute_with_retry(
-                        self.service.spreadsheets().values().update(
-                            spreadsheetId=self.sheet_id,
-                            range=f"{sheet_name}!A1",
-                            valueInputOption='RAW',
-                            body={'values': [headers]}
-                        )
-                    )
+                self._last_rows.pop(sheet_name, None)
                 logger.info(f"Cleared sheet {sheet_name}, preserved headers")
             else:
                 # Clear everything
                 self._execute_with_retry(
-                    self.service.spreadsheets().values().clear(
+                    self._values.clear(
                         spreadsheetId=self.sheet_id,
                         range=sheet_name
                     )
                 )
+                self._forget_layout(sheet_name)
                 logger.info(f"Cleared entire sheet {sheet_name}")
         except Exception as e:
             logger.error(f"Failed to clear sheet: {e}")
             raise
     
-    def append_data(self, data: List[List[str]], sheet_name: str = 'Sheet1') -> None:
+    def _forget_layout(self, sheet_name: str) -> None:
+        """
+        Drop cached headers, column letters and last row for a sheet whose header row changed.
+        
+        Args:
+            sheet_name: Name of the sheet tab
+        """
+        self._header_cache.pop(sheet_name, None)
+        self._last_rows.pop(sheet_name, None)
+        self._column_letters = {
+            key: letter for key, letter in self._column_letters.items()
+            if key[0] != sheet_name
+        }
+    
+    def replace_all(self, data: Iterable[List[str]], sheet_name: str = 'Sheet1') -> int:
+        """
+        Replace the sheet's contents with the given rows.
+        
+        The clear and the writes go out together in one spreadsheets.batchUpdate,
+        split only when the payload would exceed MAX_REQUEST_BYTES. Cells are
+        written as strings, matching values.append with RAW input.
+        
+        Args:
+            data: Rows to write, header row first
+            sheet_name: Name of the sheet tab
+            
+        Returns:
+            Number of rows written
+        """
+        sheet_id = self._get_sheet_id(sheet_name)
+        clear_request = {'updateCells': {'range': {'sheetId': sheet_id}, 'fields': 'userEnteredValue'}}
+        
+        def send(cell_rows: List[Dict[str, Any]], clear: bool) -> None:
+            requests = [clear_request] if clear else []
+            if cell_rows:
+                requests.append({
+                    'appendCells': {'sheetId': sheet_id, 'rows': cell_rows, 'fields': 'userEnteredValue'}
+                })
+            self._execute_with_retry(
+                self._spreadsheets.batchUpdate(
+                    spreadsheetId=self.sheet_id,
+                    body={'requests': requests}
+                )
+            )
+        
+        headers = None
+        cell_rows = []
+        chunk_bytes = 0
+        total_rows = 0
+        cleared = False
+        
+        for row in data:
+            if headers is None:
+                headers = row
+            cell_row = {'values': [{'userEnteredValue': {'stringValue': value}} for value in row]}
+            row_bytes = len(json.dumps(cell_row, ensure_ascii=False).encode('utf-8')) + 1
+            if cell_rows and chunk_bytes + row_bytes > self.MAX_REQUEST_BYTES:
+                send(cell_rows, clear=not cleared)
+                cleared = True
+                total_rows += len(cell_rows)
+                cell_rows = []
+                chunk_bytes = 0
+            cell_rows.append(cell_row)
+            chunk_bytes += row_bytes
+        
+        # Always send the last request so an empty upload still clears the sheet
+        send(cell_rows, clear=not cleared)
+        total_rows += len(cell_rows)
+        
+        self._forget_layout(sheet_name)
+        if headers:
+            self._header_cache[sheet_name] = headers
+        self._last_rows[sheet_name] = total_rows
+        
+        logger.info(f"Replaced contents of {sheet_name} with {total_rows} rows")
+        return total_rows
+    
+    def append_data(self, data: List[List[str]], sheet_name: str = 'Sheet1') -> Dict[str, Any]:
         """
         Append data rows to Google Sheet.
         
         Args:
             data: List of rows to append
             sheet_name: Name of the sheet tab
+            
+        Returns:
+            The 'updates' section of the API response
         """
         if not data:
             logger.warning("No data to append")
-            return
+            return {}
         
         try:
             body = {'values': data}
             
             result = self._execute_with_retry(
-                self.service.spreadsheets().values().append(
+                self._values.append(
                     spreadsheetId=self.sheet_id,
-                    range=f"{sheet_name}!A:Z",
+                    range=self._sheet_ranges(sheet_name)['all'],
                     valueInputOption='RAW',
                     insertDataOption='INSERT_ROWS',
                     body=body
@@ -197,32 +549,150 @@ class GoogleSheetsHandler:
             
             updates = result.get('updates', {})
             updated_rows = updates.get('updatedRows', 0)
+            
+            # Rows appended at the top of the sheet start with its header row
+            updated_range = updates.get('updatedRange', '').rsplit('!', 1)[-1]
+            if sheet_name not in self._header_cache and FIRST_ROW_RANGE.match(updated_range):
+                self._header_cache[sheet_name] = data[0]
+            end = LAST_ROW.search(updated_range)
+            if end:
+                self._last_rows[sheet_name] = int(end.group(1))
+            
             logger.info(f"Appended {updated_rows} rows to {sheet_name}")
+            return updates
             
         except Exception as e:
             logger.error(f"Failed to append data: {e}")
             raise
     
-    def batch_append_data(self, data: List[List[str]], sheet_name: str = 'Sheet1', 
-                         batch_size: int = 100) -> None:
+    def batch_append_data(self, data: Iterable[List[str]], sheet_name: str = 'Sheet1') -> None:
         """
-        Append data in batches for large datasets.
+        Append data for large datasets.
+        
+        Rows are sent in a single request and only split when the payload
+        would exceed the API request size limit (see append_all). Any
+        iterable is accepted and consumed lazily, without copying into
+        per-batch lists.
         
         Args:
-            data: List of rows to append
+            data: Rows to append (list or iterator)
             sheet_name: Name of the sheet tab
-            batch_size: Number of rows per batch
         """
-        total_rows = len(data)
+        self.append_all(data, sheet_name)
+    
+    def append_all(self, data: Iterable[List[str]], sheet_name: str = 'Sheet1') -> int:
+        """
+        Append all rows in as few requests as possible.
+        
+        Rows go out in a single values.append call unless the payload would
+        exceed MAX_REQUEST_BYTES, in which case it is split by encoded size.
+        Rows are consumed lazily, so a streamed CSV is never fully in memory.
         
-        for i in range(0, total_rows, batch_size):
-            batch = data[i:i + batch_size]
-            self.append_data(batch, sheet_name)
-            logger.info(f"Processed batch {i//batch_size + 1}/{(total_rows + batch_size - 1)//batch_size}")
+        When split, the first chunk is appended to find where the table ends
+        and the remaining chunks are written to the rows after it, batched
+        together while their combined size stays under MAX_REQUEST_BYTES.
+        
+        Args:
+            data: Rows to append
+            sheet_name: Name of the sheet tab
             
-            # Small delay between batches to avoid rate limits
-            if i + batch_size < total_rows:
-                time.sleep(0.5)
+        Returns:
+            Number of rows appended
+        """
+        chunk = []
+        chunk_bytes = 0
+        total_rows = 0
+        first_updates = None
+        next_row = None
+        pending = []  # (start row, rows) waiting for the next batched call
+        pending_bytes = 0
+        
+        def flush(rows: List[List[str]], rows_bytes: int) -> None:
+            nonlocal first_updates, next_row, pending_bytes
+            if first_updates is None:
+                first_updates = self.append_data(rows, sheet_name)
+                return
+            
+            if next_row is None:
+                end = LAST_ROW.search(first_updates.get('updatedRange', ''))
+                if not end:
+                    # Unknown table end, fall back to sequential appends
+                    self.append_data(rows, sheet_name)
+                    return
+                next_row = int(end.group(1)) + 1
+            
+            # The whole batch travels in one HTTP body, so cap it by size too
+            if pending and pending_bytes + rows_bytes > self.MAX_REQUEST_BYTES:
+                self._write_chunks_batched(pending, sheet_name)
+                pending.clear()
+                pending_bytes = 0
+            
+            pending.append((next_row, rows))
+            pending_bytes += rows_bytes
+            next_row += len(rows)
+        
+        for row in data:
+            row_bytes = len(json.dumps(row, ensure_ascii=False).encode('utf-8')) + 1
+            if chunk and chunk_bytes + row_bytes > self.MAX_REQUEST_BYTES:
+                flush(chunk, chunk_bytes)
+                total_rows += len(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(row)
+            chunk_bytes += row_bytes
+        
+        if chunk:
+            flush(chunk, chunk_bytes)
+            total_rows += len(chunk)
+        elif not total_rows:
+            logger.warning("No data to append")
+        
+        if pending:
+            self._write_chunks_batched(pending, sheet_name)
+        
+        return total_rows
+    
+    def _write_chunks_batched(self, chunks: List[tuple], sheet_name: str) -> None:
+        """
+        Write row chunks to fixed positions in one batched HTTP call.
+        
+        Requests inside a batch may run in any order, so each chunk carries
+        its own start row instead of relying on append.
+        
+        Args:
+            chunks: (start row, rows) pairs
+            sheet_name: Name of the sheet tab
+        """
+        requests = {}
+        failed = []
+        
+        def on_done(request_id, response, exception):
+            if exception is not None:
+                failed.append(request_id)
+        
+        batch = self.service.new_batch_http_request(callback=on_done)
+        for start_row, rows in chunks:
+            request_id = str(start_row)
+            requests[request_id] = self._values.update(
+                spreadsheetId=self.sheet_id,
+                range=f"{sheet_name}!A{start_row}",
+                valueInputOption='RAW',
+                body={'values': rows}
+            )
+            batch.add(requests[request_id], request_id=request_id)
+        
+        self._execute_with_retry(batch)
+        
+        # Retry parts the batch reported as failed (e.g. rate limited) one by one
+        for request_id in failed:
+            logger.warning(f"Batched write at row {request_id} failed, retrying on its own")
+            self._execute_with_retry(requests[request_id])
+        
+        end_row = max(start_row + len(rows) - 1 for start_row, rows in chunks)
+        self._last_rows[sheet_name] = max(self._last_rows.get(sheet_name, 0), end_row)
+        
+        logger.info(f"Wrote {sum(len(rows) for _, rows in chunks)} rows to {sheet_name} "
+                   f"in one batch of {len(chunks)} requests")
     
     def get_last_entry_date(self, sheet_name: str = 'Sheet1') -> Optional[datetime]:
         """
@@ -235,17 +705,38 @@ class GoogleSheetsHandler:
             DateTime of last entry or None if sheet is empty
         """
         try:
-            # Get all values to find the last row
-            result = self._execute_with_retry(
-                self.service.spreadsheets().values().get(
-                    spreadsheetId=self.sheet_id,
-                    range=f"{sheet_name}!A:A"
+            values = None
+            last_row = self._last_rows.get(sheet_name)
+            if last_row is not None:
+                # Read column A around the last row this handler wrote (trailing
+                # blank rows are trimmed); rows added or removed elsewhere since
+                # are still found unless the table end moved outside the window
+                start_row = max(1, last_row - self.TAIL_ROWS + 1)
+                end_row = last_row + self.TAIL_ROWS
+                result = self._execute_with_retry(
+                    self._values.get(
+                        spreadsheetId=self.sheet_id,
+                        range=f"{sheet_name}!A{start_row}:A{end_row}"
+                    )
                 )
-            )
+                window = result.get('values', [])
+                if window and len(window) < end_row - start_row + 1:
+                    values = window
             
-            values = result.get('values', [])
+            if values is None:
+                # Unknown or moved table end: read the whole column once
+                start_row = 1
+                result = self._execute_with_retry(
+                    self._values.get(
+                        spreadsheetId=self.sheet_id,
+                        range=self._sheet_ranges(sheet_name)['col_a']
+                    )
+                )
+                values = result.get('values', [])
             
-            if len(values) <= 1:  # Only headers or empty
+            self._last_rows[sheet_name] = start_row + len(values) - 1
+            
+            if start_row == 1 and len(values) <= 1:  # Only headers or empty
                 logger.info("Sheet is empty or contains only headers")
                 return None
             
@@ -254,8 +745,10 @@ class GoogleSheetsHandler:
             
             if last_date_str:
                 try:
-                    # Parse date in format YYYY-MM-DD
-                    return datetime.strptime(last_date_str, '%Y-%m-%d')
+                    # Parse date in format YYYY-MM-DD; other ISO forms are rejected
+                    if len(last_date_str) != 10:
+                        raise ValueError(last_date_str)
+                    return datetime.fromisoformat(last_date_str)
                 except ValueError:
                     logger.warning(f"Unable to parse date: {last_date_str}")
                     return None
@@ -267,7 +760,7 @@ class GoogleSheetsHandler:
             return None
     
     def update_sheet_from_csv(self, csv_path: Path, sheet_name: str = 'Sheet1',
-                            mode: str = 'append', batch_size: int = 100) -> None:
+                            mode: str = 'append') -> None:
         """
         Update Google Sheet from CSV file.
         
@@ -275,52 +768,40 @@ class GoogleSheetsHandler:
             csv_path: Path to CSV file
             sheet_name: Name of the sheet tab
             mode: 'append' to add to existing data, 'replace' to clear and rewrite
-            batch_size: Number of rows per batch for large files
         """
         logger.info(f"Updating sheet from {csv_path} in {mode} mode")
         
-        # Read CSV data
-        data = self.read_csv(csv_path)
+        # Stream CSV data; the first row holds the headers
+        rows = self.iter_csv(csv_path)
+        headers = next(rows, None)
         
-        if not data:
+        if headers is None:
             logger.warning("CSV file is empty")
             return
         
-        # Separate headers and data rows
-        headers = data[0] if data else []
-        data_rows = data[1:] if len(data) > 1 else []
-        
         if mode == 'replace':
-            # Clear sheet and write everything
-            self.clear_sheet(sheet_name, preserve_headers=False)
-            if headers:
-                self.append_data([headers], sheet_name)
-            if data_rows:
-                self.batch_append_data(data_rows, sheet_name, batch_size)
+            # Clear sheet and write headers and rows in one request
+            data_row_count = self.replace_all(chain([headers], rows), sheet_name) - 1
                 
         elif mode == 'append':
-            # Check if sheet is empty and needs headers
-            result = self._execute_with_retry(
-                self.service.spreadsheets().values().get(
-                    spreadsheetId=self.sheet_id,
-                    range=f"{sheet_name}!1:1"
-                )
-            )
-            
-            existing_headers = result.get('values', [[]])[0] if result.get('values') else []
+            # Check if sheet is empty and needs headers (skipping the read if
+            # this handler already knows the header row)
+            existing_headers = self._header_cache.get(sheet_name)
+            if not existing_headers:
+                existing_headers = self.get_row(1, sheet_name)
+                if existing_headers:
+                    self._header_cache[sheet_name] = existing_headers
             
             if not existing_headers and headers:
-                # Add headers if sheet is empty
-                self.append_data([headers], sheet_name)
-            
-            # Append data rows
-            if data_rows:
-                self.batch_append_data(data_rows, sheet_name, batch_size)
+                # Sheet is empty, send the headers with the data rows
+                data_row_count = self.append_all(chain([headers], rows), sheet_name) - 1
+            else:
+                data_row_count = self.append_all(rows, sheet_name)
         
         else:
             raise ValueError(f"Invalid mode: {mode}. Use 'append' or 'replace'")
         
-        logger.info(f"Successfully updated sheet with {len(data_rows)} data rows")
+        logger.info(f"Successfully updated sheet with {data_row_count} data rows")
     
     def get_sheet_data(self, sheet_name: str = 'Sheet1', 
                       range_notation: str = 'A:Z') -> List[List[str]]:
@@ -337,7 +818,7 @@ class GoogleSheetsHandler:
         try:
             range_name = f"{sheet_name}!{range_notation}"
             result = self._execute_with_retry(
-                self.service.spreadsheets().values().get(
+                self._values.get(
                     spreadsheetId=self.sheet_id,
                     range=range_name
                 )
@@ -351,6 +832,231 @@ class GoogleSheetsHandler:
             logger.error(f"Failed to get sheet data: {e}")
             raise
     
+    def get_row(self, row_index: int, sheet_name: str = 'Sheet1') -> List[str]:
+        """
+        Get a single row from Google Sheet.
+        
+        Args:
+            row_index: Row number to fetch (1-based)
+            sheet_name: Name of the sheet tab
+        
+        Returns:
+            List of cell values in the row (empty list if the row is blank)
+        """
+        if row_index == 1:
+            range_name = self._sheet_ranges(sheet_name)['header']
+        else:
+            range_name = f"{sheet_name}!{row_index}:{row_index}"
+        
+        try:
+            result = self._execute_with_retry(
+                self._values.get(
+                    spreadsheetId=self.sheet_id,
+                    range=range_name
+                )
+            )
+            
+            values = result.get('values', [])
+            return values[0] if values else []
+        
+        except Exception as e:
+            logger.error(f"Failed to get row {row_index}: {e}")
+            raise
+    
+    def get_column_values(self, column_header: str = 'Post Link',
+                          sheet_name: str = 'Sheet1') -> Optional[List[str]]:
+        """
+        Get the data cells of a single column, located by its header.
+        
+        The column letter is resolved from the header row once and cached,
+        so later calls only download the one column. Those calls read the
+        column from row 1 and check its header, re-resolving the letter if
+        the columns have moved since.
+        
+        Args:
+            column_header: Header text to look for (substring match)
+            sheet_name: Name of the sheet tab
+            
+        Returns:
+            Column values below the header (blank cells as ''), or None if
+            the sheet has no such column
+        """
+        cache_key = (sheet_name, column_header)
+        letter = self._column_letters.get(cache_key)
+        
+        try:
+            if letter is not None:
+                column = self._get_column(f"{sheet_name}!{letter}1:{letter}")
+                if column and column_header in column[0]:
+                    logger.info(f"Retrieved {len(column) - 1} '{column_header}' values from {sheet_name}")
+                    return column[1:]
+                
+                logger.info(f"Column '{column_header}' moved in {sheet_name}, resolving it again")
+                self._forget_layout(sheet_name)
+            
+            headers = self.get_row(1, sheet_name)
+            if headers:
+                self._header_cache[sheet_name] = headers
+            header_idx = {header: idx for idx, header in enumerate(headers)}
+            col_index = header_idx.get(column_header, -1)
+            if col_index < 0:
+                # Fall back to a substring match for decorated headers
+                col_index = next(
+                    (idx for idx, header in enumerate(headers) if column_header in header),
+                    -1
+                )
+            if col_index < 0:
+                return None
+            letter = column_letter(col_index)
+            self._column_letters[cache_key] = letter
+            
+            column = self._get_column(f"{sheet_name}!{letter}2:{letter}")
+            logger.info(f"Retrieved {len(column)} '{column_header}' values from {sheet_name}")
+            return column
+            
+        except Exception as e:
+            logger.error(f"Failed to get column '{column_header}': {e}")
+            raise
+    
+    def _get_column(self, range_name: str) -> List[str]:
+        """
+        Read a single-column range.
+        
+        Args:
+            range_name: A1 range of one column, including the sheet name
+            
+        Returns:
+            Cell values in the range (blank cells as '')
+        """
+        result = self._execute_with_retry(
+            self._values.get(
+                spreadsheetId=self.sheet_id,
+                range=range_name,
+                majorDimension='COLUMNS'
+            )
+        )
+        values = result.get('values', [])
+        return values[0] if values else []
+    
+    def has_headers(self, sheet_name: str = 'Sheet1') -> bool:
+        """
+        Check whether the sheet has a header row, reading only row 1.
+        
+        Args:
+            sheet_name: Name of the sheet tab
+            
+        Returns:
+            True if the first row contains any values
+        """
+        if self._header_cache.get(sheet_name):
+            return True
+        
+        headers = self.get_row(1, sheet_name)
+        if headers:
+            self._header_cache[sheet_name] = headers
+        return bool(headers)
+    
+    def update_values(self, range_notation: str, values: List[List[str]],
+                      sheet_name: str = 'Sheet1') -> None:
+        """
+        Overwrite only the given range in Google Sheet.
+        
+        Args:
+            range_notation: A1 notation of the range to write (e.g. 'H2' or 'A1:C1')
+            values: Rows of cell values to write
+            sheet_name: Name of the sheet tab
+        """
+        try:
+            self._execute_with_retry(
+                self._values.update(
+                    spreadsheetId=self.sheet_id,
+                    range=f"{sheet_name}!{range_notation}",
+                    valueInputOption='RAW',
+                    body={'values': values}
+                )
+            )
+            if FIRST_ROW_RANGE.match(range_notation):
+                # The header row changed, re-read it next time it's needed
+                self._header_cache.pop(sheet_name, None)
+            logger.info(f"Updated {sheet_name}!{range_notation}")
+        
+        except Exception as e:
+            logger.error(f"Failed to update {range_notation}: {e}")
+            raise
+    
+    def update_row(self, row_index: int, row: List[str], sheet_name: str = 'Sheet1') -> None:
+        """
+        Overwrite a single row in Google Sheet.
+        
+        Args:
+            row_index: Row number to write (1-based)
+            row: Cell values for the row, starting at column A
+            sheet_name: Name of the sheet tab
+        """
+        self.update_values(f"A{row_index}", [row], sheet_name)
+    
+    def batch_update(self, data: List[Dict[str, Any]], value_input_option: str = 'RAW') -> None:
+        """
+        Write several ranges in a single values.batchUpdate request.
+        
+        Args:
+            data: List of {'range': A1 range, 'values': rows} dicts
+            value_input_option: How input data should be interpreted ('RAW' or 'USER_ENTERED')
+        """
+        if not data:
+            logger.warning("No ranges to update")
+            return
+        
+        try:
+            result = self._execute_with_retry(
+                self._values.batchUpdate(
+                    spreadsheetId=self.sheet_id,
+                    body={
+                        'valueInputOption': value_input_option,
+                        'data': data
+                    }
+                )
+            )
+            
+            updated_cells = result.get('totalUpdatedCells', 0)
+            logger.info(f"Batch updated {len(data)} ranges ({updated_cells} cells)")
+            
+        except Exception as e:
+            logger.error(f"Failed to batch update: {e}")
+            raise
+    
+    def write_with_headers(self, headers: List[str], rows: List[List[str]],
+                           sheet_name: str = 'Sheet1') -> None:
+        """
+        Write a header row and data rows to an empty sheet in one request.
+        
+        The header row is cached, so later header checks need no read.
+        
+        Args:
+            headers: Header row to write to row 1
+            rows: Data rows to write from row 2
+            sheet_name: Name of the sheet tab
+        """
+        self.batch_update([
+            {'range': self._sheet_ranges(sheet_name)['a1'], 'values': [headers]},
+            {'range': f"{sheet_name}!A2", 'values': rows}
+        ])
+        self._header_cache[sheet_name] = list(headers)
+        self._last_rows[sheet_name] = 1 + len(rows)
+    
+    def update_cell(self, row_index: int, col_index: int, value: str,
+                    sheet_name: str = 'Sheet1') -> None:
+        """
+        Overwrite a single cell in Google Sheet.
+        
+        Args:
+            row_index: Row number to write (1-based)
+            col_index: Column index to write (0-based)
+            value: Cell value
+            sheet_name: Name of the sheet tab
+        """
+        self.update_values(f"{column_letter(col_index)}{row_index}", [[value]], sheet_name)
+    
     def validate_csv_structure(self, csv_path: Path, 
                               expected_columns: List[str]) -> bool:
         """
@@ -364,13 +1070,11 @@ class GoogleSheetsHandler:
             True if structure matches, False otherwise
         """
         try:
-            data = self.read_csv(csv_path)
-            if not data:
+            headers = self.read_csv_header(csv_path)
+            if headers is None:
                 logger.warning("CSV is empty")
                 return False
             
-            headers = data[0]
-            
             if headers != expected_columns:
                 logger.warning(
                     f"CSV structure mismatch. Expected: {expected_columns}, "
@@ -8,13 +8,15 @@ This module orchestrates the complete pipeline:
 4. Archiving processed posts
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from modules.sheets_handler import GoogleSheetsHandler
 from modules.gemini_analyzer import GeminiAnalyzer, SheetAnalyzer
-from modules.x_publisher import create_publisher, SheetPublisher
+from modules.x_publisher import create_publishers_async, SheetPublisher
 from modules.archive_handler import ArchiveHandler
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,8 @@ class WorkflowOrchestrator:
         self,
         sheets_handler: GoogleSheetsHandler,
         gemini_api_key: str = None,
-        publisher_config: Dict = None
+        publisher_config: Union[Dict, List[Dict]] = None,
+        parallel_phases: bool = False
     ):
         """
         Initialize the workflow orchestrator
@@ -35,11 +38,15 @@ class WorkflowOrchestrator:
         Args:
             sheets_handler: GoogleSheetsHandler instance
             gemini_api_key: Optional Gemini API key for AI analysis
-            publisher_config: Optional config for X/Typefully publishing
+            publisher_config: Optional config for X/Typefully publishing, or a
+                list of configs to publish with several publishers at once
+            parallel_phases: Prepare the Archives sheet while analysis and publishing run
         """
         self.sheets = sheets_handler
         self.gemini_api_key = gemini_api_key
         self.publisher_config = publisher_config or {}
+        self.publishers = []
+        self.parallel_phases = parallel_phases
         
         # Initialize components
         self.gemini = None
@@ -54,32 +61,39 @@ class WorkflowOrchestrator:
             except Exception as e:
                 logger.error(f"Failed to initialize Gemini: {e}")
         
-        # Initialize publisher if config provided
-        if publisher_config and publisher_config.get('type'):
+        # Initialize publishers if config provided, authenticating them concurrently
+        configs = publisher_config if isinstance(publisher_config, list) else [publisher_config]
+        configs = [self._publisher_kwargs(config) for config in configs if config and config.get('type')]
+        configs = [config for config in configs if config]
+        if configs:
             try:
-                self.publisher = self._create_publisher(publisher_config)
-                logger.info(f"Publisher initialized: {publisher_config['type']}")
+                self.publishers = asyncio.run(create_publishers_async(configs))
+                if self.publishers:
+                    self.publisher = self.publishers[0]
+                    logger.info(f"Publishers initialized: {', '.join(c['type'] for c in configs)}")
             except Exception as e:
                 logger.error(f"Failed to initialize publisher: {e}")
     
-    def _create_publisher(self, config: Dict):
-        """Create publisher based on configuration"""
+    def _publisher_kwargs(self, config: Dict) -> Optional[Dict]:
+        """Map a publisher config to create_publishers_async arguments"""
         pub_type = config.get('type', '').lower()
         
         if pub_type == 'twitter' or pub_type == 'x':
-            return create_publisher(
-                'twitter',
-                api_key=config.get('api_key'),
-                api_secret=config.get('api_secret'),
-                access_token=config.get('access_token'),
-                access_token_secret=config.get('access_token_secret')
-            )
+            return {
+                'type': 'twitter',
+                'api_key': config.get('api_key'),
+                'api_secret': config.get('api_secret'),
+                'access_token': config.get('access_token'),
+                'access_token_secret': config.get('access_token_secret'),
+                'rate_limit_redis_url': config.get('rate_limit_redis_url')
+            }
         elif pub_type == 'typefully':
-            return create_publisher(
-                'typefully',
-                api_key=config.get('api_key'),
-                hours_delay=config.get('hours_delay', 0)
-            )
+            return {
+                'type': 'typefully',
+                'api_key': config.get('api_key'),
+                'hours_delay': config.get('hours_delay', 0),
+                'rate_limit_redis_url': config.get('rate_limit_redis_url')
+            }
         else:
             logger.warning(f"Unknown publisher type: {pub_type}")
             return None
@@ -107,7 +121,7 @@ class WorkflowOrchestrator:
             analyzer = SheetAnalyzer(self.sheets, self.gemini)
             
             # Ensure columns exist
-            ai_summary_col, ai_processed_col, daily_draft_col = analyzer.ensure_columns_exist()
+            ai_summary_col, ai_processed_col, daily_draft_col, ai_keywords_col = analyzer.ensure_columns_exist()
             
             # Analyze all rows
             project_summaries, all_processed = analyzer.analyze_all_rows()
@@ -115,16 +129,12 @@ class WorkflowOrchestrator:
             results['projects_found'] = len(project_summaries)
             results['posts_analyzed'] = len(all_processed)
             
-            # Write summaries and mark processed
-            if all_processed:
-                analyzer.write_summaries(all_processed, ai_summary_col, ai_processed_col)
+            # Write summaries, mark processed and write the daily draft in one batchUpdate
+            if all_processed or project_summaries:
+                analyzer.write_analysis_results(all_processed, project_summaries, ai_summary_col,
+                                                ai_processed_col, daily_draft_col, ai_keywords_col)
                 logger.info(f"Wrote {len(all_processed)} AI summaries/statuses")
             
-            # Generate and write daily draft
-            if project_summaries:
-                analyzer.generate_and_write_daily_draft(project_summaries, daily_draft_col)
-                logger.info("Generated daily draft")
-            
             results['success'] = True
             logger.info(f"Analysis complete: {results['projects_found']} projects, "
                        f"{results['posts_analyzed']} posts analyzed")
@@ -157,29 +167,21 @@ class WorkflowOrchestrator:
         try:
             logger.info("Starting publishing workflow...")
             
-            # Create SheetPublisher wrapper
-            sheet_publisher = SheetPublisher(self.publisher, self.sheets)
-            
-            # Find first row with daily draft
-            sheet_data = self.sheets.get_sheet_data()
-            
-            if len(sheet_data) < 2:
-                results['errors'].append("No data rows in sheet")
-                return results
+            # Create SheetPublisher wrapper, publishing with every publisher at once
+            sheet_publisher = SheetPublisher(self.publishers or self.publisher, self.sheets)
             
-            headers = sheet_data[0]
-            draft_col_idx = headers.index('Daily Post Draft') if 'Daily Post Draft' in headers else -1
+            # Find first row with daily draft, downloading only the draft column
+            drafts = self.sheets.get_column_values('Daily Post Draft')
             
-            if draft_col_idx == -1:
+            if drafts is None:
                 results['errors'].append("Daily Post Draft column not found")
                 return results
             
             # Find first non-empty draft
-            row_to_publish = None
-            for idx, row in enumerate(sheet_data[1:], start=2):
-                if len(row) > draft_col_idx and row[draft_col_idx] and row[draft_col_idx].strip():
-                    row_to_publish = idx
-                    break
+            row_to_publish = next(
+                (idx for idx, draft in enumerate(drafts, start=2) if draft and draft.strip()),
+                None
+            )
             
             if not row_to_publish:
                 logger.info("No draft found to publish")
@@ -198,6 +200,10 @@ class WorkflowOrchestrator:
                 results['url'] = publish_result.url
                 results['post_id'] = publish_result.post_id
                 logger.info(f"Published successfully: {publish_result.url or publish_result.post_id}")
+                if publish_result.error_msg:
+                    # Some publishers failed while another succeeded
+                    results['errors'].append(publish_result.error_msg)
+                    logger.error(f"Publishing partly failed: {publish_result.error_msg}")
             else:
                 results['errors'].append(publish_result.error_msg)
                 logger.error(f"Publishing failed: {publish_result.error_msg}")
@@ -208,6 +214,26 @@ class WorkflowOrchestrator:
         
         return results
     
+    def prepare_archiver(self) -> bool:
+        """
+        Make sure the Archives sheet is ready before the archive run
+        
+        Uses its own Sheets client so it can run in a worker thread during
+        analysis and publishing.
+        
+        Returns:
+            True if the Archives sheet is ready
+        """
+        try:
+            archive_sheets = GoogleSheetsHandler(str(self.sheets.credentials_path), self.sheets.sheet_id)
+            archiver = ArchiveHandler(archive_sheets)
+            ready = archiver.ensure_archive_sheet_exists()
+            self.archiver = archiver
+            return ready
+        except Exception as e:
+            logger.error(f"Failed to prepare archiver: {e}")
+            return False
+    
     def run_archiving(self) -> Dict:
         """
         Run archive workflow
@@ -241,6 +267,54 @@ class WorkflowOrchestrator:
         logger.info("Starting complete workflow")
         logger.info("="*60)
         
+        if self.parallel_phases:
+            # Archive sheet setup only touches the Archives tab, so overlap it with
+            # analysis and publishing; the archive itself still runs last since it
+            # moves processed rows and clears the draft
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                archive_prep = executor.submit(self.prepare_archiver)
+                self._run_analysis_and_publishing(results)
+                archive_prep.result()
+        else:
+            self._run_analysis_and_publishing(results)
+        
+        # Step 3: Archiving (always runs)
+        logger.info("Step 3: Running archive workflow...")
+        results['archiving'] = self.run_archiving()
+        
+        if results['archiving']['success']:
+            results['summary'].append(
+                f"✅ Archived {results['archiving']['posts_archived']} posts"
+            )
+        else:
+            results['summary'].append(
+                f"❌ Archiving failed: {results['archiving']['errors']}"
+            )
+        
+        # Determine overall success
+        results['overall_success'] = all([
+            results['analysis']['success'] if results['analysis'] else True,
+            results['publishing']['success'] if results['publishing'] else True,
+            results['archiving']['success'] if results['archiving'] else False
+        ])
+        
+        # Log summary
+        logger.info("="*60)
+        logger.info("Workflow Complete")
+        logger.info("-"*60)
+        for line in results['summary']:
+            logger.info(line)
+        logger.info("="*60)
+        
+        return results
+    
+    def _run_analysis_and_publishing(self, results: Dict) -> None:
+        """
+        Run the analysis and publishing steps, recording them in results
+        
+        Args:
+            results: Workflow results dictionary to update
+        """
         # Step 1: AI Analysis (optional)
         if self.gemini:
             logger.info("Step 1: Running AI analysis...")
@@ -280,36 +354,6 @@ class WorkflowOrchestrator:
         else:
             logger.info("Step 2: Skipping publishing (not configured)")
             results['summary'].append("⏭️  Publishing skipped (not configured)")
-        
-        # Step 3: Archiving (always runs)
-        logger.info("Step 3: Running archive workflow...")
-        results['archiving'] = self.run_archiving()
-        
-        if results['archiving']['success']:
-            results['summary'].append(
-                f"✅ Archived {results['archiving']['posts_archived']} posts"
-            )
-        else:
-            results['summary'].append(
-                f"❌ Archiving failed: {results['archiving']['errors']}"
-            )
-        
-        # Determine overall success
-        results['overall_success'] = all([
-            results['analysis']['success'] if results['analysis'] else True,
-            results['publishing']['success'] if results['publishing'] else True,
-            results['archiving']['success'] if results['archiving'] else False
-        ])
-        
-        # Log summary
-        logger.info("="*60)
-        logger.info("Workflow Complete")
-        logger.info("-"*60)
-        for line in results['summary']:
-            logger.info(line)
-        logger.info("="*60)
-        
-        return results
     
     def run_daily_task(self) -> Dict:
         """
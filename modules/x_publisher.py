@@ -5,16 +5,115 @@ Publishes AI-generated daily summaries to X (Twitter) using either
 X API v2 directly or Typefully API for scheduled publishing.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import random
+import re
 import time
+import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, Optional, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing when installed
+    orjson = None
+
+try:
+    import redis
+except ImportError:  # Optional: rate limits shared between worker processes
+    redis = None
+
+try:
+    import aiohttp
+except ImportError:  # Optional: non-blocking Typefully requests (ships with discord.py)
+    aiohttp = None
 
 logger = logging.getLogger(__name__)
 
+# Keys an error body is inspected for; bodies without them are not parsed
+ERROR_KEY_MARKERS = (b'"error"', b'"message"')
+
+# HTTP statuses the Typefully drafts endpoints answer with on success
+_OK_STATUS = frozenset((200, 201))
+
+# Known X API failures, matched anywhere in the exception text
+X_API_ERROR_PATTERN = re.compile(
+    r'(?P<rate_limit>rate limit|429)|(?P<unauthorized>unauthorized|401)|(?P<forbidden>forbidden|403)',
+    re.IGNORECASE
+)
+X_API_ERROR_MESSAGES = {
+    'rate_limit': "X API rate limit exceeded",
+    'unauthorized': "Authentication failed - check credentials",
+    'forbidden': "Forbidden - check app permissions",
+}
+
+
+def _parse_response_body(body: bytes, success: bool) -> dict:
+    """
+    Parse an API response body into a dict
+    
+    Args:
+        body: Raw response bytes
+        success: Whether the request succeeded (error bodies are only parsed
+            if they mention a key we report)
+        
+    Returns:
+        Parsed JSON object, or {} if there is nothing usable
+    """
+    if not success and not any(marker in body for marker in ERROR_KEY_MARKERS):
+        return {}
+    
+    try:
+        data = orjson.loads(body) if orjson else json.loads(body)
+    except ValueError:  # orjson.JSONDecodeError is a ValueError too
+        return {}
+    
+    return data if isinstance(data, dict) else {}
+
+
+def _x_length(text: str) -> int:
+    """
+    Length of text as X counts it, in UTF-16 code units
+    
+    Characters outside the Basic Multilingual Plane (most emoji) take two
+    units, so this can exceed len(text).
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Number of UTF-16 code units
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-16-le')) // 2
+
+
+@lru_cache(maxsize=1)
+def _tweepy():
+    """
+    Import tweepy on first use
+    
+    Returns:
+        The tweepy module, or None if it is not installed (reported once)
+    """
+    try:
+        import tweepy
+    except ImportError:
+        logger.error("tweepy not installed. Run: pip install tweepy")
+        return None
+    return tweepy
+
 
 @dataclass
 class PublishResult:
@@ -28,6 +127,8 @@ class PublishResult:
 class PublishRateLimiter:
     """Handle API rate limits for publishing"""
     
+    WINDOW_SECONDS = 15 * 60.0
+    
     def __init__(self, posts_per_day: int = 50, posts_per_15min: int = 5):
         """
         Initialize rate limiter
@@ -39,18 +140,35 @@ class PublishRateLimiter:
         self.daily_limit = posts_per_day
         self.window_limit = posts_per_15min
         self.daily_posts = 0
-        self.window_posts = []
-        self.last_reset = datetime.now()
+        self.window_posts: deque = deque()  # time.monotonic() of each post, oldest first
+        self.last_reset_date = date.today()
         logger.info(f"Rate limiter initialized: {posts_per_day}/day, {posts_per_15min}/15min")
     
     def can_publish(self) -> bool:
         """Check if we can publish now"""
-        now = datetime.now()
+        return self._can_publish(time.monotonic(), date.today())
+    
+    def _prune(self, now: float):
+        """Drop posts that have left the 15-minute window ending at now"""
+        window_start = now - self.WINDOW_SECONDS
+        while self.window_posts and self.window_posts[0] <= window_start:
+            self.window_posts.popleft()
+    
+    def _can_publish(self, now: float, today: date) -> bool:
+        """
+        Check if we can publish, given clock readings taken by the caller
         
+        Args:
+            now: time.monotonic() reading
+            today: Current local date
+            
+        Returns:
+            True if neither limit is reached
+        """
         # Reset daily counter
-        if now.date() > self.last_reset.date():
+        if today > self.last_reset_date:
             self.daily_posts = 0
-            self.last_reset = now
+            self.last_reset_date = today
             logger.debug("Daily rate limit counter reset")
         
         # Check daily limit
@@ -59,8 +177,7 @@ class PublishRateLimiter:
             return False
         
         # Check 15-minute window
-        window_start = now - timedelta(minutes=15)
-        self.window_posts = [t for t in self.window_posts if t > window_start]
+        self._prune(now)
         
         if len(self.window_posts) >= self.window_limit:
             logger.warning(f"15-min rate limit reached: {len(self.window_posts)}/{self.window_limit}")
@@ -68,10 +185,15 @@ class PublishRateLimiter:
         
         return True
     
-    def record_post(self):
-        """Record a successful post"""
-        self.daily_posts += 1
-        self.window_posts.append(datetime.now())
+    def record_post(self, count: int = 1):
+        """
+        Record successful post(s)
+        
+        Args:
+            count: Number of posts made at once
+        """
+        self.daily_posts += count
+        self.window_posts.extend([time.monotonic()] * count)
         logger.debug(f"Recorded post - Daily: {self.daily_posts}, Window: {len(self.window_posts)}")
     
     def wait_if_needed(self) -> float:
@@ -81,41 +203,165 @@ class PublishRateLimiter:
         Returns:
             Seconds to wait (0 if no wait needed)
         """
-        if self.can_publish():
+        now = time.monotonic()
+        today = date.today()
+        if self._can_publish(now, today):
             return 0
         
         # Calculate wait time until oldest post in window expires
         if self.window_posts:
-            oldest = min(self.window_posts)
-            window_end = oldest + timedelta(minutes=15)
-            wait_seconds = (window_end - datetime.now()).total_seconds()
+            wait_seconds = self.window_posts[0] + self.WINDOW_SECONDS - now
             return max(0, wait_seconds + 1)  # Add 1 second buffer
         
         # If daily limit reached, wait until tomorrow
-        tomorrow = datetime.combine(
-            datetime.now().date() + timedelta(days=1),
-            datetime.min.time()
-        )
+        tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        return (tomorrow - datetime.now()).total_seconds()
+
+
+class RedisRateLimiter(PublishRateLimiter):
+    """Publishing rate limits kept in Redis, so every worker shares one budget"""
+    
+    KEY_PREFIX = "xpub"
+    
+    def __init__(self, redis_url: str, posts_per_day: int = 50, posts_per_15min: int = 5):
+        """
+        Initialize Redis-backed rate limiter
+        
+        Args:
+            redis_url: Redis connection URL (e.g. redis://localhost:6379/0)
+            posts_per_day: Daily post limit
+            posts_per_15min: 15-minute window limit
+        """
+        if redis is None:
+            raise ImportError("redis not installed. Run: pip install redis")
+        
+        super().__init__(posts_per_day, posts_per_15min)
+        self.redis = redis.Redis.from_url(redis_url)
+        self.window_key = f"{self.KEY_PREFIX}:window"
+    
+    def _day_key(self, today: date) -> str:
+        return f"{self.KEY_PREFIX}:day:{today.isoformat()}"
+    
+    def _can_publish(self, now: float, today: date) -> bool:
+        """
+        Check the shared counters, falling back to this process's own if Redis fails
+        
+        Args:
+            now: time.monotonic() reading (used only by the local fallback)
+            today: Current local date
+            
+        Returns:
+            True if neither limit is reached
+        """
+        # Monotonic clocks differ between hosts, so the shared window uses wall time
+        wall = time.time()
+        try:
+            pipe = self.redis.pipeline()
+            pipe.get(self._day_key(today))
+            pipe.zremrangebyscore(self.window_key, 0, wall - self.WINDOW_SECONDS)
+            pipe.zcard(self.window_key)
+            daily_posts, _, window_posts = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis rate limiter unavailable, using local counters: {e}")
+            return super()._can_publish(now, today)
+        
+        daily_posts = int(daily_posts or 0)
+        if daily_posts >= self.daily_limit:
+            logger.warning(f"Daily rate limit reached: {daily_posts}/{self.daily_limit}")
+            return False
+        
+        if window_posts >= self.window_limit:
+            logger.warning(f"15-min rate limit reached: {window_posts}/{self.window_limit}")
+            return False
+        
+        return True
+    
+    def record_post(self, count: int = 1):
+        """
+        Record successful post(s) in Redis and locally
+        
+        Args:
+            count: Number of posts made at once
+        """
+        super().record_post(count)
+        
+        wall = time.time()
+        day_key = self._day_key(date.today())
+        try:
+            pipe = self.redis.pipeline()
+            pipe.incrby(day_key, count)
+            pipe.expire(day_key, 2 * 24 * 3600)
+            pipe.zadd(self.window_key, {uuid.uuid4().hex: wall for _ in range(count)})
+            pipe.expire(self.window_key, int(self.WINDOW_SECONDS))
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Could not record post in Redis: {e}")
+    
+    def wait_if_needed(self) -> float:
+        """
+        Calculate wait time if rate limited
+        
+        Returns:
+            Seconds to wait (0 if no wait needed)
+        """
+        if self.can_publish():
+            return 0
+        
+        try:
+            oldest = self.redis.zrange(self.window_key, 0, 0, withscores=True)
+        except redis.RedisError:
+            return super().wait_if_needed()
+        
+        # Calculate wait time until oldest post in window expires
+        if oldest:
+            wait_seconds = oldest[0][1] + self.WINDOW_SECONDS - time.time()
+            return max(0, wait_seconds + 1)  # Add 1 second buffer
+        
+        # If daily limit reached, wait until tomorrow
+        tomorrow = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
         return (tomorrow - datetime.now()).total_seconds()
 
 
 class XPublisher(ABC):
     """Abstract base class for X/Twitter publishers"""
     
+    TWEET_LIMIT = 280
+    FULL_HASHTAGS = "\n\n#CryptoProjects #Web3 #DeFi #NFTs #Blockchain"
+    SHORT_HASHTAGS = "\n\n#Crypto #Web3"
+    # Longest content each hashtag set still fits in one tweet with
+    FULL_HASHTAGS_MAX = TWEET_LIMIT - len(FULL_HASHTAGS)
+    SHORT_HASHTAGS_MAX = TWEET_LIMIT - len(SHORT_HASHTAGS)
+    # How many recently published contents are remembered for duplicate checks
+    RECENT_HASHES_MAX = 256
+    
     def __init__(self):
         self.rate_limiter = PublishRateLimiter()
+        # Digests of recently published content, oldest first
+        self._recent_hashes: OrderedDict = OrderedDict()
     
     @abstractmethod
     def authenticate(self) -> bool:
         """Authenticate with the publishing service"""
         pass
     
+    async def authenticate_async(self) -> bool:
+        """Authenticate without blocking the event loop"""
+        return await asyncio.to_thread(self.authenticate)
+    
     @abstractmethod
     def publish(self, content: str) -> PublishResult:
         """Publish content to X/Twitter"""
         pass
     
-    def validate_content(self, content: str) -> bool:
+    async def publish_async(self, content: str) -> PublishResult:
+        """Publish without blocking the event loop"""
+        return await asyncio.to_thread(self.publish, content)
+    
+    async def aclose(self) -> None:
+        """Release resources tied to the running event loop"""
+        pass
+    
+    def validate_content(self, content: str) -> Optional[str]:
         """
         Validate content before publishing
         
@@ -123,45 +369,72 @@ class XPublisher(ABC):
             content: Content to validate
             
         Returns:
-            True if content is valid
+            Content with surrounding whitespace stripped, or None if invalid
         """
-        if not content or not content.strip():
+        stripped = content.strip() if content else ""
+        if not stripped:
             logger.error("Content is empty")
-            return False
+            return None
         
         # Check for very long content (X has limits)
-        if len(content) > 10000:  # Safety limit
-            logger.error(f"Content too long: {len(content)} characters")
-            return False
+        if len(stripped) > 10000:  # Safety limit
+            logger.error(f"Content too long: {len(stripped)} characters")
+            return None
         
-        return True
+        return stripped
+    
+    def _content_hash(self, content: str) -> bytes:
+        """Digest identifying content (already stripped by validate_content) for duplicate checks"""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    
+    def is_duplicate(self, content: str) -> bool:
+        """
+        Check whether content was already published recently
+        
+        Args:
+            content: Validated content about to be published
+            
+        Returns:
+            True if the same content was published successfully before
+        """
+        if self._content_hash(content) in self._recent_hashes:
+            logger.warning("Skipping duplicate content that was already published")
+            return True
+        return False
+    
+    def remember_published(self, content: str) -> None:
+        """
+        Record successfully published content so it is not published again
+        
+        Args:
+            content: Validated content that was published
+        """
+        self._recent_hashes[self._content_hash(content)] = None
+        if len(self._recent_hashes) > self.RECENT_HASHES_MAX:
+            self._recent_hashes.popitem(last=False)
     
     def format_for_publishing(self, content: str, add_hashtags: bool = True) -> str:
         """
         Format content for X/Twitter
         
         Args:
-            content: Raw content to format
+            content: Content to format, as returned by validate_content
             add_hashtags: Whether to add hashtags
             
         Returns:
             Formatted content
         """
-        # Clean up content
-        content = content.strip()
-        
         # Add hashtags if requested
         if add_hashtags:
-            hashtags = "\n\n#CryptoProjects #Web3 #DeFi #NFTs #Blockchain"
+            length = _x_length(content)
             
             # Check if content + hashtags fits in single tweet
-            if len(content) + len(hashtags) <= 280:
-                return content + hashtags
+            if length <= self.FULL_HASHTAGS_MAX:
+                return content + self.FULL_HASHTAGS
             
             # Try with fewer hashtags
-            short_hashtags = "\n\n#Crypto #Web3"
-            if len(content) + len(short_hashtags) <= 280:
-                return content + short_hashtags
+            if length <= self.SHORT_HASHTAGS_MAX:
+                return content + self.SHORT_HASHTAGS
         
         return content
 
@@ -169,6 +442,9 @@ class XPublisher(ABC):
 class TwitterAPIPublisher(XPublisher):
     """Publisher using X API v2 directly"""
     
+    # Longest a rate-limited reply waits for the window to reset before giving up
+    MAX_THREAD_WAIT = 60.0
+    
     def __init__(self, api_key: str, api_secret: str, 
                  access_token: str, access_token_secret: str):
         """
@@ -186,92 +462,241 @@ class TwitterAPIPublisher(XPublisher):
         self.access_token = access_token
         self.access_token_secret = access_token_secret
         self.client = None
+        self._username = None  # Set by authenticate, used to build tweet URLs
+        # Headers of the last X API response, for its x-rate-limit-* values
+        self._rate_limit_headers = {}
         logger.info("Initialized TwitterAPIPublisher")
     
     def authenticate(self) -> bool:
         """Authenticate with X API v2"""
+        # Import tweepy only when needed
+        tweepy = _tweepy()
+        if tweepy is None:
+            return False
+        
         try:
-            # Import tweepy only when needed
-            import tweepy
-            
+            # Raw responses, so the rate limit headers of every call can be read
             self.client = tweepy.Client(
                 consumer_key=self.api_key,
                 consumer_secret=self.api_secret,
                 access_token=self.access_token,
-                access_token_secret=self.access_token_secret
+                access_token_secret=self.access_token_secret,
+                return_type=requests.Response
             )
             
             # Test authentication
-            me = self.client.get_me()
-            if me and me.data:
-                logger.info(f"Authenticated as @{me.data.username}")
+            me = self._response_data(self.client.get_me())
+            if me.get('username'):
+                self._username = me['username']
+                logger.info(f"Authenticated as @{self._username}")
                 return True
             
             logger.error("Failed to authenticate - no user data")
             return False
             
-        except ImportError:
-            logger.error("tweepy not installed. Run: pip install tweepy")
-            return False
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             return False
     
-    def _split_into_tweets(self, content: str, max_length: int = 3800) -> List[str]:
+    def _thread_tweets(self, content: str, max_length: int = 3800) -> Tuple[int, Iterator[str]]:
         """
-        Split long content into tweet-sized chunks
+        Split long content into tweet-sized chunks, produced as they are posted
+        
+        Numbering needs the total up front, so one counting pass runs over the
+        chunks without keeping them; the returned iterator then chunks the
+        content again lazily, so the first tweet goes out before the rest
+        are built.
         
         Args:
             content: Content to split
             max_length: Maximum length per tweet (I have X premium, so 3800)
             
         Returns:
-            List of tweet-sized strings
+            Number of tweets, and an iterator over them in posting order
         """
-        if len(content) <= max_length:
-            return [content]
+        content_length = _x_length(content)
+        if content_length <= max_length:
+            return 1, iter((content,))
+        
+        # Reserve room for the "(i/N) " prefix and trailing "..." while splitting,
+        # so numbering never has to shorten a tweet. If N turns out to need more
+        # digits than estimated, count again with the wider prefix.
+        digits = len(str(content_length // (max_length - 12) + 1))
+        while True:
+            limit = max_length - (2 * digits + 4) - 3
+            total = sum(1 for _ in self._iter_tweets(content, limit))
+            if len(str(total)) <= digits:
+                break
+            digits += 1
+        
+        if total == 1:
+            return 1, self._iter_tweets(content, limit)
         
-        tweets = []
-        lines = content.split('\n')
-        current_tweet = ""
+        return total, self._iter_numbered(content, limit, total, max_length)
+    
+    def _iter_numbered(self, content: str, limit: int, total: int, max_length: int) -> Iterator[str]:
+        """
+        Add thread numbering to the chunks of content
         
-        for line in lines:
+        Args:
+            content: Content to split
+            limit: Chunk limit the total was counted with
+            total: Number of chunks
+            max_length: Maximum length per tweet
+            
+        Yields:
+            Tweets prefixed with "(i/N) "
+        """
+        for i, tweet in enumerate(self._iter_tweets(content, limit), 1):
+            prefix = f"({i}/{total}) "
+            # Only a single sentence longer than a whole tweet can still overflow
+            room = max_length - len(prefix)
+            if _x_length(tweet) > room:
+                tweet = self._truncate(tweet, room - 3) + "..."
+            yield prefix + tweet
+    
+    def _truncate(self, text: str, limit: int) -> str:
+        """
+        Cut text to at most limit UTF-16 code units without splitting a character
+        
+        Args:
+            text: Text to cut
+            limit: Maximum length in UTF-16 code units
+            
+        Returns:
+            Longest prefix of text that fits
+        """
+        if text.isascii():
+            return text[:limit]
+        
+        units = 0
+        for i, char in enumerate(text):
+            units += 2 if ord(char) > 0xFFFF else 1
+            if units > limit:
+                return text[:i]
+        return text
+    
+    def _iter_tweets(self, content: str, limit: int) -> Iterator[str]:
+        """
+        Pack lines (or sentences of overlong lines) into chunks of at most limit characters
+        
+        Args:
+            content: Content to split
+            limit: Maximum chunk length (UTF-16 code units) before "..." continuation markers are added
+            
+        Yields:
+            Chunks in order, continued ones marked with "..."
+        """
+        # Current tweet as fragments joined once on flush, with its running length
+        parts: List[str] = []
+        length = 0
+        
+        for line in content.split('\n'):
+            line_length = _x_length(line)
+            
             # If single line is too long, split by sentences
-            if len(line) > max_length - 10:  # Leave room for "..."
-                sentences = line.split('. ')
-                for sentence in sentences:
-                    if len(current_tweet) + len(sentence) + 2 <= max_length - 10:
-                        current_tweet += sentence + ". "
+            if line_length > limit:
+                for sentence in line.split('. '):
+                    sentence_length = _x_length(sentence)
+                    if length + sentence_length + 2 <= limit:
+                        parts.append(sentence + ". ")
+                        length += sentence_length + 2
                     else:
-                        if current_tweet:
-                            tweets.append(current_tweet.strip() + "...")
-                        current_tweet = "..." + sentence + ". "
+                        if length:
+                            yield "".join(parts).strip() + "..."
+                        parts = ["...", sentence, ". "]
+                        length = sentence_length + 5
             else:
                 # Try to add the line to current tweet
-                test_tweet = current_tweet + "\n" + line if current_tweet else line
+                added = line_length + 1 if length else line_length
                 
-                if len(test_tweet) <= max_length - 10:
-                    current_tweet = test_tweet
+                if length + added <= limit:
+                    if length:
+                        parts.append("\n")
+                    parts.append(line)
+                    length += added
                 else:
-                    if current_tweet:
-                        tweets.append(current_tweet + "...")
-                    current_tweet = "..." + line
+                    if length:
+                        yield "".join(parts) + "..."
+                    parts = ["...", line]
+                    length = line_length + 3
         
         # Add remaining content
-        if current_tweet:
-            tweets.append(current_tweet)
+        if length:
+            yield "".join(parts)
+    
+    @staticmethod
+    def _response_data(response) -> dict:
+        """
+        Get the 'data' object of an X API response
         
-        # Add thread numbering
-        if len(tweets) > 1:
-            for i, tweet in enumerate(tweets, 1):
-                prefix = f"({i}/{len(tweets)}) "
-                # Adjust tweet length for prefix
-                max_with_prefix = max_length - len(prefix)
-                if len(tweet) > max_with_prefix:
-                    tweet = tweet[:max_with_prefix-3] + "..."
-                tweets[i-1] = prefix + tweet
+        Args:
+            response: requests.Response returned by tweepy
+            
+        Returns:
+            The response's data object, or {} if there is none
+        """
+        if response is None:
+            return {}
+        data = _parse_response_body(response.content, True).get('data')
+        return data if isinstance(data, dict) else {}
+    
+    def _wait_for_reset(self, headers) -> bool:
+        """
+        Sleep until the X rate limit window resets if no requests remain in it
+        
+        Args:
+            headers: Headers of the last X API response
+            
+        Returns:
+            False if the reset is too far away to wait for, otherwise True
+        """
+        try:
+            remaining = int(headers.get('x-rate-limit-remaining'))
+            reset = float(headers.get('x-rate-limit-reset'))
+        except (TypeError, ValueError):
+            return True  # No rate limit information to pace on
+        
+        if remaining > 0:
+            return True
+        
+        wait = max(0.0, reset - time.time())
+        if wait > self.MAX_THREAD_WAIT:
+            return False
+        
+        logger.warning(f"X rate limit window used up, waiting {wait:.1f} seconds for it to reset")
+        # Jitter so the next request lands after the reset, not on it
+        time.sleep(wait + random.uniform(0, 1))
+        return True
+    
+    def _create_tweet(self, text: str, reply_to: Optional[str] = None):
+        """
+        Post a tweet (or a reply in a thread), paced by the rate limit headers of the last response
         
-        return tweets
+        Args:
+            text: Tweet text
+            reply_to: ID of the tweet to reply to, if any
+            
+        Returns:
+            requests.Response for the created tweet
+        """
+        if not self._wait_for_reset(self._rate_limit_headers):
+            raise RuntimeError("X API rate limit exceeded")
+        
+        try:
+            response = self.client.create_tweet(text=text, in_reply_to_tweet_id=reply_to)
+        except Exception as e:
+            # A 429 means the window is used up, whatever remaining said before
+            error_response = getattr(e, 'response', None)
+            if getattr(error_response, 'status_code', None) != 429:
+                raise
+            headers = dict(error_response.headers, **{'x-rate-limit-remaining': '0'})
+            if 'x-rate-limit-reset' not in headers or not self._wait_for_reset(headers):
+                raise
+            response = self.client.create_tweet(text=text, in_reply_to_tweet_id=reply_to)
+        
+        self._rate_limit_headers = response.headers
+        return response
     
     def publish(self, content: str) -> PublishResult:
         """
@@ -284,12 +709,20 @@ class TwitterAPIPublisher(XPublisher):
             PublishResult object
         """
         # Validate content
-        if not self.validate_content(content):
+        stripped = self.validate_content(content)
+        if stripped is None:
             return PublishResult(
                 success=False,
                 error_msg="Content validation failed"
             )
         
+        # Skip content already published (e.g. a re-run after a crash)
+        if self.is_duplicate(stripped):
+            return PublishResult(
+                success=False,
+                error_msg="Duplicate content"
+            )
+        
         # Check rate limits
         if not self.rate_limiter.can_publish():
             wait_time = self.rate_limiter.wait_if_needed()
@@ -308,41 +741,34 @@ class TwitterAPIPublisher(XPublisher):
         
         try:
             # Format content
-            formatted_content = self.format_for_publishing(content)
+            formatted_content = self.format_for_publishing(stripped)
             
-            # Split into tweets if needed
-            tweets = self._split_into_tweets(formatted_content)
+            # Split into tweets if needed, chunking the rest while posting
+            total, tweets = self._thread_tweets(formatted_content)
             
             # Post first tweet
-            response = self.client.create_tweet(text=tweets[0])
+            response = self._create_tweet(next(tweets))
             
-            if not response or not response.data:
+            tweet_id = self._response_data(response).get('id')
+            if not tweet_id:
                 return PublishResult(
                     success=False,
                     error_msg="Failed to create tweet"
                 )
             
-            tweet_id = response.data['id']
-            
-            # Get authenticated user for URL
-            me = self.client.get_me()
-            username = me.data.username if me and me.data else "user"
-            tweet_url = f"https://twitter.com/{username}/status/{tweet_id}"
+            # Username was fetched once at authentication
+            tweet_url = f"https://twitter.com/{self._username or 'user'}/status/{tweet_id}"
             
             # Thread remaining tweets if any
-            for tweet_text in tweets[1:]:
-                time.sleep(1)  # Small delay between tweets
-                response = self.client.create_tweet(
-                    text=tweet_text,
-                    in_reply_to_tweet_id=tweet_id
-                )
-                if response and response.data:
-                    tweet_id = response.data['id']
+            for tweet_text in tweets:
+                response = self._create_tweet(tweet_text, tweet_id)
+                tweet_id = self._response_data(response).get('id', tweet_id)
             
             # Record successful post
             self.rate_limiter.record_post()
+            self.remember_published(stripped)
             
-            logger.info(f"Published {len(tweets)} tweet(s): {tweet_url}")
+            logger.info(f"Published {total} tweet(s): {tweet_url}")
             
             return PublishResult(
                 success=True,
@@ -351,30 +777,19 @@ class TwitterAPIPublisher(XPublisher):
             )
             
         except Exception as e:
-            error_msg = str(e).lower()
-            
             # Parse specific errors
-            if "rate limit" in error_msg or "429" in error_msg:
-                return PublishResult(
-                    success=False,
-                    error_msg="X API rate limit exceeded"
-                )
-            elif "unauthorized" in error_msg or "401" in error_msg:
-                return PublishResult(
-                    success=False,
-                    error_msg="Authentication failed - check credentials"
-                )
-            elif "forbidden" in error_msg or "403" in error_msg:
-                return PublishResult(
-                    success=False,
-                    error_msg="Forbidden - check app permissions"
-                )
-            else:
-                logger.error(f"Publishing failed: {e}")
+            match = X_API_ERROR_PATTERN.search(str(e))
+            if match:
                 return PublishResult(
                     success=False,
-                    error_msg=f"Publishing failed: {str(e)}"
+                    error_msg=X_API_ERROR_MESSAGES[match.lastgroup]
                 )
+            
+            logger.error(f"Publishing failed: {e}")
+            return PublishResult(
+                success=False,
+                error_msg=f"Publishing failed: {str(e)}"
+            )
 
 
 class TypefullyPublisher(XPublisher):
@@ -396,6 +811,28 @@ class TypefullyPublisher(XPublisher):
         # Typefully API uses X-API-KEY header without Bearer prefix
         self.headers = {"X-API-KEY": api_key}
         
+        # One keep-alive session so later requests skip the TCP/TLS handshake.
+        # Only failed connects and 429/503 answers are retried: a read timeout
+        # or dropped connection may come after Typefully created the draft.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # aiohttp session for publish_async and the loop it was created in
+        self._aio_session = None
+        self._aio_loop = None
+        self.session.mount("https://api.typefully.com", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset({'GET', 'POST'}),
+                raise_on_status=False
+            )
+        ))
+        
         # Calculate schedule based on hours_delay if provided
         if hours_delay > 0:
             # Use UTC time for scheduling
@@ -424,6 +861,80 @@ class TypefullyPublisher(XPublisher):
             logger.error("Typefully API key not configured")
             return False
     
+    async def authenticate_async(self) -> bool:
+        """Test Typefully API authentication (no network call, so no thread needed)"""
+        return self.authenticate()
+    
+    def _prepare_draft(self, stripped: str) -> dict:
+        """
+        Build the draft request payload
+        
+        Args:
+            stripped: Content returned by validate_content
+            
+        Returns:
+            Payload for the drafts endpoint
+        """
+        # Check rate limits (still apply for safety)
+        if not self.rate_limiter.can_publish():
+            wait_time = self.rate_limiter.wait_if_needed()
+            logger.warning(f"Rate limited. Waiting {wait_time:.0f} seconds")
+            # For Typefully, we can still create draft
+            # but log the warning
+        
+        # Format content
+        formatted_content = self.format_for_publishing(stripped)
+        
+        return {
+            "content": formatted_content,
+            "schedule-date": self.schedule
+        }
+    
+    def _draft_result(self, status_code: int, body: bytes) -> PublishResult:
+        """
+        Turn a drafts endpoint response into a PublishResult
+        
+        Args:
+            status_code: HTTP status code
+            body: Raw response body
+            
+        Returns:
+            PublishResult object
+        """
+        success = status_code in _OK_STATUS
+        data = _parse_response_body(body, success)
+        
+        # Check response
+        if success:
+            draft_id = data.get('id', 'unknown')
+            
+            # Construct draft URL
+            draft_url = f"https://typefully.com/drafts/{draft_id}"
+            
+            # Record post (even though it's scheduled)
+            self.rate_limiter.record_post()
+            
+            logger.info(f"Created Typefully draft: {draft_url}")
+            
+            return PublishResult(
+                success=True,
+                url=draft_url,
+                post_id=str(draft_id)
+            )
+        
+        error_msg = f"Typefully API error: {status_code}"
+        if 'error' in data:
+            error_msg = f"Typefully error: {data['error']}"
+        elif 'message' in data:
+            error_msg = f"Typefully error: {data['message']}"
+        
+        logger.error(error_msg)
+        
+        return PublishResult(
+            success=False,
+            error_msg=error_msg
+        )
+    
     def publish(self, content: str) -> PublishResult:
         """
         Create a draft in Typefully
@@ -434,81 +945,233 @@ class TypefullyPublisher(XPublisher):
         Returns:
             PublishResult object
         """
-        # Validate content
-        if not self.validate_content(content):
+        stripped = self.validate_content(content)
+        if stripped is None:
             return PublishResult(
                 success=False,
                 error_msg="Content validation failed"
             )
         
-        # Check rate limits (still apply for safety)
-        if not self.rate_limiter.can_publish():
-            wait_time = self.rate_limiter.wait_if_needed()
-            logger.warning(f"Rate limited. Waiting {wait_time:.0f} seconds")
-            # For Typefully, we can still create draft
-            # but log the warning
+        if self.is_duplicate(stripped):
+            return PublishResult(
+                success=False,
+                error_msg="Duplicate content"
+            )
+        
+        payload = self._prepare_draft(stripped)
         
         try:
-            # Format content
-            formatted_content = self.format_for_publishing(content)
-            
-            # Prepare payload
-            payload = {
-                "content": formatted_content,
-                "schedule-date": self.schedule
-            }
-            
             # Make API request
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/drafts/",
-                headers=self.headers,
                 json=payload,
                 timeout=30
             )
             
-            # Check response
-            if response.status_code == 200 or response.status_code == 201:
-                data = response.json()
-                draft_id = data.get('id', 'unknown')
-                
-                # Construct draft URL
-                draft_url = f"https://typefully.com/drafts/{draft_id}"
-                
-                # Record post (even though it's scheduled)
-                self.rate_limiter.record_post()
-                
-                logger.info(f"Created Typefully draft: {draft_url}")
-                
-                return PublishResult(
-                    success=True,
-                    url=draft_url,
-                    post_id=str(draft_id)
-                )
-            else:
-                error_msg = f"Typefully API error: {response.status_code}"
-                
-                try:
-                    error_data = response.json()
-                    if 'error' in error_data:
-                        error_msg = f"Typefully error: {error_data['error']}"
-                    elif 'message' in error_data:
-                        error_msg = f"Typefully error: {error_data['message']}"
-                except:
-                    pass
-                
-                logger.error(error_msg)
+            result = self._draft_result(response.status_code, response.content)
+            if result.success:
+                self.remember_published(stripped)
+            return result
                 
-                return PublishResult(
+        except requests.exceptions.Timeout:
+            return PublishResult(
+                success=False,
+                error_msg="Typefully API timeout"
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Typefully request failed: {e}")
+            return PublishResult(
+                success=False,
+                error_msg=f"Request failed: {str(e)}"
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return PublishResult(
+                success=False,
+                error_msg=f"Unexpected error: {str(e)}"
+            )
+    
+    def publish_batch(self, contents: List[str]) -> List[PublishResult]:
+        """
+        Create several Typefully drafts with one bulk request
+        
+        Falls back to one request per draft if the bulk endpoint is not
+        available.
+        
+        Args:
+            contents: Content for each draft
+            
+        Returns:
+            PublishResult for each draft, in input order
+        """
+        results: List[Optional[PublishResult]] = [None] * len(contents)
+        
+        # Drafts that pass local checks, with their positions in contents
+        pending: List[int] = []
+        validated: List[str] = []
+        payloads: List[dict] = []
+        batch_hashes = set()
+        for i, content in enumerate(contents):
+            stripped = self.validate_content(content)
+            if stripped is None:
+                results[i] = PublishResult(success=False, error_msg="Content validation failed")
+                continue
+            content_hash = self._content_hash(stripped)
+            if content_hash in batch_hashes or self.is_duplicate(stripped):
+                results[i] = PublishResult(success=False, error_msg="Duplicate content")
+                continue
+            batch_hashes.add(content_hash)
+            pending.append(i)
+            validated.append(stripped)
+            payloads.append(self._prepare_draft(stripped))
+        
+        if not payloads:
+            return results
+        
+        try:
+            response = self.session.post(
+                f"{self.base_url}/drafts/bulk/",
+                json={"drafts": payloads},
+                timeout=30
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Typefully bulk request failed: {e}")
+            for i in pending:
+                results[i] = PublishResult(success=False, error_msg=f"Request failed: {str(e)}")
+            return results
+        
+        if response.status_code in (404, 405):
+            logger.info("Typefully bulk endpoint unavailable, creating drafts one by one")
+            for i in pending:
+                results[i] = self.publish(contents[i])
+            return results
+        
+        if response.status_code not in _OK_STATUS:
+            failure = self._draft_result(response.status_code, response.content)
+            for i in pending:
+                results[i] = failure
+            return results
+        
+        # Accept either a bare array or {"drafts": [...]}, one entry per draft in order
+        try:
+            data = orjson.loads(response.content) if orjson else json.loads(response.content)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            data = data.get('drafts')
+        drafts = data if isinstance(data, list) else []
+        
+        # Only drafts the response confirms with an ID count as created
+        created = 0
+        for n, i in enumerate(pending):
+            draft = drafts[n] if n < len(drafts) and isinstance(drafts[n], dict) else {}
+            draft_id = draft.get('id')
+            if draft_id is None:
+                results[i] = PublishResult(
                     success=False,
-                    error_msg=error_msg
+                    error_msg="Draft missing from Typefully bulk response"
                 )
+                continue
+            results[i] = PublishResult(
+                success=True,
+                url=f"https://typefully.com/drafts/{draft_id}",
+                post_id=str(draft_id)
+            )
+            self.remember_published(validated[n])
+            created += 1
+        
+        if created < len(pending):
+            logger.warning(f"Typefully bulk response confirmed {created} of {len(pending)} drafts")
+        
+        # Record all posts (even though they're scheduled)
+        if created:
+            self.rate_limiter.record_post(created)
+        
+        logger.info(f"Created {created} Typefully drafts in one request")
+        
+        return results
+    
+    def close(self) -> None:
+        """Close the HTTP session"""
+        self.session.close()
+    
+    async def aclose(self) -> None:
+        """Close the aiohttp session used by publish_async, if one is open"""
+        session, self._aio_session = self._aio_session, None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    def _get_aio_session(self):
+        """
+        Return the shared aiohttp session, creating it in the running loop
+        
+        A session only works on the loop it was created in, so one left open
+        by an earlier loop is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._aio_session
+        if session is None or session.closed or self._aio_loop is not loop:
+            session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._aio_session = session
+            self._aio_loop = loop
+        return session
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    async def publish_async(self, content: str) -> PublishResult:
+        """
+        Create a draft in Typefully without blocking the event loop
+        
+        Requests share one aiohttp session owned by the publisher; call
+        aclose() before the event loop ends.
+        
+        Args:
+            content: Content to publish
+            
+        Returns:
+            PublishResult object
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(self.publish, content)
+        
+        stripped = self.validate_content(content)
+        if stripped is None:
+            return PublishResult(
+                success=False,
+                error_msg="Content validation failed"
+            )
+        
+        if self.is_duplicate(stripped):
+            return PublishResult(
+                success=False,
+                error_msg="Duplicate content"
+            )
+        
+        payload = self._prepare_draft(stripped)
+        
+        try:
+            async with self._get_aio_session().post(
+                f"{self.base_url}/drafts/",
+                json=payload
+            ) as response:
+                result = self._draft_result(response.status, await response.read())
+                if result.success:
+                    self.remember_published(stripped)
+                return result
                 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             return PublishResult(
                 success=False,
                 error_msg="Typefully API timeout"
             )
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.error(f"Typefully request failed: {e}")
             return PublishResult(
                 success=False,
@@ -522,21 +1185,58 @@ class TypefullyPublisher(XPublisher):
             )
 
 
+async def publish_to_all(publishers: List[XPublisher], content: str) -> List[PublishResult]:
+    """
+    Publish the same content with several publishers concurrently
+    
+    One publisher failing does not stop the others. Each publisher's
+    event-loop resources are released before returning.
+    
+    Args:
+        publishers: Publishers to publish with
+        content: Content to publish
+        
+    Returns:
+        PublishResult for each publisher, in order
+    """
+    try:
+        outcomes = await asyncio.gather(
+            *(publisher.publish_async(content) for publisher in publishers),
+            return_exceptions=True
+        )
+    finally:
+        await asyncio.gather(
+            *(publisher.aclose() for publisher in publishers),
+            return_exceptions=True
+        )
+    
+    results = []
+    for publisher, outcome in zip(publishers, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"{type(publisher).__name__} failed: {outcome}")
+            outcome = PublishResult(success=False, error_msg=f"Publishing failed: {str(outcome)}")
+        results.append(outcome)
+    return results
+
+
 class SheetPublisher:
     """Wrapper that publishes content and updates sheet with receipt"""
     
-    def __init__(self, publisher: XPublisher, sheets_handler):
+    def __init__(self, publisher, sheets_handler):
         """
         Initialize sheet publisher
         
         Args:
-            publisher: The underlying publisher (Twitter or Typefully)
+            publisher: The underlying publisher (Twitter or Typefully), or a
+                list of publishers to publish with concurrently
             sheets_handler: GoogleSheetsHandler instance
         """
-        self.publisher = publisher
+        self.publishers = list(publisher) if isinstance(publisher, (list, tuple)) else [publisher]
+        self.publisher = self.publishers[0]
         self.sheets = sheets_handler
-        self.publisher_type = type(publisher).__name__.replace('Publisher', '')
-        logger.info(f"Initialized SheetPublisher with {self.publisher_type}")
+        self.publisher_type = type(self.publisher).__name__.replace('Publisher', '')
+        logger.info(f"Initialized SheetPublisher with "
+                   f"{', '.join(type(p).__name__.replace('Publisher', '') for p in self.publishers)}")
     
     def ensure_receipt_column(self) -> int:
         """
@@ -547,8 +1247,7 @@ class SheetPublisher:
         """
         try:
             # Get current headers
-            sheet_data = self.sheets.get_sheet_data()
-            headers = sheet_data[0] if sheet_data else []
+            headers = self.sheets.get_row(1)
             
             # Check for existing column
             receipt_col = -1
@@ -562,15 +1261,8 @@ class SheetPublisher:
                 headers.append('Publication receipt')
                 receipt_col = len(headers) - 1
                 
-                # Update sheet headers
-                all_rows = self.sheets.get_sheet_data()
-                if all_rows:
-                    all_rows[0] = headers
-                else:
-                    all_rows = [headers]
-                
-                self.sheets.clear_sheet(preserve_headers=False)
-                self.sheets.append_data(all_rows)
+                # Update only the header row
+                self.sheets.update_row(1, headers)
                 logger.info("Added Publication receipt column to sheet")
             
             return receipt_col
@@ -579,13 +1271,38 @@ class SheetPublisher:
             logger.error(f"Error ensuring receipt column: {e}")
             return -1
     
-    def update_receipt(self, row_index: int, result: PublishResult) -> bool:
+    @staticmethod
+    def _format_receipt(publisher_type: str, result: PublishResult) -> str:
+        """
+        Build the receipt text for one publishing result
+        
+        Args:
+            publisher_type: Publisher class name without the 'Publisher' suffix
+            result: Publishing result
+            
+        Returns:
+            Receipt text
+        """
+        if not result.success:
+            return f"Failed: {result.error_msg}"
+        if publisher_type == 'TwitterAPI':
+            # For X API, use the tweet URL
+            return result.url if result.url else f"Tweet ID: {result.post_id}"
+        if publisher_type == 'Typefully':
+            # For Typefully, use the draft ID
+            return f"Typefully Draft: {result.post_id}" if result.post_id else result.url
+        return f"Published: {result.post_id or 'Success'}"
+    
+    def update_receipt(self, row_index: int, result: PublishResult,
+                       results: Optional[List[PublishResult]] = None) -> bool:
         """
         Update sheet with publication receipt
         
         Args:
             row_index: Row to update (1-based)
             result: Publishing result
+            results: Per-publisher results when publishing with several
+                publishers; their receipts share the cell
             
         Returns:
             True if update successful
@@ -595,35 +1312,17 @@ class SheetPublisher:
             if receipt_col == -1:
                 return False
             
-            # Get all sheet data
-            all_rows = self.sheets.get_sheet_data()
-            
-            # Ensure row exists and has enough columns
-            while len(all_rows) < row_index:
-                all_rows.append([])
-            
-            while len(all_rows[row_index - 1]) <= receipt_col:
-                all_rows[row_index - 1].append('')
-            
             # Create receipt based on publisher type and result
-            if result.success:
-                if self.publisher_type == 'TwitterAPI':
-                    # For X API, use the tweet URL
-                    receipt = result.url if result.url else f"Tweet ID: {result.post_id}"
-                elif self.publisher_type == 'Typefully':
-                    # For Typefully, use the draft ID
-                    receipt = f"Typefully Draft: {result.post_id}" if result.post_id else result.url
-                else:
-                    receipt = f"Published: {result.post_id or 'Success'}"
+            if results is None:
+                receipt = self._format_receipt(self.publisher_type, result)
             else:
-                receipt = f"Failed: {result.error_msg}"
-            
-            # Update the specific cell
-            all_rows[row_index - 1][receipt_col] = receipt
+                receipt = " | ".join(
+                    self._format_receipt(type(publisher).__name__.replace('Publisher', ''), each)
+                    for publisher, each in zip(self.publishers, results)
+                )
             
-            # Write back to sheet
-            self.sheets.clear_sheet(preserve_headers=False)
-            self.sheets.append_data(all_rows)
+            # Update only the receipt cell
+            self.sheets.update_cell(row_index, receipt_col, receipt)
             
             logger.info(f"Updated row {row_index} with receipt: {receipt}")
             return True
@@ -643,11 +1342,26 @@ class SheetPublisher:
         Returns:
             PublishResult object
         """
-        # Publish content
-        result = self.publisher.publish(content)
+        if len(self.publishers) == 1:
+            # Publish content
+            result = self.publisher.publish(content)
+            
+            # Update sheet with receipt
+            self.update_receipt(row_index, result)
+            
+            return result
+        
+        # Publish with every publisher at once; the first success is
+        # reported, and failures from the others are kept in error_msg
+        results = asyncio.run(publish_to_all(self.publishers, content))
+        errors = [
+            f"{type(publisher).__name__.replace('Publisher', '')}: {result.error_msg}"
+            for publisher, result in zip(self.publishers, results) if not result.success
+        ]
+        first = next((result for result in results if result.success), PublishResult(success=False))
+        result = replace(first, error_msg="; ".join(errors) or None)
         
-        # Update sheet with receipt
-        self.update_receipt(row_index, result)
+        self.update_receipt(row_index, result, results)
         
         return result
     
@@ -663,17 +1377,17 @@ class SheetPublisher:
             PublishResult object
         """
         try:
-            # Get sheet data
-            sheet_data = self.sheets.get_sheet_data()
+            # Read just the header row and the requested row
+            headers = self.sheets.get_row(1)
+            row_data = self.sheets.get_row(row_index)
             
-            if len(sheet_data) < row_index:
+            if not row_data:
                 return PublishResult(
                     success=False,
                     error_msg=f"Row {row_index} not found in sheet"
                 )
             
             # Find draft column
-            headers = sheet_data[0]
             draft_col = -1
             for i, header in enumerate(headers):
                 if header == draft_column:
@@ -687,7 +1401,6 @@ class SheetPublisher:
                 )
             
             # Get content from the specified row
-            row_data = sheet_data[row_index - 1]
             if len(row_data) <= draft_col:
                 return PublishResult(
                     success=False,
@@ -712,6 +1425,59 @@ class SheetPublisher:
             )
 
 
+def _build_publisher(publisher_type: str, **kwargs) -> Optional[XPublisher]:
+    """
+    Construct a publisher from its configuration without authenticating it
+    
+    Args:
+        publisher_type: Type of publisher ('twitter' or 'typefully')
+        **kwargs: Configuration parameters for the publisher; pass
+            rate_limit_redis_url to share rate limits between workers
+        
+    Returns:
+        Publisher instance or None if the configuration is incomplete
+    """
+    if publisher_type.lower() == 'twitter':
+        required = ['api_key', 'api_secret', 'access_token', 'access_token_secret']
+        
+        if not all(k in kwargs for k in required):
+            logger.error(f"Missing required Twitter API credentials")
+            return None
+        
+        publisher = TwitterAPIPublisher(
+            api_key=kwargs['api_key'],
+            api_secret=kwargs['api_secret'],
+            access_token=kwargs['access_token'],
+            access_token_secret=kwargs['access_token_secret']
+        )
+        
+    elif publisher_type.lower() == 'typefully':
+        if 'api_key' not in kwargs:
+            logger.error("Missing Typefully API key")
+            return None
+        
+        publisher = TypefullyPublisher(
+            api_key=kwargs['api_key'],
+            schedule=kwargs.get('schedule', 'next-free-slot'),
+            hours_delay=kwargs.get('hours_delay', 0)
+        )
+        
+    else:
+        logger.error(f"Unknown publisher type: {publisher_type}")
+        return None
+    
+    # Share rate limits with other workers if configured
+    redis_url = kwargs.get('rate_limit_redis_url')
+    if redis_url:
+        try:
+            publisher.rate_limiter = RedisRateLimiter(redis_url)
+            logger.info("Using Redis-backed publishing rate limits")
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, using in-memory limits: {e}")
+    
+    return publisher
+
+
 def create_publisher(publisher_type: str, **kwargs) -> Optional[XPublisher]:
     """
     Factory function to create appropriate publisher
@@ -724,40 +1490,47 @@ def create_publisher(publisher_type: str, **kwargs) -> Optional[XPublisher]:
         Publisher instance or None if creation fails
     """
     try:
-        if publisher_type.lower() == 'twitter':
-            required = ['api_key', 'api_secret', 'access_token', 'access_token_secret']
-            
-            if not all(k in kwargs for k in required):
-                logger.error(f"Missing required Twitter API credentials")
-                return None
-            
-            publisher = TwitterAPIPublisher(
-                api_key=kwargs['api_key'],
-                api_secret=kwargs['api_secret'],
-                access_token=kwargs['access_token'],
-                access_token_secret=kwargs['access_token_secret']
-            )
-            
-            if publisher.authenticate():
-                return publisher
-            
-        elif publisher_type.lower() == 'typefully':
-            if 'api_key' not in kwargs:
-                logger.error("Missing Typefully API key")
-                return None
-            
-            publisher = TypefullyPublisher(
-                api_key=kwargs['api_key'],
-                schedule=kwargs.get('schedule', 'next-free-slot'),
-                hours_delay=kwargs.get('hours_delay', 0)
-            )
-            
-            if publisher.authenticate():
-                return publisher
-        else:
-            logger.error(f"Unknown publisher type: {publisher_type}")
+        publisher = _build_publisher(publisher_type, **kwargs)
+        if publisher and publisher.authenticate():
+            return publisher
         
     except Exception as e:
         logger.error(f"Failed to create publisher: {e}")
     
-    return None
\ No newline at end of file
+    return None
+
+
+async def create_publishers_async(configs: List[dict]) -> List[XPublisher]:
+    """
+    Create several publishers, authenticating them concurrently
+    
+    Args:
+        configs: One dict per publisher: 'type' plus the create_publisher keyword arguments
+        
+    Returns:
+        Publishers that authenticated successfully, in config order
+    """
+    publishers = []
+    for config in configs:
+        kwargs = {key: value for key, value in config.items() if key != 'type'}
+        try:
+            publisher = _build_publisher(config.get('type', ''), **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to create publisher: {e}")
+            continue
+        if publisher:
+            publishers.append(publisher)
+    
+    results = await asyncio.gather(
+        *(publisher.authenticate_async() for publisher in publishers),
+        return_exceptions=True
+    )
+    
+    ready = []
+    for publisher, result in zip(publishers, results):
+        if result is True:
+            ready.append(publisher)
+        elif isinstance(result, Exception):
+            logger.error(f"Failed to authenticate {type(publisher).__name__}: {result}")
+    
+    return ready
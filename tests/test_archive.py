@@ -8,6 +8,7 @@ This script tests the archive functionality by:
 3. Verifying the results
 """
 
+import asyncio
 import sys
 import logging
 from pathlib import Path
@@ -16,7 +17,7 @@ from dotenv import load_dotenv
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from modules.sheets_handler import GoogleSheetsHandler
+from modules.sheets_handler import GoogleSheetsHandler, column_letter
 from modules.archive_handler import ArchiveHandler
 import config
 
@@ -30,40 +31,156 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# {header: column index} per (spreadsheet ID, sheet name), kept for the run
+_HEADER_CACHE = {}
 
-def show_sheet_status(sheets_handler, sheet_name="Sheet1"):
-    """Show current status of a sheet"""
-    try:
-        result = sheets_handler.service.spreadsheets().values().get(
+
+def _index_headers(headers):
+    """Map each header to its column index (first occurrence, like list.index)"""
+    idx = {}
+    for i, header in enumerate(headers):
+        idx.setdefault(header, i)
+    return idx
+
+
+def get_header_indexes(sheets_handler, sheet_names):
+    """
+    Get {header: column index} maps for several sheets
+    
+    Header rows not cached yet are fetched together in one batchGet call.
+    Sheets that do not exist (such as Archives before the first archive run)
+    map to an empty dict and are left out of the request, since one missing
+    range fails the whole call.
+    """
+    missing = [name for name in sheet_names
+               if (sheets_handler.sheet_id, name) not in _HEADER_CACHE]
+    
+    if missing:
+        spreadsheet = sheets_handler.service.spreadsheets().get(
             spreadsheetId=sheets_handler.sheet_id,
-            range=sheet_name
+            fields="sheets.properties.title"
+        ).execute()
+        titles = {sheet['properties']['title'] for sheet in spreadsheet.get('sheets', [])}
+        missing = [name for name in missing if name in titles]
+    
+    if missing:
+        result = sheets_handler.service.spreadsheets().values().batchGet(
+            spreadsheetId=sheets_handler.sheet_id,
+            ranges=[f"{name}!1:1" for name in missing]
         ).execute()
         
-        data = result.get('values', [])
+        for name, value_range in zip(missing, result.get('valueRanges', [])):
+            header_rows = value_range.get('values', [])
+            headers = header_rows[0] if header_rows else []
+            _HEADER_CACHE[(sheets_handler.sheet_id, name)] = _index_headers(headers)
+    
+    return {name: _HEADER_CACHE.get((sheets_handler.sheet_id, name), {}) for name in sheet_names}
+
+
+def _is_true(cell):
+    """Whether a grid cell holds TRUE (a checkbox or the text 'TRUE')"""
+    return (cell.get('effectiveValue', {}).get('boolValue') is True
+            or cell.get('formattedValue', '').upper() == 'TRUE')
+
+
+def fetch_sheet_status(sheets_handler, sheet_names):
+    """
+    Fetch headers, data row counts and AI processed counts for several sheets
+    
+    Header rows come from the cache (fetched together if missing), then all
+    sheets are read in one spreadsheets.get call as just their 'date' column
+    (to count rows) and their 'AI processed' column, unformatted.
+    """
+    header_indexes = get_header_indexes(sheets_handler, sheet_names)
+    
+    status = {}
+    count_columns = {}
+    ranges = []
+    for name in sheet_names:
+        idx = header_indexes[name]
+        status[name] = {'headers': list(idx), 'rows': 0,
+                        'processed': 0 if 'AI processed' in idx else None}
+        if not idx:
+            continue
         
-        if not data:
-            print(f"  {sheet_name} is empty")
-            return
+        # Rows are counted on the date column (the first column if there is none)
+        count_columns[name] = idx.get('date', 0)
+        for col in sorted({count_columns[name], idx.get('AI processed', count_columns[name])}):
+            letter = column_letter(col)
+            ranges.append(f"{name}!{letter}2:{letter}")
+    
+    if not ranges:
+        return status
+    
+    result = sheets_handler.service.spreadsheets().get(
+        spreadsheetId=sheets_handler.sheet_id,
+        ranges=ranges,
+        fields="sheets(properties.title,data(startColumn,"
+               "rowData.values(formattedValue,effectiveValue.boolValue)))"
+    ).execute()
+    
+    for sheet in result.get('sheets', []):
+        name = sheet['properties']['title']
+        if name not in count_columns:
+            continue
         
-        headers = data[0]
-        rows = data[1:] if len(data) > 1 else []
+        # Single columns: the date column gives the row count, AI processed the count of TRUEs
+        for grid in sheet.get('data', []):
+            column = [row.get('values', [{}])[0] for row in grid.get('rowData', [])]
+            if grid.get('startColumn', 0) == count_columns[name]:
+                status[name]['rows'] = len(column)
+            if grid.get('startColumn', 0) == header_indexes[name].get('AI processed'):
+                status[name]['processed'] = sum(1 for cell in column if _is_true(cell))
+    
+    return status
+
+
+def show_sheet_status(sheets_handler, *sheet_names):
+    """Show current status of one or more sheets"""
+    sheet_names = sheet_names or ("Sheet1",)
+    try:
+        status = fetch_sheet_status(sheets_handler, sheet_names)
+    except Exception as e:
+        status = e
+    
+    print_sheet_status(status, sheet_names)
+
+
+def print_sheet_status(status, sheet_names):
+    """Print sheet status fetched by fetch_sheet_status (or the error it raised)"""
+    if isinstance(status, Exception):
+        print(f"  Error reading {', '.join(sheet_names)}: {status}")
+        return
+    
+    for sheet_name in sheet_names:
+        headers = status[sheet_name]['headers']
         
-        print(f"  {sheet_name}: {len(rows)} data rows")
+        if not headers:
+            print(f"  {sheet_name} is empty or does not exist yet")
+            continue
+        
+        print(f"  {sheet_name}: {status[sheet_name]['rows']} data rows")
         
         # Check for AI processed column
-        if 'AI processed' in headers:
-            ai_proc_idx = headers.index('AI processed')
-            processed_count = 0
-            for row in rows:
-                if len(row) > ai_proc_idx and row[ai_proc_idx] and row[ai_proc_idx].upper() == 'TRUE':
-                    processed_count += 1
-            print(f"    - Posts with AI processed = TRUE: {processed_count}")
+        if status[sheet_name]['processed'] is not None:
+            print(f"    - Posts with AI processed = TRUE: {status[sheet_name]['processed']}")
         
         # Show column names
         print(f"    - Columns: {', '.join(headers)}")
-        
-    except Exception as e:
-        print(f"  Error reading {sheet_name}: {e}")
+
+
+async def fetch_before_archive(status_handler, archive_handler):
+    """
+    Read the sheet status and the posts to archive concurrently
+    
+    The status read needs its own handler: a googleapiclient service must
+    not be shared between threads.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(fetch_sheet_status, status_handler, ("Sheet1", "Archives")),
+        asyncio.to_thread(archive_handler.get_processed_posts),
+        return_exceptions=True
+    )
 
 
 def test_archive_handler():
@@ -87,19 +204,26 @@ def test_archive_handler():
         )
         print("✅ Connected to Google Sheets")
         
-        # Show current sheet status
-        print("\n2. Current Sheet Status:")
-        show_sheet_status(sheets_handler, "Sheet1")
-        show_sheet_status(sheets_handler, "Archives")
-        
         # Initialize archive handler
-        print("\n3. Initializing Archive Handler...")
+        print("\n2. Initializing Archive Handler...")
         archive_handler = ArchiveHandler(sheets_handler)
         print("✅ Archive handler initialized")
         
+        # Read current sheet status and processed posts at the same time
+        status_handler = GoogleSheetsHandler(
+            credentials_path=config.GOOGLE_SERVICE_ACCOUNT_FILE,
+            sheet_id=config.GOOGLE_SHEETS_ID
+        )
+        status, processed_posts = asyncio.run(fetch_before_archive(status_handler, archive_handler))
+        if isinstance(processed_posts, Exception):
+            raise processed_posts
+        
+        # Show current sheet status
+        print("\n3. Current Sheet Status:")
+        print_sheet_status(status, ("Sheet1", "Archives"))
+        
         # Check for processed posts
         print("\n4. Checking for processed posts...")
-        processed_posts = archive_handler.get_processed_posts()
         
         if not processed_posts:
             print("ℹ️  No posts found with AI processed = TRUE")
@@ -107,16 +231,18 @@ def test_archive_handler():
             return True
         
         print(f"📋 Found {len(processed_posts)} posts to archive:")
+        
+        # Processed posts come from Sheet1, whose headers are already cached
+        idx = get_header_indexes(sheets_handler, ["Sheet1"])["Sheet1"]
+        date_idx = idx.get('date', -1)
+        time_idx = idx.get('time', -1)
+        author_idx = idx.get('author', -1)
+        
         for i, post in enumerate(processed_posts[:5], 1):  # Show first 5
             row_idx = post['row_index']
-            headers = post['headers']
             data = post['data']
             
             # Get post details
-            date_idx = headers.index('date') if 'date' in headers else -1
-            time_idx = headers.index('time') if 'time' in headers else -1
-            author_idx = headers.index('author') if 'author' in headers else -1
-            
             date = data[date_idx] if date_idx >= 0 and len(data) > date_idx else 'N/A'
             time = data[time_idx] if time_idx >= 0 and len(data) > time_idx else 'N/A'
             author = data[author_idx] if author_idx >= 0 and len(data) > author_idx else 'N/A'
@@ -142,6 +268,9 @@ def test_archive_handler():
         print("\n5. Running archive workflow...")
         results = archive_handler.run_archive_workflow()
         
+        # Archiving may create or rewrite header rows
+        _HEADER_CACHE.clear()
+        
         # Show results
         print("\n" + "="*70)
         print("ARCHIVE RESULTS")
@@ -156,8 +285,7 @@ def test_archive_handler():
         
         # Show updated sheet status
         print("\n6. Updated Sheet Status:")
-        show_sheet_status(sheets_handler, "Sheet1")
-        show_sheet_status(sheets_handler, "Archives")
+        show_sheet_status(sheets_handler, "Sheet1", "Archives")
         
         return results['success']
         
@@ -198,7 +326,9 @@ def view_archives():
             print("Archives sheet is empty")
             return
         
-        headers = data[0]
+        # The header row came with the data, so cache it without another call
+        idx = _index_headers(data[0])
+        _HEADER_CACHE[(sheets_handler.sheet_id, "Archives")] = idx
         rows = data[1:] if len(data) > 1 else []
         
         if not rows:
@@ -208,16 +338,16 @@ def view_archives():
         print(f"\n📚 Archives contains {len(rows)} posts\n")
         print("-"*70)
         
+        # Get column indices
+        date_idx = idx.get('date', -1)
+        time_idx = idx.get('time', -1)
+        author_idx = idx.get('author', -1)
+        ai_summary_idx = idx.get('AI Summary', -1)
+        date_processed_idx = idx.get('Date Processed (UTC)', -1)
+        receipt_idx = idx.get('Publication Receipt', -1)
+        
         # Show last 5 archived posts
         for row in rows[-5:]:
-            # Get column indices
-            date_idx = headers.index('date') if 'date' in headers else -1
-            time_idx = headers.index('time') if 'time' in headers else -1
-            author_idx = headers.index('author') if 'author' in headers else -1
-            ai_summary_idx = headers.index('AI Summary') if 'AI Summary' in headers else -1
-            date_processed_idx = headers.index('Date Processed (UTC)') if 'Date Processed (UTC)' in headers else -1
-            receipt_idx = headers.index('Publication Receipt') if 'Publication Receipt' in headers else -1
-            
             print(f"Date: {row[date_idx] if date_idx >= 0 and len(row) > date_idx else 'N/A'} "
                   f"{row[time_idx] if time_idx >= 0 and len(row) > time_idx else ''}")
             print(f"Author: {row[author_idx] if author_idx >= 0 and len(row) > author_idx else 'N/A'}")
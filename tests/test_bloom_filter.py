@@ -0,0 +1,44 @@
+"""Unit tests for the Bloom filter utility."""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test cases for BloomFilter."""
+    
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as present."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        links = [f"https://x.com/user/status/{i}" for i in range(1000)]
+        bloom.update(links)
+        
+        self.assertTrue(all(link in bloom for link in links))
+        self.assertEqual(len(bloom), 1000)
+    
+    def test_false_positive_rate_near_target(self):
+        """Test that the false-positive rate stays close to error_rate at capacity."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.update(f"https://x.com/user/status/{i}" for i in range(1000))
+        
+        probes = [f"https://x.com/other/status/{i}" for i in range(10000)]
+        false_positives = sum(1 for link in probes if link in bloom)
+        
+        self.assertLess(false_positives / len(probes), 0.03)
+    
+    def test_empty_filter(self):
+        """Test that an empty filter contains nothing and is falsy."""
+        bloom = BloomFilter(capacity=10)
+        
+        self.assertNotIn("https://x.com/user/status/1", bloom)
+        self.assertFalse(bloom)
+        self.assertEqual(bloom.capacity, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 import asyncio
 
-from modules.discord_handler import DiscordHandler, TwitterPost
+from modules.discord_handler import DiscordHandler, TwitterPost, canonicalize_link
 
 
 class TestDiscordHandler(unittest.TestCase):
@@ -171,6 +171,29 @@ class TestDiscordHandler(unittest.TestCase):
             handles = re.findall(handle_pattern, content)
             for expected in expected_handles:
                 self.assertIn(expected, handles)
+    
+    def test_canonicalize_link(self):
+        """Test that link variants of the same post normalize to one form."""
+        canonical = "https://x.com/user/status/123"
+        variants = [
+            "https://x.com/user/status/123",
+            "https://twitter.com/user/status/123",
+            "https://X.com/user/status/123/",
+            "http://www.twitter.com/user/status/123?s=20",
+            "https://mobile.twitter.com/user/status/123?t=abc&s=46",
+            "https://x.com/user/status/123?utm_source=share#reply",
+        ]
+        for url in variants:
+            self.assertEqual(canonicalize_link(url), canonical)
+        
+        self.assertEqual(canonicalize_link(""), "")
+        self.assertEqual(
+            canonicalize_link("https://x.com/user/status/123?lang=en&s=20"),
+            "https://x.com/user/status/123?lang=en"
+        )
+        
+        post = TwitterPost("2025-08-14", "10:00", "Content", variants[3], "user", "")
+        self.assertEqual(post.canonical_link, canonical)
 
 
 class TestDiscordHandlerAsync(unittest.TestCase):
@@ -222,6 +245,35 @@ class TestDiscordHandlerAsync(unittest.TestCase):
         mock_bot.close.assert_called_once()
         self.assertFalse(self.handler._ready)
         
+    def test_is_connected(self):
+        """Test connection state reflects readiness and closed client."""
+        self.assertFalse(self.handler.is_connected())
+        
+        mock_bot = Mock()
+        mock_bot.is_closed.return_value = False
+        self.handler.bot = mock_bot
+        self.handler._ready = True
+        self.assertTrue(self.handler.is_connected())
+        
+        mock_bot.is_closed.return_value = True
+        self.assertFalse(self.handler.is_connected())
+        
+    def test_connect_replaces_dropped_client(self):
+        """Test connect closes a client whose session dropped before starting a new one."""
+        stale_bot = AsyncMock()
+        self.handler.bot = stale_bot
+        self.handler._ready = False  # Cleared by on_disconnect
+        
+        async def fake_initialize():
+            self.handler.bot = AsyncMock()
+            self.handler._ready = True
+        
+        with patch.object(self.handler, 'initialize_bot', side_effect=fake_initialize):
+            asyncio.run(self.handler.connect())
+        
+        stale_bot.close.assert_called_once()
+        self.assertIsNot(self.handler.bot, stale_bot)
+        
     def test_fetch_channel_messages_not_ready(self):
         """Test fetching messages when bot is not ready."""
         with self.assertRaises(RuntimeError) as context:
@@ -279,6 +331,31 @@ class TestDiscordHandlerAsync(unittest.TestCase):
         self.assertEqual(call_count, 3)
         self.assertEqual(result, [])
         
+    def test_fetch_twitter_posts_honors_retry_after(self):
+        """Test that a 429 response waits for the Retry-After period."""
+        import discord
+        self.handler._ready = True
+        
+        response = Mock(status=429, reason="Too Many Requests", headers={'Retry-After': '5'})
+        calls = []
+        
+        async def mock_fetch(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise discord.HTTPException(response, "Rate limited")
+            return []
+            
+        self.handler.fetch_channel_messages = mock_fetch
+        self.handler.filter_twitter_messages = Mock(return_value=[])
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            asyncio.run(self.handler.fetch_twitter_posts_with_retry(max_retries=3))
+            
+        delay = mock_sleep.call_args[0][0]
+        self.assertGreaterEqual(delay, 5)
+        self.assertLessEqual(delay, 7.5)
+        self.assertGreater(self.handler.rate_limit_reset_after, 0)
+        
     def test_get_today_posts(self):
         """Test fetching today's posts."""
         mock_posts = [
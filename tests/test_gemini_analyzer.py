@@ -79,6 +79,14 @@ class TestGeminiAnalyzer(unittest.TestCase):
             self.assertIsNotNone(analyzer.model)
             self.assertIsNotNone(analyzer.rate_limiter)
     
+    def test_normalize_strips_noise(self):
+        """Test prompt pre-pass removes links noise, repeated mentions and whitespace"""
+        content = "New  @proj @proj launch\n\nhttps://t.co/abc https://x.com/proj/status/1?s=20&t=xyz"
+        
+        result = GeminiAnalyzer._normalize(content)
+        
+        self.assertEqual(result, "New @proj launch https://x.com/proj/status/1")
+    
     def test_is_new_project_empty_content(self):
         """Test project detection with empty content"""
         self.assertFalse(self.analyzer.is_new_project(""))
@@ -355,5 +363,118 @@ class TestSheetAnalyzer(unittest.TestCase):
             self.assertEqual(call_args[1]['body']['values'], [['Daily draft content']])
 
 
+
+class TestRequestBucket(unittest.TestCase):
+    """Test pacing Gemini requests with a token bucket"""
+    
+    def test_token_taken_per_request(self):
+        """Test that every API request takes a token from the bucket"""
+        bucket = Mock()
+        with patch('modules.gemini_analyzer.genai.configure'):
+            analyzer = GeminiAnalyzer(api_key="test_key", request_bucket=bucket)
+        analyzer.model = Mock()
+        analyzer.model.generate_content.return_value = Mock(text="YES")
+        
+        analyzer._make_request("First prompt")
+        analyzer._make_request("Second prompt")
+        
+        self.assertEqual(bucket.consume.call_count, 2)
+        self.assertEqual(analyzer.model.generate_content.call_count, 2)
+
+
+class TestWriteAnalysisResults(unittest.TestCase):
+    """Test writing analysis results and the daily draft together"""
+    
+    def setUp(self):
+        self.mock_sheets = Mock()
+        
+        with patch('modules.gemini_analyzer.genai.configure'):
+            self.mock_gemini = GeminiAnalyzer(api_key="test_key")
+        
+        self.analyzer = SheetAnalyzer(self.mock_sheets, self.mock_gemini)
+        self.summaries = [
+            ProjectSummary(
+                date="2024-01-15",
+                project_info=ProjectInfo("proj1", "https://twitter.com/proj1", "bio1"),
+                ai_summary="Summary 1",
+                row_index=2
+            )
+        ]
+    
+    def test_single_batch_update(self):
+        """Test that summaries, statuses and the daily draft go out in one batchUpdate"""
+        with patch.object(self.mock_gemini, 'create_daily_draft', return_value="Daily draft content"):
+            written = self.analyzer.write_analysis_results(
+                [(2, "Summary 1"), (3, "Not new project related")], self.summaries,
+                ai_summary_col=6, ai_processed_col=7, daily_draft_col=8
+            )
+        
+        self.assertTrue(written)
+        self.mock_sheets.batch_update.assert_called_once()
+        data = self.mock_sheets.batch_update.call_args[1]['data']
+        self.assertEqual([update['range'] for update in data],
+                         ['Sheet1!G2', 'Sheet1!H2', 'Sheet1!G3', 'Sheet1!H3', 'Sheet1!I2'])
+        self.assertEqual(data[-1]['values'], [['Daily draft content']])
+    
+    def test_draft_failure_still_writes_summaries(self):
+        """Test that a failed draft generation does not drop the summaries"""
+        with patch.object(self.mock_gemini, 'create_daily_draft', side_effect=Exception("RATE_LIMITED")):
+            written = self.analyzer.write_analysis_results(
+                [(2, "Summary 1")], self.summaries,
+                ai_summary_col=6, ai_processed_col=7, daily_draft_col=8
+            )
+        
+        self.assertTrue(written)
+        data = self.mock_sheets.batch_update.call_args[1]['data']
+        self.assertEqual([update['range'] for update in data], ['Sheet1!G2', 'Sheet1!H2'])
+    
+    def test_write_failure(self):
+        """Test that a failed batchUpdate is reported"""
+        self.mock_sheets.batch_update.side_effect = Exception("HTTP 500")
+        
+        written = self.analyzer.write_analysis_results(
+            [(2, "Summary 1")], [], ai_summary_col=6, ai_processed_col=7, daily_draft_col=8
+        )
+        
+        self.assertFalse(written)
+
+
+class TestColumnCache(unittest.TestCase):
+    """Test reusing resolved AI columns across runs"""
+    
+    def setUp(self):
+        self.mock_sheets = Mock()
+        
+        with patch('modules.gemini_analyzer.genai.configure'):
+            self.mock_gemini = GeminiAnalyzer(api_key="test_key")
+        
+        self.analyzer = SheetAnalyzer(self.mock_sheets, self.mock_gemini)
+        self.headers = ['Date', 'Time', 'Content', 'Post Link', 'Author', 'Author Link',
+                        'AI Summary', 'AI processed', 'Daily Post Draft']
+    
+    def test_unchanged_headers_reuse_columns(self):
+        """Test that a second run with the same header row reuses the columns"""
+        self.mock_sheets.get_row.side_effect = lambda row: list(self.headers)
+        
+        first = self.analyzer.ensure_columns_exist()
+        second = self.analyzer.ensure_columns_exist()
+        
+        self.assertEqual(first, (6, 7, 8, -1))
+        self.assertIs(second, first)
+        self.mock_sheets.update_row.assert_not_called()
+    
+    def test_moved_columns_resolved_again(self):
+        """Test that columns moved between runs are resolved from the new header row"""
+        self.mock_sheets.get_row.side_effect = lambda row: list(self.headers)
+        self.analyzer.ensure_columns_exist()
+        
+        self.headers.insert(2, 'Views')
+        columns = self.analyzer.ensure_columns_exist()
+        
+        self.assertEqual(columns, (7, 8, 9, -1))
+        self.assertEqual(self.analyzer._letter(7), 'H')
+        self.assertEqual(list(self.analyzer._col_cache), [tuple(self.headers)])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,271 @@
+"""Unit tests for the scheduler's duplicate filtering and publishing."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.scheduler import SequentialProcessor
+from modules.gemini_analyzer import ProjectInfo, ProjectSummary
+from modules.x_publisher import PublishResult
+from utils.bloom_filter import BloomFilter
+
+
+def make_post(status_id):
+    """Build a sheet row for a post with the given status ID."""
+    return ['2025-08-14', '10:00', 'Content', f'https://x.com/user/status/{status_id}',
+            'user', 'https://x.com/user']
+
+
+class TestDuplicateFiltering(unittest.TestCase):
+    """Test cases for SequentialProcessor duplicate filtering."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # The processor creates data/processed in the working directory
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        
+        self.sheets = Mock()
+        self.sheets.has_headers.return_value = True
+        self.sheets.get_column_values.return_value = ['https://twitter.com/user/status/1']
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()
+    
+    def make_processor(self, **config):
+        processor = SequentialProcessor(self.sheets, config)
+        self.addCleanup(processor.close)
+        return processor
+    
+    def test_filters_existing_links(self):
+        """Test that posts already in the sheet are skipped in canonical form."""
+        processor = self.make_processor()
+        
+        results = processor.process_posts_to_sheets([make_post(1), make_post(2)])
+        
+        self.assertEqual(results['uploaded'], 1)
+        self.assertEqual(results['duplicates'], 1)
+        self.sheets.batch_append_data.assert_called_once()
+        self.assertEqual(self.sheets.batch_append_data.call_args[0][0], [make_post(2)])
+    
+    def test_uploaded_links_are_remembered(self):
+        """Test that the next run skips links uploaded earlier without reading the sheet."""
+        processor = self.make_processor()
+        processor.process_posts_to_sheets([make_post(2)])
+        
+        results = processor.process_posts_to_sheets([make_post(2)])
+        
+        self.assertEqual(results['duplicates'], 1)
+        self.sheets.get_column_values.assert_called_once()
+    
+    def test_false_positive_confirmed_against_sheet(self):
+        """Test that a Bloom hit not in the sheet is uploaded after an exact check."""
+        processor = self.make_processor()
+        existing_links = processor.load_existing_links()
+        
+        with patch.object(BloomFilter, '__contains__', return_value=True):
+            new_posts = processor._filter_duplicates([make_post(1), make_post(2)], existing_links)
+        
+        self.assertEqual(new_posts, [make_post(2)])
+        self.assertEqual(self.sheets.get_column_values.call_count, 2)
+    
+    def test_false_positive_confirmed_against_store(self):
+        """Test that Bloom hits are confirmed in the local link store without a sheet read."""
+        processor = self.make_processor(SEEN_LINKS_DB=os.path.join(self.temp_dir.name, 'seen.db'))
+        existing_links = processor.load_existing_links()
+        
+        with patch.object(BloomFilter, '__contains__', return_value=True):
+            new_posts = processor._filter_duplicates([make_post(1), make_post(2)], existing_links)
+        
+        self.assertEqual(new_posts, [make_post(2)])
+        self.sheets.get_column_values.assert_called_once()
+    
+    def test_link_outside_recent_cache_is_confirmed(self):
+        """Test that an older link evicted from the recent cache is still caught."""
+        self.sheets.get_column_values.return_value = [
+            'https://x.com/user/status/1', 'https://x.com/user/status/2'
+        ]
+        processor = self.make_processor()
+        
+        with patch('modules.scheduler.RECENT_LINKS_CACHE_SIZE', 1):
+            existing_links = processor.load_existing_links()
+            new_posts = processor._filter_duplicates([make_post(1), make_post(3)], existing_links)
+        
+        self.assertEqual(new_posts, [make_post(3)])
+    
+    def test_rebuilds_after_ttl_expires(self):
+        """Test that the filter is reloaded from the sheet once DUP_CACHE_TTL_SEC passes."""
+        processor = self.make_processor(DUP_CACHE_TTL_SEC='60')
+        first = processor.load_existing_links()
+        self.assertIs(processor.load_existing_links(), first)
+        
+        processor._links_loaded_at -= 120
+        self.sheets.get_column_values.return_value = ['https://x.com/user/status/5']
+        rebuilt = processor.load_existing_links()
+        
+        self.assertIsNot(rebuilt, first)
+        self.assertIn('https://x.com/user/status/5', rebuilt)
+        self.assertEqual(self.sheets.get_column_values.call_count, 2)
+    
+    def test_rebuilds_when_over_capacity(self):
+        """Test that a filter holding more links than it was sized for is rebuilt."""
+        processor = self.make_processor()
+        first = processor.load_existing_links()
+        first.capacity = 0
+        
+        rebuilt = processor.load_existing_links()
+        
+        self.assertIsNot(rebuilt, first)
+        self.assertEqual(rebuilt.capacity, 10000)
+    
+    def test_restart_rebuilds_from_store(self):
+        """Test that a new process rebuilds the filter from the link store, not the sheet."""
+        seen_db = os.path.join(self.temp_dir.name, 'seen.db')
+        processor = self.make_processor(SEEN_LINKS_DB=seen_db)
+        processor.process_posts_to_sheets([make_post(2)])
+        processor.close()
+        self.sheets.get_column_values.reset_mock()
+        
+        restarted = self.make_processor(SEEN_LINKS_DB=seen_db)
+        results = restarted.process_posts_to_sheets([make_post(1), make_post(2), make_post(3)])
+        
+        self.sheets.get_column_values.assert_not_called()
+        self.assertEqual(results['uploaded'], 1)
+        self.assertEqual(results['duplicates'], 2)
+
+
+
+class TestRunGeminiAnalysis(unittest.TestCase):
+    """Test cases for SequentialProcessor.run_gemini_analysis."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        
+        self.processor = SequentialProcessor(Mock(), {'SHEETS_BATCH_SIZE': '2'})
+        self.processor._gemini_initialized = True
+        self.processor.gemini_analyzer = Mock()
+        self.analyzer = self.processor.sheet_analyzer = Mock()
+        self.analyzer.ensure_columns_exist.return_value = (6, 7, 8, -1)
+        self.analyzer.write_summaries.return_value = True
+        self.analyzer.write_analysis_results.return_value = True
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.processor.close()
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()
+    
+    def test_last_batch_written_with_daily_draft(self):
+        """Test that earlier batches are written on their own and the last one with the draft."""
+        project = ProjectSummary(date='2025-08-14', project_info=ProjectInfo('proj', 'link', 'bio'),
+                                 ai_summary='Summary', row_index=3)
+        first = [(2, 'Not new project related'), (3, 'Summary')]
+        last = [(4, 'Not new project related')]
+        self.analyzer.iter_analysis_batches.return_value = iter([(first, [project]), (last, [])])
+        
+        results = self.processor.run_gemini_analysis()
+        
+        self.analyzer.iter_analysis_batches.assert_called_once_with(2)
+        self.analyzer.write_summaries.assert_called_once_with(first, 6, 7, -1)
+        self.analyzer.write_analysis_results.assert_called_once_with(last, [project], 6, 7, 8, -1)
+        self.analyzer.generate_and_write_daily_draft.assert_not_called()
+        self.assertTrue(results['success'])
+        self.assertEqual(results['posts_analyzed'], 3)
+        self.assertEqual(results['projects_found'], 1)
+    
+    def test_analyzer_paced_per_request(self):
+        """Test that the Gemini analyzer takes its tokens from the processor's bucket."""
+        processor = SequentialProcessor(Mock(), {'GEMINI_API_KEY': 'key', 'GEMINI_DAILY_LIMIT': '190'})
+        self.addCleanup(processor.close)
+        
+        with patch('modules.scheduler.GeminiAnalyzer') as mock_analyzer:
+            processor._ensure_gemini()
+        
+        self.assertIs(mock_analyzer.call_args[1]['request_bucket'], processor.gemini_bucket)
+        self.assertEqual(processor.gemini_bucket.burst, 190)
+    
+    def test_retry_hint_is_capped(self):
+        """Test that a server retry hint is honoured but clamped to the cap."""
+        self.assertEqual(SequentialProcessor._retry_delay("429 Retry-After: 12", 1), 12.0)
+        self.assertEqual(SequentialProcessor._retry_delay("retry_delay { seconds: 86400 }", 1), 300.0)
+        self.assertLessEqual(SequentialProcessor._retry_delay("quota exceeded", 5), 330.0)
+    
+    def test_nothing_to_analyze(self):
+        """Test that no write happens when there are no new rows."""
+        self.analyzer.iter_analysis_batches.return_value = iter([])
+        
+        results = self.processor.run_gemini_analysis()
+        
+        self.analyzer.write_analysis_results.assert_not_called()
+        self.assertTrue(results['success'])
+
+
+class TestRunPublisher(unittest.TestCase):
+    """Test cases for SequentialProcessor.run_publisher with several publishers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.old_cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        
+        headers = ['Date', 'Daily Post Draft']
+        self.sheets = Mock()
+        self.sheets.get_sheet_data.return_value = [headers, ['2025-08-14', 'Daily draft']]
+        self.sheets.get_row.side_effect = lambda row: list(headers) if row == 1 else ['2025-08-14', 'Daily draft']
+        
+        self.processor = SequentialProcessor(self.sheets, {
+            'PUBLISHER_TYPE': 'twitter, typefully',
+            'X_API_KEY': 'key', 'X_API_SECRET': 'secret',
+            'X_ACCESS_TOKEN': 'token', 'X_ACCESS_TOKEN_SECRET': 'token_secret',
+            'TYPEFULLY_API_KEY': 'typefully_key'
+        })
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.processor.close()
+        os.chdir(self.old_cwd)
+        self.temp_dir.cleanup()
+    
+    def make_publisher(self, result):
+        publisher = Mock()
+        publisher.publish_async = AsyncMock(return_value=result)
+        publisher.aclose = AsyncMock()
+        return publisher
+    
+    def test_publishes_with_every_publisher(self):
+        """Test that the draft goes to all configured publishers, keeping partial failures."""
+        publishers = [
+            self.make_publisher(PublishResult(success=False, error_msg="Forbidden")),
+            self.make_publisher(PublishResult(success=True, url="https://typefully.com/drafts/7", post_id='7'))
+        ]
+        create = AsyncMock(return_value=publishers)
+        
+        with patch('modules.scheduler.create_publishers_async', create):
+            results = self.processor.run_publisher()
+        
+        configs = create.call_args[0][0]
+        self.assertEqual([config['type'] for config in configs], ['twitter', 'typefully'])
+        for publisher in publishers:
+            publisher.publish_async.assert_awaited_once_with('Daily draft')
+            publisher.aclose.assert_awaited_once()
+        self.assertTrue(results['published'])
+        self.assertEqual(results['url'], "https://typefully.com/drafts/7")
+        self.assertEqual(results['errors'], ["Mock: Forbidden"])
+        receipt = self.sheets.update_cell.call_args[0][2]
+        self.assertEqual(receipt, "Failed: Forbidden | Published: 7")
+
+
+if __name__ == '__main__':
+    unittest.main()
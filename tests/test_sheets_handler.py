@@ -8,13 +8,14 @@ from pathlib import Path
 from datetime import datetime
 import tempfile
 import csv
+import json
 import os
 from unittest.mock import Mock, patch, MagicMock
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from modules.sheets_handler import GoogleSheetsHandler
+from modules.sheets_handler import GoogleSheetsHandler, column_letter
 
 
 class TestGoogleSheetsHandler(unittest.TestCase):
@@ -51,7 +52,8 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         self.assertEqual(handler.sheet_id, self.test_sheet_id)
         self.assertIsNotNone(handler.service)
         mock_credentials.from_service_account_file.assert_called_once()
-        mock_build.assert_called_once_with('sheets', 'v4', credentials=mock_credentials.from_service_account_file.return_value)
+        mock_build.assert_called_once_with('sheets', 'v4', credentials=mock_credentials.from_service_account_file.return_value,
+                                           static_discovery=True, cache_discovery=False)
     
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
@@ -60,6 +62,19 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             GoogleSheetsHandler("non_existent_file.json", self.test_sheet_id)
     
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_credentials_reused(self, mock_credentials, mock_build):
+        """Test that handlers for the same key file share loaded credentials."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_build.return_value = Mock()
+        
+        GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        GoogleSheetsHandler(self.temp_creds.name, 'another-sheet')
+        
+        self.assertEqual(mock_credentials.from_service_account_file.call_count, 1)
+        self.assertEqual(mock_build.call_count, 2)
+    
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
     def test_read_csv(self, mock_credentials, mock_build):
@@ -98,6 +113,110 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             handler.read_csv(Path("non_existent.csv"))
     
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_iter_csv_byte_order_mark(self, mock_credentials, mock_build):
+        """Test that a byte order mark picks the encoding and is not read as data."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_build.return_value = Mock()
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        
+        for encoding in ('utf-8-sig', 'utf-16'):
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+                f.write('date,author\r\n2025-08-14,Jos\xe9\r\n'.encode(encoding))
+                csv_path = f.name
+            
+            try:
+                self.assertEqual(handler.read_csv(Path(csv_path)),
+                                 [['date', 'author'], ['2025-08-14', 'Jos\xe9']])
+            finally:
+                os.unlink(csv_path)
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_iter_csv_latin1(self, mock_credentials, mock_build):
+        """Test streaming a CSV that is not valid UTF-8."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_build.return_value = Mock()
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write('author,content\r\nJos\xe9,Caf\xe9\r\n'.encode('latin-1'))
+            csv_path = f.name
+        
+        try:
+            rows = handler.iter_csv(Path(csv_path))
+            
+            self.assertEqual(next(rows), ['author', 'content'])
+            self.assertEqual(list(rows), [['Jos\xe9', 'Caf\xe9']])
+        finally:
+            os.unlink(csv_path)
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_update_sheet_from_csv_bad_bytes_after_probe(self, mock_credentials, mock_build):
+        """Test that a cp1252 byte past the encoding probe does not stop the upload."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        mock_service.spreadsheets().values().append().execute.return_value = {
+            'updates': {'updatedRows': 2, 'updatedRange': 'Sheet1!A2:B3'}
+        }
+        mock_append = mock_service.spreadsheets().values().append
+        mock_append.reset_mock()
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler.ENCODING_PROBE_BYTES = 32
+        
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            # The probe only sees valid UTF-8, so the file is read as UTF-8
+            f.write('author,content\r\nJos\xe9,Caf\xe9 au lait\r\n'.encode('utf-8'))
+            f.write('Zo\xeb,Cr\xe8me br\xfbl\xe9e\r\n'.encode('cp1252'))
+            csv_path = f.name
+        
+        try:
+            with patch.object(handler, 'get_row', return_value=['author', 'content']):
+                handler.update_sheet_from_csv(Path(csv_path), 'Sheet1')
+            
+            self.assertEqual(mock_append.call_args[1]['body']['values'],
+                             [['Jos\xe9', 'Caf\xe9 au lait'], ['Zo\xeb', 'Cr\xe8me br\xfbl\xe9e']])
+        finally:
+            os.unlink(csv_path)
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_iter_csv_arrow_fallback_blank_lines(self, mock_credentials, mock_build):
+        """Test that the csv fallback resumes after Arrow's rows when the file has blank lines."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_build.return_value = Mock()
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write(b'date,author\r\n\r\n2025-08-14,alice\r\n\r\n\r\n2025-08-15,bob\r\n2025-08-16,carol\r\n')
+            csv_path = f.name
+        
+        # Arrow skips blank lines, then gives up partway through the file
+        arrow_invalid = type('ArrowInvalid', (Exception,), {})
+        
+        def arrow_rows(file_path, encoding):
+            yield ['date', 'author']
+            yield ['2025-08-14', 'alice']
+            raise arrow_invalid("row 4: unexpected quote")
+        
+        try:
+            with patch('modules.sheets_handler.pa_csv', Mock()), \
+                 patch('modules.sheets_handler.pa', Mock(ArrowInvalid=arrow_invalid)), \
+                 patch.object(handler, '_iter_csv_arrow', side_effect=arrow_rows):
+                rows = list(handler.iter_csv(Path(csv_path)))
+            
+            self.assertEqual(rows, [['date', 'author'], ['2025-08-14', 'alice'],
+                                    ['2025-08-15', 'bob'], ['2025-08-16', 'carol']])
+        finally:
+            os.unlink(csv_path)
+    
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
     def test_clear_sheet_preserve_headers(self, mock_credentials, mock_build):
@@ -107,20 +226,27 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         mock_build.return_value = mock_service
         
         # Mock the API responses
-        mock_get_response = {
-            'values': [['date', 'time', 'author', 'post_link', 'content', 'author_link']]
+        mock_service.spreadsheets().get().execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 0, 'title': 'Sheet1'}},
+                       {'properties': {'sheetId': 42, 'title': 'Archive'}}]
         }
-        mock_service.spreadsheets().values().get().execute.return_value = mock_get_response
-        mock_service.spreadsheets().values().clear().execute.return_value = {}
-        mock_service.spreadsheets().values().update().execute.return_value = {}
+        mock_service.spreadsheets().batchUpdate().execute.return_value = {}
+        mock_get = mock_service.spreadsheets().get
+        mock_get.reset_mock()
         
         handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
         handler.clear_sheet('Sheet1', preserve_headers=True)
+        handler.clear_sheet('Archive', preserve_headers=True)
         
-        # Verify API calls were made
-        mock_service.spreadsheets().values().get.assert_called()
-        mock_service.spreadsheets().values().clear.assert_called()
-        mock_service.spreadsheets().values().update.assert_called()
+        # Rows below the header are cleared in one request, without re-writing headers
+        body = mock_service.spreadsheets().batchUpdate.call_args[1]['body']
+        self.assertEqual(body['requests'][0]['updateCells']['range'],
+                         {'sheetId': 42, 'startRowIndex': 1})
+        mock_service.spreadsheets().values().clear.assert_not_called()
+        mock_service.spreadsheets().values().update.assert_not_called()
+        
+        # Sheet IDs are looked up once
+        self.assertEqual(mock_get.call_count, 1)
     
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
@@ -175,10 +301,86 @@ class TestGoogleSheetsHandler(unittest.TestCase):
             for i in range(150)
         ]
         
-        handler.batch_append_data(test_data, 'Sheet1', batch_size=50)
+        handler.batch_append_data(test_data, 'Sheet1')
         
-        # Should be called at least 3 times (150 rows / 50 batch size)
-        self.assertGreaterEqual(mock_service.spreadsheets().values().append.call_count, 3)
+        # All rows fit in one request, so they are not split
+        mock_append = mock_service.spreadsheets().values().append
+        self.assertEqual(mock_append.call_args[1]['body'], {'values': test_data})
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_append_all_single_request(self, mock_credentials, mock_build):
+        """Test that append_all sends rows in one request and splits by size."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().append().execute.return_value = {
+            'updates': {'updatedRows': 150}
+        }
+        mock_append = mock_service.spreadsheets().values().append
+        mock_append.reset_mock()
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        test_data = [['2025-08-14', f'{i:02d}:00', f'Content {i}'] for i in range(150)]
+        
+        handler.append_all(test_data, 'Sheet1')
+        self.assertEqual(mock_append.call_count, 1)
+        self.assertEqual(mock_append.call_args[1]['body'], {'values': test_data})
+        
+        # A tiny size limit forces the rows to be split across requests:
+        # one append, then fixed-range writes batched after it
+        mock_service.spreadsheets().values().append().execute.return_value = {
+            'updates': {'updatedRows': 10, 'updatedRange': 'Sheet1!A2:C11'}
+        }
+        mock_append.reset_mock()
+        mock_update = mock_service.spreadsheets().values().update
+        mock_update.reset_mock()
+        handler.MAX_REQUEST_BYTES = 1024
+        handler.append_all(test_data, 'Sheet1')
+        self.assertEqual(mock_append.call_count, 1)
+        self.assertTrue(mock_service.new_batch_http_request.called)
+        appended = mock_append.call_args[1]['body']['values']
+        writes = [call[1] for call in mock_update.call_args_list]
+        self.assertEqual(writes[0]['range'], 'Sheet1!A12')
+        sent = appended + [row for write in writes for row in write['body']['values']]
+        self.assertEqual(sent, test_data)
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_append_all_caps_batch_bytes(self, mock_credentials, mock_build):
+        """Test that batched writes of near-limit chunks stay under MAX_REQUEST_BYTES per call."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().append().execute.return_value = {
+            'updates': {'updatedRows': 3, 'updatedRange': 'Sheet1!A2:C4'}
+        }
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler.MAX_REQUEST_BYTES = 1024
+        # ~300 bytes per row, so each chunk holds 3 rows and sits just under the limit
+        test_data = [['2025-08-14', f'{i:02d}:00', 'x' * 280] for i in range(30)]
+        
+        batches = []
+        write_batched = handler._write_chunks_batched
+        
+        def record(chunks, sheet_name):
+            batches.append([rows for _, rows in chunks])
+            write_batched(chunks, sheet_name)
+        
+        with patch.object(handler, '_write_chunks_batched', side_effect=record):
+            self.assertEqual(handler.append_all(test_data, 'Sheet1'), 30)
+        
+        self.assertTrue(batches)
+        for batch in batches:
+            batch_bytes = sum(len(json.dumps(row).encode('utf-8')) + 1
+                              for rows in batch for row in rows)
+            self.assertLessEqual(batch_bytes, handler.MAX_REQUEST_BYTES)
+            self.assertGreater(batch_bytes, handler.MAX_REQUEST_BYTES * 3 // 4)
+        sent = [row for batch in batches for rows in batch for row in rows]
+        self.assertEqual(sent, test_data[3:])
     
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
@@ -203,6 +405,10 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         
         self.assertIsNotNone(last_date)
         self.assertEqual(last_date.strftime('%Y-%m-%d'), '2025-08-14')
+        
+        # The last row is unknown at first, so column A is read in one call
+        mock_get = mock_service.spreadsheets().values().get
+        self.assertEqual(mock_get.call_args[1]['range'], 'Sheet1!A:A')
     
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
@@ -216,11 +422,47 @@ class TestGoogleSheetsHandler(unittest.TestCase):
             'values': [['date']]  # Only headers
         }
         mock_service.spreadsheets().values().get().execute.return_value = mock_get_response
+        mock_get = mock_service.spreadsheets().values().get
+        mock_get.reset_mock()
         
         handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
         last_date = handler.get_last_entry_date('Sheet1')
         
         self.assertIsNone(last_date)
+        mock_get.assert_called_once()
+        self.assertEqual(mock_get.call_args[1]['range'], 'Sheet1!A:A')
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_get_last_entry_date_padded_grid(self, mock_credentials, mock_build):
+        """Test that the last row comes from the append response, not the padded grid size."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        # INSERT_ROWS appends leave ~1000 blank grid rows below the data
+        mock_service.spreadsheets().get().execute.return_value = {
+            'sheets': [{'properties': {'gridProperties': {'rowCount': 1006}}}]
+        }
+        mock_service.spreadsheets().values().append().execute.return_value = {
+            'updates': {'updatedRange': 'Sheet1!A5:F6', 'updatedRows': 2}
+        }
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            'values': [['date'], ['2025-08-11'], ['2025-08-12'], ['2025-08-13'],
+                       ['2025-08-14'], ['2025-08-15']]
+        }
+        mock_get = mock_service.spreadsheets().values().get
+        mock_get.reset_mock()
+        mock_service.spreadsheets().get.reset_mock()
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler.append_data([['2025-08-14'], ['2025-08-15']], 'Sheet1')
+        last_date = handler.get_last_entry_date('Sheet1')
+        
+        self.assertEqual(last_date.strftime('%Y-%m-%d'), '2025-08-15')
+        mock_get.assert_called_once()
+        self.assertEqual(mock_get.call_args[1]['range'], 'Sheet1!A1:A206')
+        mock_service.spreadsheets().get.assert_not_called()
     
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
@@ -252,8 +494,9 @@ class TestGoogleSheetsHandler(unittest.TestCase):
     
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
+    @patch('modules.sheets_handler.random.uniform', return_value=1.0)
     @patch('time.sleep')
-    def test_retry_on_rate_limit(self, mock_sleep, mock_credentials, mock_build):
+    def test_retry_on_rate_limit(self, mock_sleep, mock_uniform, mock_credentials, mock_build):
         """Test exponential backoff retry on rate limit."""
         mock_credentials.from_service_account_file.return_value = Mock()
         mock_service = Mock()
@@ -266,6 +509,7 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         error_content = json.dumps({'error': {'code': 429, 'message': 'Rate limit exceeded'}})
         mock_resp = Mock()
         mock_resp.status = 429
+        mock_resp.get.return_value = None  # No Retry-After header
         rate_limit_error = HttpError(mock_resp, error_content.encode())
         
         # First two calls fail with rate limit, third succeeds
@@ -285,6 +529,36 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         mock_sleep.assert_any_call(1)
         mock_sleep.assert_any_call(2)
     
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    @patch('time.sleep')
+    def test_retry_honors_retry_after(self, mock_sleep, mock_credentials, mock_build):
+        """Test that the Retry-After header sets the delay and the budget caps it."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_build.return_value = Mock()
+        
+        from googleapiclient.errors import HttpError
+        
+        mock_resp = Mock()
+        mock_resp.status = 503
+        mock_resp.get.return_value = '7'
+        unavailable_error = HttpError(mock_resp, b'')
+        
+        mock_request = Mock()
+        mock_request.execute.side_effect = [unavailable_error, {}]
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler._execute_with_retry(mock_request)
+        mock_sleep.assert_called_once_with(7.0)
+        
+        # A wait longer than the retry budget is not attempted
+        mock_sleep.reset_mock()
+        mock_resp.get.return_value = '120'
+        mock_request.execute.side_effect = [unavailable_error, {}]
+        with self.assertRaises(HttpError):
+            handler._execute_with_retry(mock_request)
+        mock_sleep.assert_not_called()
+    
     @patch('modules.sheets_handler.build')
     @patch('modules.sheets_handler.Credentials')
     def test_update_sheet_from_csv_replace_mode(self, mock_credentials, mock_build):
@@ -294,9 +568,12 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         mock_build.return_value = mock_service
         
         # Setup mock responses
-        mock_service.spreadsheets().values().get().execute.return_value = {'values': []}
-        mock_service.spreadsheets().values().clear().execute.return_value = {}
-        mock_service.spreadsheets().values().append().execute.return_value = {'updates': {'updatedRows': 2}}
+        mock_service.spreadsheets().get().execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 7, 'title': 'Sheet1'}}]
+        }
+        mock_service.spreadsheets().batchUpdate().execute.return_value = {}
+        mock_batch_update = mock_service.spreadsheets().batchUpdate
+        mock_batch_update.reset_mock()
         
         handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
         
@@ -310,13 +587,162 @@ class TestGoogleSheetsHandler(unittest.TestCase):
         try:
             handler.update_sheet_from_csv(Path(csv_path), 'Sheet1', mode='replace')
             
-            # Verify clear was called
-            mock_service.spreadsheets().values().clear.assert_called()
-            # Verify append was called twice (headers + data)
-            self.assertGreaterEqual(mock_service.spreadsheets().values().append.call_count, 1)
+            # Clear and write go out in a single batchUpdate
+            self.assertEqual(mock_batch_update.call_count, 1)
+            clear_request, append_request = mock_batch_update.call_args[1]['body']['requests']
+            self.assertEqual(clear_request['updateCells']['range'], {'sheetId': 7})
+            rows = append_request['appendCells']['rows']
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[1]['values'][2], {'userEnteredValue': {'stringValue': 'TestUser'}})
+            self.assertTrue(handler.has_headers('Sheet1'))
         finally:
             os.unlink(csv_path)
 
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_get_row_reads_single_row(self, mock_credentials, mock_build):
+        """Test that get_row only requests the target row."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            'values': [['2025-08-14', '10:00', 'Content']]
+        }
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        row = handler.get_row(2, 'Sheet1')
+        
+        self.assertEqual(row, ['2025-08-14', '10:00', 'Content'])
+        call_args = mock_service.spreadsheets().values().get.call_args
+        self.assertEqual(call_args[1]['range'], 'Sheet1!2:2')
+
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_batch_update_single_request(self, mock_credentials, mock_build):
+        """Test that batch_update sends all ranges in one request."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().batchUpdate().execute.return_value = {
+            'totalUpdatedCells': 2
+        }
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        data = [
+            {'range': 'Sheet1!G2', 'values': [['Summary']]},
+            {'range': 'Sheet1!I2', 'values': [['Draft']]}
+        ]
+        handler.batch_update(data)
+        
+        call_args = mock_service.spreadsheets().values().batchUpdate.call_args
+        self.assertEqual(call_args[1]['body'], {'valueInputOption': 'RAW', 'data': data})
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_write_with_headers_caches_header_row(self, mock_credentials, mock_build):
+        """Test that write_with_headers targets the given sheet and caches its headers."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().batchUpdate().execute.return_value = {
+            'totalUpdatedCells': 4
+        }
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler.write_with_headers(['Date', 'Content'], [['2025-08-14', 'Post']], 'Posts')
+        
+        call_args = mock_service.spreadsheets().values().batchUpdate.call_args
+        self.assertEqual(call_args[1]['body']['data'], [
+            {'range': 'Posts!A1', 'values': [['Date', 'Content']]},
+            {'range': 'Posts!A2', 'values': [['2025-08-14', 'Post']]}
+        ])
+        
+        # The header check is answered from the cache
+        mock_service.spreadsheets().values().get.reset_mock()
+        self.assertTrue(handler.has_headers('Posts'))
+        mock_service.spreadsheets().values().get.assert_not_called()
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_update_cell_targets_single_cell(self, mock_credentials, mock_build):
+        """Test that update_cell writes only the target cell without clearing."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler.update_cell(5, 8, 'Receipt')
+        
+        call_args = mock_service.spreadsheets().values().update.call_args
+        self.assertEqual(call_args[1]['range'], 'Sheet1!I5')
+        self.assertEqual(call_args[1]['body'], {'values': [['Receipt']]})
+        mock_service.spreadsheets().values().clear.assert_not_called()
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_get_column_values_fetches_single_column(self, mock_credentials, mock_build):
+        """Test that get_column_values requests only the matching column."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().get().execute.side_effect = [
+            {'values': [['Date', 'Time', 'Content', 'Post Link']]},
+            {'values': [['https://x.com/a/status/1', '', 'https://x.com/b/status/2']]},
+            {'values': [['Post Link', 'https://x.com/a/status/1']]}
+        ]
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        links = handler.get_column_values('Post Link')
+        
+        self.assertEqual(links, ['https://x.com/a/status/1', '', 'https://x.com/b/status/2'])
+        call_args = mock_service.spreadsheets().values().get.call_args
+        self.assertEqual(call_args[1]['range'], 'Sheet1!D2:D')
+        self.assertEqual(call_args[1]['majorDimension'], 'COLUMNS')
+        
+        # Header lookup is cached, so the second call is a single request
+        links = handler.get_column_values('Post Link')
+        self.assertEqual(links, ['https://x.com/a/status/1'])
+        call_args = mock_service.spreadsheets().values().get.call_args
+        self.assertEqual(call_args[1]['range'], 'Sheet1!D1:D')
+        self.assertEqual(mock_service.spreadsheets().values().get().execute.call_count, 3)
+    
+    @patch('modules.sheets_handler.build')
+    @patch('modules.sheets_handler.Credentials')
+    def test_get_column_values_moved_column(self, mock_credentials, mock_build):
+        """Test that a cached column letter is resolved again once the header moves."""
+        mock_credentials.from_service_account_file.return_value = Mock()
+        mock_service = Mock()
+        mock_build.return_value = mock_service
+        
+        mock_service.spreadsheets().values().get().execute.side_effect = [
+            {'values': [['Date', 'Time', 'Content', 'Post Link']]},
+            {'values': [['https://x.com/a/status/1']]},
+            {'values': [['Content', 'Old content']]},
+            {'values': [['Date', 'Time', 'Views', 'Content', 'Post Link']]},
+            {'values': [['https://x.com/a/status/1', 'https://x.com/b/status/2']]}
+        ]
+        
+        handler = GoogleSheetsHandler(self.temp_creds.name, self.test_sheet_id)
+        handler.get_column_values('Post Link')
+        links = handler.get_column_values('Post Link')
+        
+        self.assertEqual(links, ['https://x.com/a/status/1', 'https://x.com/b/status/2'])
+        call_args = mock_service.spreadsheets().values().get.call_args
+        self.assertEqual(call_args[1]['range'], 'Sheet1!E2:E')
+        self.assertEqual(handler._column_letters[('Sheet1', 'Post Link')], 'E')
+    
+    def test_column_letter(self):
+        """Test conversion of column indices to A1 letters."""
+        self.assertEqual(column_letter(0), 'A')
+        self.assertEqual(column_letter(25), 'Z')
+        self.assertEqual(column_letter(26), 'AA')
+        self.assertEqual(column_letter(701), 'ZZ')
+        self.assertEqual(column_letter(702), 'AAA')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
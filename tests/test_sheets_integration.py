@@ -69,8 +69,7 @@ def main():
         handler.update_sheet_from_csv(
             csv_path=csv_file,
             sheet_name=config.GOOGLE_SHEET_NAME,
-            mode='append',  # Use 'replace' to clear sheet first
-            batch_size=config.SHEETS_BATCH_SIZE
+            mode='append'  # Use 'replace' to clear sheet first
         )
         
         logger.info("Upload completed successfully!")
@@ -0,0 +1,413 @@
+"""Unit tests for the X publishers."""
+
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.x_publisher import (
+    PublishResult, SheetPublisher, TwitterAPIPublisher, TypefullyPublisher, XPublisher,
+    create_publishers_async, publish_to_all
+)
+
+
+class TestTwitterAPIPublisher(unittest.TestCase):
+    """Test cases for TwitterAPIPublisher."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.publisher = TwitterAPIPublisher('key', 'secret', 'token', 'token_secret')
+        self.publisher.client = Mock()
+        self.publisher._username = 'user'
+        self.posted = []
+        self.headers = {}
+        
+        def create_tweet(text, in_reply_to_tweet_id=None):
+            self.posted.append(text)
+            return Mock(content=b'{"data": {"id": "%d"}}' % len(self.posted),
+                        headers=self.headers)
+        
+        self.publisher.client.create_tweet.side_effect = create_tweet
+    
+    def rate_limit(self, remaining, reset):
+        return {'x-rate-limit-remaining': str(remaining), 'x-rate-limit-reset': str(reset)}
+    
+    def test_thread_tweets_are_lazy(self):
+        """Test that chunks are produced on demand with the total known up front."""
+        content = "\n".join(f"Line {i} " + "x" * 60 for i in range(20))
+        
+        total, tweets = self.publisher._thread_tweets(content, max_length=280)
+        
+        self.assertNotIsInstance(tweets, list)
+        first = next(tweets)
+        self.assertTrue(first.startswith(f"(1/{total}) "))
+        rest = list(tweets)
+        self.assertEqual(len(rest) + 1, total)
+        self.assertTrue(all(len(tweet) <= 280 for tweet in [first] + rest))
+    
+    @patch('modules.x_publisher.time.sleep')
+    def test_publish_thread(self, mock_sleep):
+        """Test that a long post goes out as a numbered thread of replies."""
+        content = "\n".join(f"Line {i} " + "x" * 400 for i in range(20))
+        
+        result = self.publisher.publish(content)
+        
+        self.assertTrue(result.success)
+        total = len(self.posted)
+        self.assertGreater(total, 1)
+        for i, text in enumerate(self.posted, 1):
+            self.assertTrue(text.startswith(f"({i}/{total}) "))
+            self.assertLessEqual(len(text), 3800)
+        replies = self.publisher.client.create_tweet.call_args_list[1:]
+        self.assertEqual([call[1]['in_reply_to_tweet_id'] for call in replies],
+                         [str(i) for i in range(1, total)])
+        self.assertEqual(result.post_id, str(total))
+    
+    def test_publish_single_tweet(self):
+        """Test that short content is posted once, without numbering."""
+        result = self.publisher.publish("Short update")
+        
+        self.assertTrue(result.success)
+        self.assertEqual(len(self.posted), 1)
+        self.assertTrue(self.posted[0].startswith("Short update"))
+        self.assertEqual(result.url, "https://twitter.com/user/status/1")
+    
+    @patch('modules.x_publisher.time.time', return_value=1000.0)
+    @patch('modules.x_publisher.time.sleep')
+    def test_replies_paced_by_rate_limit_headers(self, mock_sleep, mock_time):
+        """Test that replies go out back to back until the window is used up."""
+        content = "\n".join(f"Line {i} " + "x" * 400 for i in range(20))
+        self.headers = self.rate_limit(5, 1010)
+        
+        self.assertTrue(self.publisher.publish(content).success)
+        mock_sleep.assert_not_called()
+        
+        self.posted.clear()
+        self.headers = self.rate_limit(0, 1010)
+        
+        self.assertTrue(self.publisher.publish(content.replace("Line", "Row")).success)
+        self.assertEqual(mock_sleep.call_count, len(self.posted) - 1)
+        self.assertTrue(all(10 <= call[0][0] <= 11 for call in mock_sleep.call_args_list))
+    
+    @patch('modules.x_publisher.time.time', return_value=1000.0)
+    @patch('modules.x_publisher.time.sleep')
+    def test_reset_too_far_away_fails(self, mock_sleep, mock_time):
+        """Test that a thread stops instead of sleeping until a distant reset."""
+        content = "\n".join(f"Line {i} " + "x" * 400 for i in range(20))
+        self.headers = self.rate_limit(0, 1900)
+        
+        result = self.publisher.publish(content)
+        
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_msg, "X API rate limit exceeded")
+        self.assertEqual(len(self.posted), 1)
+        mock_sleep.assert_not_called()
+    
+    @patch('modules.x_publisher.time.time', return_value=1000.0)
+    @patch('modules.x_publisher.time.sleep')
+    def test_retries_after_429(self, mock_sleep, mock_time):
+        """Test that a 429 waits for the reset in its headers and retries once."""
+        error = Exception("429 Too Many Requests")
+        error.response = Mock(status_code=429, headers={'x-rate-limit-reset': '1005'})
+        create_tweet = self.publisher.client.create_tweet.side_effect
+        self.publisher.client.create_tweet.side_effect = [error, create_tweet("Short update")]
+        
+        result = self.publisher.publish("Short update")
+        
+        self.assertTrue(result.success)
+        self.assertEqual(self.publisher.client.create_tweet.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertTrue(5 <= mock_sleep.call_args[0][0] <= 6)
+
+
+
+class FakeResponse:
+    """aiohttp response stand-in used as an async context manager."""
+    
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+    
+    async def read(self):
+        return self.body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSession stand-in that records posted payloads."""
+    
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+        self.posted = []
+        self.error = None
+    
+    def post(self, url, json=None):
+        if self.error:
+            raise self.error
+        self.posted.append(json)
+        return FakeResponse(200, b'{"id": %d}' % len(self.posted))
+    
+    async def close(self):
+        self.closed = True
+
+
+class TestTypefullyPublisherAsync(unittest.TestCase):
+    """Test cases for TypefullyPublisher.publish_async."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.aiohttp = Mock()
+        self.aiohttp.ClientError = type('ClientError', (Exception,), {})
+        self.aiohttp.ClientSession.side_effect = FakeSession
+        patcher = patch('modules.x_publisher.aiohttp', self.aiohttp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.publisher = TypefullyPublisher('test_key')
+        self.addCleanup(self.publisher.close)
+    
+    def test_publish_async_shares_session(self):
+        """Test that drafts share one session that aclose() closes."""
+        async def run():
+            results = await asyncio.gather(
+                self.publisher.publish_async("First draft"),
+                self.publisher.publish_async("Second draft")
+            )
+            session = self.publisher._aio_session
+            await self.publisher.aclose()
+            return results, session
+        
+        results, session = asyncio.run(run())
+        
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(sorted(result.post_id for result in results), ['1', '2'])
+        self.aiohttp.ClientSession.assert_called_once()
+        self.assertEqual(session.kwargs['headers'], {"X-API-KEY": 'test_key'})
+        self.assertEqual(len(session.posted), 2)
+        self.assertTrue(session.closed)
+        self.assertIsNone(self.publisher._aio_session)
+    
+    def test_new_loop_gets_new_session(self):
+        """Test that a session left open by an earlier loop is not reused."""
+        asyncio.run(self.publisher.publish_async("First draft"))
+        stale = self.publisher._aio_session
+        
+        result = asyncio.run(self.publisher.publish_async("Second draft"))
+        
+        self.assertTrue(result.success)
+        self.assertIsNot(self.publisher._aio_session, stale)
+        self.assertEqual(self.aiohttp.ClientSession.call_count, 2)
+    
+    def test_publish_async_client_error(self):
+        """Test that a connection error becomes a failed result."""
+        async def run():
+            session = self.publisher._get_aio_session()
+            session.error = self.aiohttp.ClientError("connection reset")
+            try:
+                return await self.publisher.publish_async("Draft")
+            finally:
+                await self.publisher.aclose()
+        
+        result = asyncio.run(run())
+        
+        self.assertFalse(result.success)
+        self.assertIn("connection reset", result.error_msg)
+        self.assertFalse(self.publisher.is_duplicate("Draft"))
+
+
+
+class TestTypefullyPublishBatch(unittest.TestCase):
+    """Test cases for TypefullyPublisher.publish_batch."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.publisher = TypefullyPublisher('test_key')
+        self.publisher.session = Mock()
+        self.publisher.rate_limiter = Mock()
+        self.publisher.rate_limiter.can_publish.return_value = True
+    
+    def respond(self, *responses):
+        self.publisher.session.post.side_effect = [
+            Mock(status_code=status, content=body) for status, body in responses
+        ]
+    
+    def test_bulk_request_and_response(self):
+        """Test that valid, unique drafts go out in one bulk request in order."""
+        self.respond((200, b'{"drafts": [{"id": 11}, {"id": 12}]}'))
+        
+        results = self.publisher.publish_batch(["First", "  ", "Second", "First"])
+        
+        self.publisher.session.post.assert_called_once()
+        args, kwargs = self.publisher.session.post.call_args
+        self.assertEqual(args[0], "https://api.typefully.com/v1/drafts/bulk/")
+        self.assertEqual(kwargs['json'], {"drafts": [
+            {"content": self.publisher.format_for_publishing("First"), "schedule-date": "next-free-slot"},
+            {"content": self.publisher.format_for_publishing("Second"), "schedule-date": "next-free-slot"}
+        ]})
+        self.assertEqual([result.success for result in results], [True, False, True, False])
+        self.assertEqual(results[0].url, "https://typefully.com/drafts/11")
+        self.assertEqual(results[2].post_id, "12")
+        self.assertEqual(results[1].error_msg, "Content validation failed")
+        self.assertEqual(results[3].error_msg, "Duplicate content")
+        self.publisher.rate_limiter.record_post.assert_called_once_with(2)
+        self.assertTrue(self.publisher.is_duplicate("Second"))
+    
+    def test_only_confirmed_drafts_count(self):
+        """Test that drafts missing from the response are failed and can be retried."""
+        self.respond((201, b'[{"id": 21}, {"status": "queued"}]'))
+        
+        results = self.publisher.publish_batch(["First", "Second", "Third"])
+        
+        self.assertEqual([result.success for result in results], [True, False, False])
+        self.assertEqual(results[1].error_msg, "Draft missing from Typefully bulk response")
+        self.publisher.rate_limiter.record_post.assert_called_once_with(1)
+        self.assertTrue(self.publisher.is_duplicate("First"))
+        self.assertFalse(self.publisher.is_duplicate("Second"))
+        self.assertFalse(self.publisher.is_duplicate("Third"))
+    
+    def test_unreadable_response_confirms_nothing(self):
+        """Test that a success status with an unparseable body creates no drafts."""
+        self.respond((200, b'not json'))
+        
+        results = self.publisher.publish_batch(["First"])
+        
+        self.assertFalse(results[0].success)
+        self.publisher.rate_limiter.record_post.assert_not_called()
+    
+    def test_falls_back_when_bulk_unavailable(self):
+        """Test that a 404 from the bulk endpoint creates drafts one by one."""
+        self.respond((404, b''), (200, b'{"id": 31}'), (200, b'{"id": 32}'))
+        
+        results = self.publisher.publish_batch(["First", "Second"])
+        
+        urls = [call[0][0] for call in self.publisher.session.post.call_args_list]
+        self.assertEqual(urls, ["https://api.typefully.com/v1/drafts/bulk/"]
+                         + ["https://api.typefully.com/v1/drafts/"] * 2)
+        self.assertEqual([result.post_id for result in results], ["31", "32"])
+    
+    def test_error_status_fails_every_draft(self):
+        """Test that an error response is reported for each pending draft."""
+        self.respond((500, b'{"error": "server error"}'))
+        
+        results = self.publisher.publish_batch(["First", "Second"])
+        
+        self.assertEqual([result.error_msg for result in results],
+                         ["Typefully error: server error"] * 2)
+        self.publisher.rate_limiter.record_post.assert_not_called()
+
+
+class FakePublisher(XPublisher):
+    """Publisher that waits for all fakes to start before finishing."""
+    
+    def __init__(self, name, started, expected, fail=None, authenticated=True):
+        super().__init__()
+        self.name = name
+        self.started = started
+        self.expected = expected
+        self.fail = fail
+        self.authenticated = authenticated
+        self.closed = False
+    
+    async def _wait_for_others(self):
+        # Finishes only if every fake is in flight at once, i.e. run concurrently
+        self.started.append(self.name)
+        while len(self.started) < self.expected:
+            await asyncio.sleep(0)
+    
+    def authenticate(self):
+        return self.authenticated
+    
+    async def authenticate_async(self):
+        await asyncio.wait_for(self._wait_for_others(), timeout=1)
+        if isinstance(self.fail, Exception):
+            raise self.fail
+        return self.authenticated
+    
+    def publish(self, content):
+        raise AssertionError("publish_async expected")
+    
+    async def publish_async(self, content):
+        await asyncio.wait_for(self._wait_for_others(), timeout=1)
+        if isinstance(self.fail, Exception):
+            raise self.fail
+        if self.fail:
+            return PublishResult(success=False, error_msg=self.fail)
+        return PublishResult(success=True, url=f"https://example.com/{self.name}", post_id=self.name)
+    
+    async def aclose(self):
+        self.closed = True
+
+
+class TestPublishFanOut(unittest.TestCase):
+    """Test cases for publishing with several publishers at once."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.started = []
+    
+    def make_publishers(self, *fails):
+        return [FakePublisher(str(i), self.started, len(fails), fail)
+                for i, fail in enumerate(fails)]
+    
+    def test_publish_to_all_runs_concurrently(self):
+        """Test that every publisher is in flight at once and closed afterwards."""
+        publishers = self.make_publishers(None, None, None)
+        
+        results = asyncio.run(publish_to_all(publishers, "Daily draft"))
+        
+        self.assertEqual([result.post_id for result in results], ['0', '1', '2'])
+        self.assertTrue(all(publisher.closed for publisher in publishers))
+    
+    def test_publish_to_all_partial_failure(self):
+        """Test that one publisher failing or raising does not stop the others."""
+        publishers = self.make_publishers("Typefully error: 500", RuntimeError("boom"), None)
+        
+        results = asyncio.run(publish_to_all(publishers, "Daily draft"))
+        
+        self.assertEqual([result.success for result in results], [False, False, True])
+        self.assertEqual(results[0].error_msg, "Typefully error: 500")
+        self.assertIn("boom", results[1].error_msg)
+        self.assertTrue(all(publisher.closed for publisher in publishers))
+    
+    def test_sheet_publisher_partial_failure_receipt(self):
+        """Test that the receipt cell records every publisher and failures are reported."""
+        sheets = Mock()
+        sheets.get_row.return_value = ['Daily Post Draft', 'Publication receipt']
+        publishers = self.make_publishers("Typefully error: 500", None)
+        
+        result = SheetPublisher(publishers, sheets).publish_with_receipt("Daily draft", 2)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.post_id, '1')
+        self.assertEqual(result.error_msg, "Fake: Typefully error: 500")
+        sheets.update_cell.assert_called_once_with(
+            2, 1, "Failed: Typefully error: 500 | Published: 1"
+        )
+    
+    def test_create_publishers_async_partial_failure(self):
+        """Test that publishers authenticate concurrently and only working ones are returned."""
+        good = FakePublisher('good', self.started, 3)
+        rejected = FakePublisher('rejected', self.started, 3, authenticated=False)
+        broken = FakePublisher('broken', self.started, 3, fail=RuntimeError("boom"))
+        built = iter([good, rejected, broken])
+        
+        with patch('modules.x_publisher._build_publisher', side_effect=lambda *a, **k: next(built)):
+            publishers = asyncio.run(create_publishers_async(
+                [{'type': 'typefully', 'api_key': 'key'}] * 3
+            ))
+        
+        self.assertEqual(publishers, [good])
+        self.assertEqual(len(self.started), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Compact probabilistic set for membership checks on large link collections."""
+
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings.
+    
+    Membership tests never give false negatives; false positives occur at
+    roughly `error_rate` while no more than `capacity` items are added.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize an empty Bloom filter.
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive probability
+        """
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+    
+    def _positions(self, item: str):
+        """Yield the bit positions for an item (double hashing over one blake2b digest)"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+        
+        Args:
+            item: String to add
+        """
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+    
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add several items to the filter.
+        
+        Args:
+            items: Strings to add
+        """
+        for item in items:
+            self.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def __len__(self) -> int:
+        return self._count
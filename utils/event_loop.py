@@ -0,0 +1,68 @@
+"""Reusable event loop for driving async code from the synchronous scheduler."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable
+
+
+class EventLoopRunner:
+    """
+    Run coroutines from synchronous code on one reusable event loop.
+    
+    In background mode the loop runs forever on its own daemon thread, so tasks
+    started by one call (such as a Discord gateway heartbeat) keep running
+    between calls. Otherwise the loop only runs while a call is in progress.
+    """
+    
+    def __init__(self, background: bool = False):
+        """
+        Create the event loop.
+        
+        Args:
+            background: Keep the loop running on a dedicated thread
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(
+                target=self.loop.run_forever, name='event-loop', daemon=True
+            )
+            self._thread.start()
+    
+    @property
+    def background(self) -> bool:
+        """Whether the loop runs on its own thread between calls."""
+        return self._thread is not None
+    
+    def is_closed(self) -> bool:
+        return self.loop.is_closed()
+    
+    def run(self, coro: Awaitable) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            The coroutine's result
+        """
+        if self._thread is not None:
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        return self.loop.run_until_complete(coro)
+    
+    def close(self) -> None:
+        """Stop the loop thread (if any), cancel leftover tasks and close the loop."""
+        if self.loop.is_closed():
+            return
+        if self._thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self._thread = None
+        
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
@@ -0,0 +1,97 @@
+"""Local SQLite record of post links already uploaded to Google Sheets."""
+
+import sqlite3
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Set
+
+
+class SeenLinkStore:
+    """
+    Persistent set of canonical post links backed by SQLite.
+    
+    Lookups are exact and need no network round trip, so the store can answer
+    duplicate checks that would otherwise re-read the sheet.
+    """
+    
+    # SQLite's default limit on bound parameters per statement is 999
+    _QUERY_CHUNK = 500
+    
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the link store.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # The collector reads links from a worker thread, so share one
+        # connection behind a lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS seen (link TEXT PRIMARY KEY, added_ts INTEGER)'
+            )
+    
+    def add_many(self, links: Iterable[str]) -> None:
+        """
+        Record links, ignoring ones already stored.
+        
+        Args:
+            links: Canonical post links
+        """
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO seen (link, added_ts) VALUES (?, ?)',
+                ((link, now) for link in links)
+            )
+    
+    def contains(self, links: Iterable[str]) -> Set[str]:
+        """
+        Find which of the given links are already stored.
+        
+        Args:
+            links: Canonical post links to look up
+        
+        Returns:
+            Subset of links present in the store
+        """
+        links = iter(links)
+        found = set()
+        with self._lock:
+            while True:
+                chunk = list(islice(links, self._QUERY_CHUNK))
+                if not chunk:
+                    break
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT link FROM seen WHERE link IN ({placeholders})', chunk
+                )
+                found.update(row[0] for row in rows)
+        return found
+    
+    def iter_links(self) -> Iterator[str]:
+        """
+        Iterate over all stored links.
+        
+        Returns:
+            Iterator of canonical post links
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT link FROM seen').fetchall()
+        return (row[0] for row in rows)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()